@@ -24,6 +24,8 @@ done
 # Apply database migrations
 >&2 echo "Apply database migrations"
 python src/manage.py migrate
+# The table of the database cache of the read replicas
+python src/manage.py createcachetable
 
 # Load any JSON fixtures present
 if [ -d $fixtures_dir ]; then
@@ -36,6 +38,11 @@ if [ -d $fixtures_dir ]; then
     done
 fi
 
+# Combine the Prometheus metrics of the uwsgi workers
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 # Start server
 >&2 echo "Starting server"
 uwsgi \
@@ -0,0 +1,100 @@
+import hashlib
+import zlib
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+
+from drc.datamodel.constants import ChecksumAlgoritmes
+
+
+class CRC32:
+    """
+    Expose :func:`zlib.crc32` with the interface of the :mod:`hashlib` objects.
+    """
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data: bytes) -> None:
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self) -> str:
+        return f"{self.value:08x}"
+
+
+# the algorithms of ``ChecksumAlgoritmes`` which can be calculated server-side
+HASHERS = {
+    ChecksumAlgoritmes.crc_32: CRC32,
+    ChecksumAlgoritmes.md5: hashlib.md5,
+    ChecksumAlgoritmes.sha_1: hashlib.sha1,
+    ChecksumAlgoritmes.sha_256: hashlib.sha256,
+    ChecksumAlgoritmes.sha_512: hashlib.sha512,
+    ChecksumAlgoritmes.sha_3: hashlib.sha3_256,
+}
+
+
+class Checksum:
+    """
+    Calculate the ``integriteit`` of a document while its content is processed.
+
+    The supplied ``integriteit`` (if any) determines the algorithm and is
+    verified, otherwise the algorithm of the ``INTEGRITEIT_ALGORITME`` setting
+    is used. Algorithms which can't be calculated server-side are not verified.
+    """
+
+    def __init__(self, integriteit: Optional[dict] = None):
+        # an empty gegevensgroep has all its values blank
+        self.integriteit = (
+            integriteit if integriteit and integriteit.get("algoritme") else None
+        )
+        algoritme = (
+            self.integriteit["algoritme"]
+            if self.integriteit
+            else settings.INTEGRITEIT_ALGORITME
+        )
+        hasher = HASHERS.get(algoritme)
+
+        self.algoritme = algoritme
+        self.hasher = hasher() if hasher else None
+
+    def update(self, data: bytes) -> None:
+        if self.hasher:
+            self.hasher.update(data)
+
+    def get_integriteit(self, verify: bool = True) -> Optional[dict]:
+        """
+        Return the ``integriteit`` of the processed content.
+
+        A supplied ``integriteit`` which doesn't match raises a
+        :class:`ValidationError`, unless ``verify`` is false: the calculated
+        ``integriteit`` is returned instead.
+        """
+        if self.hasher is None:
+            return self.integriteit
+
+        waarde = self.hasher.hexdigest()
+        calculated = {
+            "algoritme": self.algoritme,
+            "waarde": waarde,
+            "datum": timezone.localdate(),
+        }
+        if not self.integriteit:
+            return calculated
+
+        if self.integriteit["waarde"].lower() != waarde:
+            if not verify:
+                return calculated
+            raise serializers.ValidationError(
+                {
+                    "integriteit": _(
+                        "The checksum of the content doesn't match the supplied "
+                        "`waarde` of the `integriteit`."
+                    )
+                },
+                code="integriteit-mismatch",
+            )
+        return self.integriteit
@@ -11,6 +11,9 @@ class ListFilterByAuthorizationsMixin:
     :class:`zrc.datamodel.query.AuthorizationsFilterMixin`
     """
 
+    # actions exposing collections of data, which are filtered
+    filtered_actions = ("list", "export")
+
     def get_queryset(self):
         base = super().get_queryset()
 
@@ -22,18 +25,21 @@ class ListFilterByAuthorizationsMixin:
         # because the resource _does exist_, you just don't have permission
         # to do those operations. A 403 is semantically more correct than a
         # 404, which would be the result if the queryset is always filtered.
-        if not self.action == "list":
+        if self.action not in self.filtered_actions:
             return base
 
+        return self.filter_by_authorizations(base)
+
+    def filter_by_authorizations(self, queryset):
         # get the auth apps that are relevant for this particular request
         apps = self.request.jwt_auth.applicaties
 
         # as soon as there's one matching app that gives you all permissions,
         # you're good - no further detailed data filtering is applied
         if any(app.heeft_alle_autorisaties for app in apps):
-            return base
+            return queryset
 
         scope_needed = self.required_scopes[self.action]
         authorizations = self.request.jwt_auth.autorisaties
 
-        return base.filter_for_authorizations(scope_needed, authorizations)
+        return queryset.filter_for_authorizations(scope_needed, authorizations)
@@ -66,18 +66,22 @@ class AnyBase64File(Base64FileField):
         kwargs = {lookup_field: getattr(model_instance, lookup_field)}
         url = reverse(self.view_name, kwargs=kwargs, request=request)
 
-        # Retrieve the correct version to construct the download url that
-        # points to the content of that version
-        instance = self.parent.instance
-        # in case of pagination instance can be a list object
-        if isinstance(instance, list):
-            instance = instance[0]
-
-        if hasattr(instance, "versie"):
-            versie = instance.versie
-        else:
-            versie = instance.get(uuid=kwargs["uuid"]).versie
-        query_string = urlencode({"versie": versie})
+        # Use the version of the instance owning the file to construct the
+        # download url that points to the content of that version. The parent
+        # instance can't be used, since that's a list or queryset when multiple
+        # objects are serialized.
+        query_string = urlencode({"versie": model_instance.versie})
+        return f"{url}?{query_string}"
+
+
+class VersionedHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """
+    Link to the specific version of the object, instead of its latest version.
+    """
+
+    def get_url(self, obj, view_name, request, format):
+        url = super().get_url(obj, view_name, request, format)
+        query_string = urlencode({"versie": obj.versie})
         return f"{url}?{query_string}"
 
 
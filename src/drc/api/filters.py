@@ -1,3 +1,5 @@
+from django.db.models import OuterRef, Subquery
+
 from django_filters import rest_framework as filters
 from vng_api_common.filters import URLModelChoiceFilter
 from vng_api_common.filtersets import FilterSet
@@ -21,9 +23,25 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
 class EnkelvoudigInformatieObjectDetailFilter(FilterSet):
     versie = filters.NumberFilter(field_name="versie")
     registratie_op = filters.IsoDateTimeFilter(
-        field_name="begin_registratie", lookup_expr="lte", label="begin_registratie"
+        field_name="begin_registratie",
+        lookup_expr="lte",
+        label="begin_registratie",
+        method="filter_registratie_op",
     )
 
+    def filter_registratie_op(self, queryset, name, value):
+        # look up the version valid at the moment per document, using the
+        # (canonical, begin_registratie) index
+        versions = EnkelvoudigInformatieObject.objects.filter(
+            canonical=OuterRef("canonical"), begin_registratie__lte=value
+        )
+        versie = self.form.cleaned_data.get("versie")
+        if versie is not None:
+            versions = versions.filter(versie=versie)
+
+        version = versions.order_by("-begin_registratie").values("pk")[:1]
+        return queryset.filter(pk=Subquery(version))
+
 
 class ObjectInformatieObjectFilter(FilterSet):
     informatieobject = URLModelChoiceFilter(
@@ -1,4 +1,39 @@
+import logging
+import operator
+import uuid
+from functools import reduce
+from itertools import islice
+from typing import Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+
+from drf_spectacular.plumbing import build_array_type, build_basic_type
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting as get_notifications_setting
+from notifications_api_common.viewsets import NotificationMixin
+from rest_framework import exceptions, serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.exception_handling import get_validation_errors
+from zds_client import ClientError
+
+from drc.api.renderers import NDJSONRenderer
+from drc.utils.db import current_replica, get_replica, is_sticky, stick_to_primary
+
+logger = logging.getLogger(__name__)
 
 
 class UpdateWithoutPartialMixin(object):
@@ -21,3 +56,490 @@ class UpdateWithoutPartialMixin(object):
 
     def perform_update(self, serializer):
         serializer.save()
+
+
+def get_client_id(request) -> Optional[str]:
+    jwt_auth = getattr(request, "jwt_auth", None)
+    return jwt_auth.client_id if jwt_auth else None
+
+
+class ReadReplicaMixin:
+    """
+    Read from a replica of the database in the read-only actions.
+
+    After a write, the client reads from the primary database for
+    ``DB_REPLICA_STICKY_SECONDS``, so it reads its own writes even if the
+    replicas lag behind.
+    """
+
+    replica_actions = (
+        "list",
+        "retrieve",
+        "_zoek",
+        "download",
+        "bundel",
+        "versies",
+        "export",
+    )
+
+    def initial(self, request, *args, **kwargs):
+        if (
+            settings.DB_REPLICAS
+            and self.action in self.replica_actions
+            and not is_sticky(get_client_id(request))
+        ):
+            current_replica.set(get_replica())
+
+        super().initial(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        is_write = (
+            request.method not in SAFE_METHODS
+            and self.action not in self.replica_actions
+        )
+        if is_write and response.status_code < 400:
+            stick_to_primary(get_client_id(request))
+
+        # streamed content is read from the replica as well
+        if response.streaming:
+            response._resource_closers.append(lambda: current_replica.set(None))
+        else:
+            current_replica.set(None)
+        return response
+
+
+class ExportMixin:
+    """
+    Stream the complete (filtered) collection as newline delimited JSON.
+
+    The rows are read with a server-side cursor and serialized in chunks of
+    ``export_chunk_size`` objects, so memory use does not depend on the size of
+    the result. Relations listed in ``export_prefetch_related`` are prefetched
+    per chunk, since ``QuerySet.iterator`` ignores ``prefetch_related``.
+
+    The same query parameters as the ``list`` action are supported, and the
+    data is filtered by the authorizations in the same way (see
+    :class:`drc.api.data_filtering.ListFilterByAuthorizationsMixin`).
+    """
+
+    export_chunk_size = None
+    export_prefetch_related = ()
+
+    def get_renderers(self):
+        if self.action == "export":
+            return [NDJSONRenderer()]
+        return super().get_renderers()
+
+    def get_export_chunk_size(self) -> int:
+        return self.export_chunk_size or settings.EXPORT_CHUNK_SIZE
+
+    @extend_schema(
+        summary=_("Exporteer alle objecten als NDJSON."),
+        description=_(
+            "Geeft de volledige (gefilterde) lijst terug als newline delimited "
+            "JSON: één object per regel, zonder paginering. Deze lijst kan "
+            "gefilterd worden met dezelfde query-string parameters als de "
+            "lijst-operatie."
+        ),
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                description=_("Eén object per regel"),
+                response=OpenApiTypes.STR,
+            ),
+        },
+    )
+    @action(methods=["get"], detail=False)
+    def export(self, request, *args, **kwargs):
+        if hasattr(self, "_check_query_params"):
+            self._check_query_params(request)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self._render_export(queryset), content_type=NDJSONRenderer.media_type
+        )
+
+    def _render_export(self, queryset):
+        renderer = NDJSONRenderer()
+        chunk_size = self.get_export_chunk_size()
+        rows = queryset.iterator(chunk_size=chunk_size)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            if self.export_prefetch_related:
+                prefetch_related_objects(chunk, *self.export_prefetch_related)
+
+            serializer = self.get_serializer(chunk, many=True)
+            for data in serializer.data:
+                yield renderer.render(data)
+
+
+def validate_bulk_data(data) -> None:
+    if not isinstance(data, list):
+        raise serializers.ValidationError(
+            {api_settings.NON_FIELD_ERRORS_KEY: _("Expected a list of objects.")},
+            code="not_a_list",
+        )
+    if len(data) > settings.BULK_MAX_OBJECTS:
+        raise serializers.ValidationError(
+            {
+                api_settings.NON_FIELD_ERRORS_KEY: _(
+                    "Ensure this list has no more than {max_length} elements."
+                ).format(max_length=settings.BULK_MAX_OBJECTS)
+            },
+            code="max_length",
+        )
+
+
+def get_bulk_error(errors) -> dict:
+    return {
+        "status": status.HTTP_400_BAD_REQUEST,
+        "invalid_params": list(get_validation_errors(errors)),
+    }
+
+
+def get_bulk_permission_denied() -> dict:
+    return {
+        "status": status.HTTP_403_FORBIDDEN,
+        "code": exceptions.PermissionDenied.default_code,
+        "detail": exceptions.PermissionDenied.default_detail,
+    }
+
+
+class BulkCreateMixin:
+    """
+    Create many objects in one request.
+
+    Every object is validated and authorized separately, as by the ``create``
+    action. The valid objects are created at once by the ``create`` method of
+    the list serializer, and their audit trail and notifications are written in
+    bulk. Remote resources referred to by several objects are validated once,
+    for validators wrapped in :class:`drc.api.validators.CachedValidator`.
+
+    The response contains the result of each object, in the order of the
+    request: the status and either the created object or the errors.
+    """
+
+    # fields which must be unique together, within the request and in the database
+    bulk_unique_together = ()
+    bulk_prefetch_related = ()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == "bulk_create":
+            context["validation_cache"] = getattr(self, "_validation_cache", {})
+        return context
+
+    @extend_schema(
+        summary=_("Maak meerdere objecten in één keer aan."),
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                description=_(
+                    "Het resultaat per object, in de volgorde van de aanvraag: "
+                    "de `status` en het aangemaakte object (`resultaat`) of de "
+                    "validatiefouten (`invalidParams`)"
+                ),
+                response=OpenApiTypes.OBJECT,
+            ),
+        },
+    )
+    @action(methods=["post"], detail=False)
+    def bulk_create(self, request, *args, **kwargs):
+        validate_bulk_data(request.data)
+
+        self._validation_cache = {}
+        results, pending = [], []
+        for data in request.data:
+            serializer = self.get_serializer(data=data)
+            if not serializer.is_valid():
+                results.append(get_bulk_error(serializer.errors))
+            elif not self.has_bulk_permission(serializer.validated_data):
+                results.append(get_bulk_permission_denied())
+            else:
+                key = self._get_unique_key(serializer)
+                pending.append((len(results), serializer, key))
+                results.append(None)
+
+        # the uniqueness is checked for all objects at once, within the
+        # request and in the database
+        existing = self.get_bulk_existing_keys({key for *_, key in pending if key})
+        valid, unique_values = [], set()
+        for index, serializer, key in pending:
+            if key and (key in existing or key in unique_values):
+                results[index] = get_bulk_error(
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: [
+                            ErrorDetail(
+                                _(
+                                    "The fields {field_names} must make a unique set."
+                                ).format(
+                                    field_names=", ".join(self.bulk_unique_together)
+                                ),
+                                code="unique",
+                            )
+                        ]
+                    }
+                )
+                continue
+
+            if key:
+                unique_values.add(key)
+            valid.append(serializer)
+
+        created = iter(self.perform_bulk_create(valid) if valid else [])
+        results = [
+            result or {"status": status.HTTP_201_CREATED, "resultaat": next(created)}
+            for result in results
+        ]
+        return Response(results)
+
+    def _get_unique_key(self, serializer):
+        key = tuple(
+            getattr(value, "pk", value)
+            for value in (
+                serializer.validated_data.get(field)
+                for field in self.bulk_unique_together
+            )
+        )
+        return key if key and all(key) else None
+
+    def get_bulk_existing_keys(self, keys: set) -> set:
+        """
+        Select which of the ``bulk_unique_together`` values exist, with one query.
+        """
+        if not keys:
+            return set()
+
+        fields = self.bulk_unique_together
+        condition = reduce(
+            operator.or_, (models.Q(**dict(zip(fields, key))) for key in keys)
+        )
+        model = self.get_queryset().model
+        return set(model._default_manager.filter(condition).values_list(*fields))
+
+    def has_bulk_permission(self, validated_data: dict) -> bool:
+        """
+        Check the authorizations for the object, as for the ``create`` action.
+        """
+        obj = self.get_bulk_permission_object(validated_data)
+        scopes_required = self.required_scopes[self.action]
+        for permission in self.get_permissions():
+            fields = {
+                field: obj.get(field) if isinstance(obj, dict) else getattr(obj, field)
+                for field in getattr(permission, "permission_fields", ())
+            }
+            if not self.request.jwt_auth.has_auth(scopes_required, **fields):
+                return False
+        return True
+
+    def get_bulk_permission_object(self, validated_data: dict):
+        return validated_data
+
+    @transaction.atomic
+    def perform_bulk_create(self, valid: list) -> list:
+        list_serializer = self.get_serializer(many=True)
+        instances = list_serializer.create(
+            [serializer.validated_data for serializer in valid]
+        )
+        if self.bulk_prefetch_related:
+            prefetch_related_objects(instances, *self.bulk_prefetch_related)
+
+        data = self.get_serializer(instances, many=True).data
+        if getattr(self, "audit", None):
+            self.create_bulk_audittrails(instances, data)
+        if isinstance(self, NotificationMixin):
+            self.notify_bulk(instances, data)
+        return data
+
+    def create_bulk_audittrails(self, instances: list, data: list) -> None:
+        """
+        Write the audit trail of the created objects, with one query.
+        """
+        jwt_auth = self.request.jwt_auth
+        if jwt_auth.applicaties:
+            application = jwt_auth.applicaties[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        request_fields = {
+            "bron": self.audit.component_name,
+            "logrecord_id": get_header(self.request, "X-NLX-Logrecord-ID") or "",
+            "applicatie_id": app_id,
+            "applicatie_weergave": app_presentation,
+            "actie": CommonResourceAction.create,
+            "actie_weergave": CommonResourceAction.labels[CommonResourceAction.create],
+            "gebruikers_id": jwt_auth.payload.get("user_id") or "",
+            "gebruikers_weergave": jwt_auth.payload.get("user_representation") or "",
+            "resultaat": status.HTTP_201_CREATED,
+            "resource": self.basename,
+            "toelichting": get_header(self.request, "X-Audit-Toelichting") or "",
+        }
+
+        trails = []
+        for instance, item in zip(instances, data):
+            if self.basename == self.audit.main_resource:
+                main_object = item["url"]
+            else:
+                main_object = self.get_audittrail_main_object_url(
+                    item, self.audit.main_resource
+                )
+            trails.append(
+                AuditTrail(
+                    **request_fields,
+                    hoofd_object=main_object,
+                    resource_url=item["url"],
+                    resource_weergave=instance.unique_representation(),
+                    nieuw=item,
+                )
+            )
+        AuditTrail.objects.bulk_create(trails)
+
+    def notify_bulk(self, instances: list, data: list) -> None:
+        """
+        Send the notifications of the created objects after the commit.
+        """
+        if get_notifications_setting("NOTIFICATIONS_DISABLED"):
+            return
+
+        messages = [
+            {
+                **self.construct_message(item, instance=instance),
+                "actie": CommonResourceAction.create,
+            }
+            for instance, item in zip(instances, data)
+        ]
+        client = NotificationsConfig.get_client()
+        if client is None:
+            raise RuntimeError("Could not build a client for Notifications API")
+
+        def _send():
+            for message in messages:
+                try:
+                    client.create("notificaties", message)
+                except ClientError:
+                    logger.warning(
+                        "Could not deliver message to %s",
+                        client.base_url,
+                        exc_info=True,
+                        extra={"notification_msg": message},
+                    )
+
+        self.schedule_notification(_send)
+
+
+class BulkDestroyMixin:
+    """
+    Delete many objects in one request.
+
+    The objects are referred to by their URL (or UUID). Each object is
+    authorized as by the ``destroy`` action, and may be refused by
+    :meth:`get_bulk_destroy_errors`, which checks all objects at once. The
+    other objects are deleted with one query.
+
+    The response contains the result of each object, in the order of the
+    request: the status and the errors, if any.
+    """
+
+    @extend_schema(
+        summary=_("Verwijder meerdere objecten in één keer."),
+        request={
+            "application/json": build_array_type(build_basic_type(OpenApiTypes.URI))
+        },
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                description=_(
+                    "Het resultaat per object, in de volgorde van de aanvraag: "
+                    "de `status` en eventueel de fouten (`invalidParams`)"
+                ),
+                response=OpenApiTypes.OBJECT,
+            ),
+        },
+    )
+    @action(methods=["post"], detail=False)
+    def bulk_destroy(self, request, *args, **kwargs):
+        validate_bulk_data(request.data)
+
+        lookups = [self._get_bulk_lookup(reference) for reference in request.data]
+        instances = {
+            str(getattr(instance, self.lookup_field)): instance
+            for instance in self.get_queryset().filter(
+                **{f"{self.lookup_field}__in": [lookup for lookup in lookups if lookup]}
+            )
+        }
+
+        results, pending = [], []
+        for lookup in lookups:
+            if lookup is None:
+                results.append(
+                    get_bulk_error(
+                        {
+                            api_settings.NON_FIELD_ERRORS_KEY: [
+                                ErrorDetail(_("Invalid URL."), code="invalid")
+                            ]
+                        }
+                    )
+                )
+            elif (instance := instances.get(lookup)) is None:
+                results.append(
+                    {
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "code": exceptions.NotFound.default_code,
+                        "detail": exceptions.NotFound.default_detail,
+                    }
+                )
+            elif not self.has_bulk_object_permission(instance):
+                results.append(get_bulk_permission_denied())
+            else:
+                pending.append((len(results), instance))
+                results.append({"status": status.HTTP_204_NO_CONTENT})
+
+        errors = self.get_bulk_destroy_errors(
+            [instance for _index, instance in pending]
+        )
+        deleted = []
+        for index, instance in pending:
+            if instance.pk in errors:
+                results[index] = get_bulk_error(
+                    {api_settings.NON_FIELD_ERRORS_KEY: [errors[instance.pk]]}
+                )
+            else:
+                deleted.append(instance)
+
+        if deleted:
+            self.perform_bulk_destroy(deleted)
+        return Response(results)
+
+    def _get_bulk_lookup(self, reference):
+        if not isinstance(reference, str):
+            return None
+
+        value = urlparse(reference).path.rstrip("/").rsplit("/", 1)[-1]
+        try:
+            return str(uuid.UUID(value))
+        except ValueError:
+            return None
+
+    def has_bulk_object_permission(self, instance) -> bool:
+        try:
+            self.check_object_permissions(self.request, instance)
+        except exceptions.PermissionDenied:
+            return False
+        return True
+
+    def get_bulk_destroy_errors(self, instances: list) -> dict:
+        """
+        Return the error (``ErrorDetail``) per pk of the objects which can't be deleted.
+        """
+        return {}
+
+    @transaction.atomic
+    def perform_bulk_destroy(self, instances: list) -> None:
+        self.get_queryset().model._default_manager.filter(
+            pk__in=[instance.pk for instance in instances]
+        ).delete()
@@ -1,3 +1,4 @@
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
 from rest_framework.renderers import BaseRenderer
 
 
@@ -15,3 +16,19 @@ class BinaryFileRenderer(BaseRenderer):
         if isinstance(data, str):
             return data.encode("utf-8")
         return data
+
+
+class NDJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Render a single object as one line of newline delimited JSON.
+
+    Used by the ``export`` actions, which render each object separately while
+    streaming the response.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rendered = super().render(data, accepted_media_type, renderer_context)
+        return rendered + b"\n"
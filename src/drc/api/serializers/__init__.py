@@ -1,7 +1,8 @@
-from .bestandsdeel import BestandsDeelSerializer
+from .bestandsdeel import BestandsDeelSerializer, BestandsDeelStreamSerializer
 from .enkelvoudig_informatieobject import (
     EnkelvoudigInformatieObjectCreateLockSerializer,
     EnkelvoudigInformatieObjectSerializer,
+    EnkelvoudigInformatieObjectVersieSerializer,
     EnkelvoudigInformatieObjectWithLockSerializer,
     LockEnkelvoudigInformatieObjectSerializer,
     UnlockEnkelvoudigInformatieObjectSerializer,
@@ -1,8 +1,13 @@
+import os
+
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
 from drc.datamodel.models import BestandsDeel
+from drc.utils.storages import is_local_storage
+from drc.utils.uploadhandlers import PrivateMediaUploadedFile
 
 
 class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
@@ -35,13 +40,7 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
         lock = valid_attrs.get("lock")
         if inhoud:
             if inhoud.size != self.instance.omvang:
-                raise serializers.ValidationError(
-                    _(
-                        "Het aangeleverde bestand heeft een afwijkende bestandsgrootte (volgens het `grootte`-veld)."
-                        "Verwachting: {expected}b, ontvangen: {received}b"
-                    ).format(expected=self.instance.omvang, received=inhoud.size),
-                    code="file-size",
-                )
+                raise self.get_file_size_error(inhoud.size)
 
         if lock != self.instance.informatieobject.lock:
             raise serializers.ValidationError(
@@ -49,3 +48,95 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
             )
 
         return valid_attrs
+
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        instance.informatieobject.touch_upload()
+        return instance
+
+    def get_file_size_error(self, received: int) -> serializers.ValidationError:
+        return serializers.ValidationError(
+            _(
+                "Het aangeleverde bestand heeft een afwijkende bestandsgrootte (volgens het `grootte`-veld)."
+                "Verwachting: {expected}b, ontvangen: {received}b"
+            ).format(expected=self.instance.omvang, received=received),
+            code="file-size",
+        )
+
+
+class BestandsDeelStreamSerializer(BestandsDeelSerializer):
+    """
+    Upload a bestandsdeel as the raw (``application/octet-stream``) request body.
+
+    The body is written directly to the file of the bestandsdeel while it's
+    read, and the upload is aborted as soon as it exceeds the ``omvang``.
+    """
+
+    class Meta(BestandsDeelSerializer.Meta):
+        fields = ("url", "volgnummer", "omvang", "voltooid", "lock")
+
+    def validate(self, attrs):
+        valid_attrs = super().validate(attrs)
+
+        # reject a body of the wrong size before reading it
+        content_length = self.context["request"].META.get("CONTENT_LENGTH")
+        if content_length:
+            try:
+                size = int(content_length)
+            except ValueError:
+                raise serializers.ValidationError(
+                    _("The Content-Length header must be a number."),
+                    code="invalid-content-length",
+                )
+            if size != self.instance.omvang:
+                raise self.get_file_size_error(size)
+
+        return valid_attrs
+
+    def _write_stream(self, stream, output) -> int:
+        size = 0
+        while stream is not None and (chunk := stream.read(settings.READ_CHUNK)):
+            size += len(chunk)
+            if size > self.instance.omvang:
+                break
+            output.write(chunk)
+
+        if size != self.instance.omvang:
+            raise self.get_file_size_error(size)
+        return size
+
+    def update(self, instance, validated_data):
+        stream = validated_data["stream"]
+        storage = instance.inhoud.storage
+
+        # a remote storage receives the content once it's complete
+        if not is_local_storage(storage):
+            with PrivateMediaUploadedFile(
+                str(instance.uuid), "application/octet-stream", 0, None
+            ) as part_file:
+                part_file.size = self._write_stream(stream, part_file)
+                part_file.seek(0)
+                instance.inhoud.save(str(instance.uuid), part_file)
+            instance.informatieobject.touch_upload()
+            return instance
+
+        name = instance.inhoud.field.generate_filename(instance, str(instance.uuid))
+        name = storage.get_available_name(name)
+
+        file_path = storage.path(name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        try:
+            with open(file_path, "xb") as output:
+                self._write_stream(stream, output)
+        except BaseException:
+            os.remove(file_path)
+            raise
+
+        if storage.file_permissions_mode is not None:
+            os.chmod(file_path, storage.file_permissions_mode)
+
+        instance.inhoud.name = name
+        instance.save()
+        instance.informatieobject.touch_upload()
+        return instance
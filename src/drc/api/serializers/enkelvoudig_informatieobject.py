@@ -1,10 +1,13 @@
+import copy
 import math
-import os
 import uuid
+from contextlib import ExitStack, contextmanager
+from urllib.parse import parse_qs, urlparse
 
 from django.conf import settings
-from django.core.files.base import ContentFile, File
-from django.db import transaction
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
@@ -18,16 +21,19 @@ from vng_api_common.serializers import (
 from vng_api_common.validators import IsImmutableValidator, PublishValidator
 
 from drc.api.auth import get_ztc_auth
-from drc.api.fields import AnyBase64File
+from drc.api.checksums import Checksum
+from drc.api.fields import AnyBase64File, VersionedHyperlinkedIdentityField
 from drc.api.serializers.bestandsdeel import BestandsDeelSerializer
 from drc.api.utils import create_filename, merge_files
-from drc.api.validators import StatusValidator
+from drc.api.validators import CachedValidator, StatusValidator
 from drc.datamodel.constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
 from drc.datamodel.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
 )
 from drc.datamodel.models.bestandsdeel import BestandsDeel
+from drc.utils.compression import compress_file, should_compress
+from drc.utils.uploadhandlers import PrivateMediaUploadedFile
 
 
 class IntegriteitSerializer(GegevensGroepSerializer):
@@ -132,10 +138,12 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             "informatieobjecttype": {
                 "validators": [
                     IsImmutableValidator(),
-                    PublishValidator(
-                        "InformatieObjectType",
-                        settings.ZTC_API_SPEC,
-                        get_auth=get_ztc_auth,
+                    CachedValidator(
+                        PublishValidator(
+                            "InformatieObjectType",
+                            settings.ZTC_API_SPEC,
+                            get_auth=get_ztc_auth,
+                        )
                     ),
                 ]
             },
@@ -211,6 +219,9 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
                 )
         else:  # update
             inhoud = valid_attrs.get("inhoud", self.instance.inhoud)
+            # the size of compressed content isn't the size of the content
+            if "inhoud" not in valid_attrs and self.instance.inhoud_encoding:
+                inhoud = None
             bestandsomvang = valid_attrs.get(
                 "bestandsomvang", self.instance.bestandsomvang
             )
@@ -220,17 +231,58 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
                     code="file-size",
                 )
 
+        # calculate (or verify) the checksum of uploaded content, the checksum of
+        # content uploaded in bestandsdelen is calculated when they're merged
+        inhoud = valid_attrs.get("inhoud")
+        if inhoud:
+            checksum = Checksum(valid_attrs.get("integriteit"))
+            for chunk in inhoud.chunks():
+                checksum.update(chunk)
+            valid_attrs["integriteit"] = checksum.get_integriteit()
+
         return valid_attrs
 
-    def _create_bestandsdeel(self, full_size, canonical):
-        """add chunk urls"""
+    @staticmethod
+    def _build_bestandsdelen(full_size, canonical) -> list:
+        bestandsdelen = []
         parts = math.ceil(full_size / settings.CHUNK_SIZE)
         for i in range(parts):
             chunk_size = min(settings.CHUNK_SIZE, full_size)
-            BestandsDeel.objects.create(
-                informatieobject=canonical, omvang=chunk_size, volgnummer=i + 1
+            bestandsdelen.append(
+                BestandsDeel(
+                    informatieobject=canonical, omvang=chunk_size, volgnummer=i + 1
+                )
             )
             full_size -= chunk_size
+        return bestandsdelen
+
+    def _create_bestandsdeel(self, full_size, canonical):
+        """add chunk urls"""
+        BestandsDeel.objects.bulk_create(
+            self._build_bestandsdelen(full_size, canonical)
+        )
+        canonical.touch_upload()
+
+    @contextmanager
+    def _compressed_inhoud(self, validated_data, instance=None):
+        """
+        Replace the uploaded content with its compressed version, if worthwhile.
+        """
+        inhoud = validated_data.get("inhoud")
+        formaat = validated_data.get("formaat", getattr(instance, "formaat", ""))
+        bestandsnaam = validated_data.get(
+            "bestandsnaam", getattr(instance, "bestandsnaam", "")
+        )
+        if not inhoud or not should_compress(inhoud, formaat, bestandsnaam):
+            if inhoud:
+                validated_data["inhoud_encoding"] = ""
+            yield
+            return
+
+        with compress_file(inhoud, inhoud.name) as compressed_file:
+            validated_data["inhoud"] = compressed_file
+            validated_data["inhoud_encoding"] = settings.INHOUD_COMPRESSION
+            yield
 
     @transaction.atomic
     def create(self, validated_data):
@@ -251,7 +303,8 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         canonical = EnkelvoudigInformatieObjectCanonical.objects.create()
         validated_data["canonical"] = canonical
 
-        eio = super().create(validated_data)
+        with self._compressed_inhoud(validated_data):
+            eio = super().create(validated_data)
         eio.integriteit = integriteit
         eio.ondertekening = ondertekening
         eio.save()
@@ -266,17 +319,55 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
 
         return eio
 
+    def _is_modified(self, instance, validated_data) -> bool:
+        modified = copy.copy(instance)
+        for attr, value in validated_data.items():
+            setattr(modified, attr, value)
+
+        for field in instance._meta.concrete_fields:
+            if field.attname in ("_etag", "begin_registratie"):
+                continue
+
+            old = field.value_from_object(instance)
+            new = field.value_from_object(modified)
+            if isinstance(field, models.FileField):
+                # any uploaded file is considered to be a modification
+                if not new._committed or (old.name or "") != (new.name or ""):
+                    return True
+            elif old != new:
+                return True
+
+        return False
+
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Instead of updating an existing EnkelvoudigInformatieObject,
         create a new EnkelvoudigInformatieObject with the same
         EnkelvoudigInformatieObjectCanonical
         """
+        canonical = instance.canonical
+        if canonical.copy_on_write:
+            if not self._is_modified(instance, validated_data):
+                return instance
+
+            # the first modification during the lock creates the new version
+            instance.pk = None
+            instance.versie = instance.versie + 1
+            canonical.copy_on_write = False
+            canonical.save()
+
+        # the integriteit belongs to the content, keep it if neither is modified
+        replace_integriteit = (
+            "integriteit" in validated_data or "inhoud" in validated_data
+        )
         integriteit = validated_data.pop("integriteit", None)
         ondertekening = validated_data.pop("ondertekening", None)
 
-        eio = super().update(instance, validated_data)
-        eio.integriteit = integriteit
+        with self._compressed_inhoud(validated_data, instance):
+            eio = super().update(instance, validated_data)
+        if replace_integriteit:
+            eio.integriteit = integriteit
         eio.ondertekening = ondertekening
         eio.save()
 
@@ -289,6 +380,9 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         # large file process
         if not eio.inhoud and eio.bestandsomvang and eio.bestandsomvang > 0:
             self._create_bestandsdeel(eio.bestandsomvang, eio.canonical)
+        elif eio.canonical.upload_activity:
+            eio.canonical.upload_activity = None
+            eio.canonical.save()
 
         # create empty file if size == 0
         if eio.bestandsomvang == 0 and not eio.inhoud:
@@ -349,6 +443,66 @@ class EnkelvoudigInformatieObjectWithLockSerializer(
         return valid_attrs
 
 
+class EnkelvoudigInformatieObjectListSerializer(serializers.ListSerializer):
+    """
+    Create many (ENKELVOUDIGe) INFORMATIEOBJECTen at once.
+
+    The canonicals, versions and bestandsdelen are inserted with one query
+    each, and each informatieobjecttype is retrieved once. Otherwise the
+    documents are created as by ``EnkelvoudigInformatieObjectCreateLockSerializer``.
+    """
+
+    @transaction.atomic
+    def create(self, validated_data):
+        informatieobjecttypen = {}
+        canonicals, eios = [], []
+
+        with ExitStack() as stack:
+            for attrs in validated_data:
+                if "vertrouwelijkheidaanduiding" not in attrs:
+                    url = attrs["informatieobjecttype"]
+                    if url not in informatieobjecttypen:
+                        informatieobjecttypen[
+                            url
+                        ] = self.child._get_informatieobjecttype(url)
+                    attrs["vertrouwelijkheidaanduiding"] = informatieobjecttypen[url][
+                        "vertrouwelijkheidaanduiding"
+                    ]
+
+                # large files are uploaded in bestandsdelen, while locked
+                canonical = EnkelvoudigInformatieObjectCanonical()
+                if not attrs.get("inhoud") and attrs.get("bestandsomvang"):
+                    canonical.lock = uuid.uuid4().hex
+                    canonical.upload_activity = timezone.now()
+                canonicals.append(canonical)
+
+                stack.enter_context(self.child._compressed_inhoud(attrs))
+                integriteit = attrs.pop("integriteit", None)
+                ondertekening = attrs.pop("ondertekening", None)
+                eio = EnkelvoudigInformatieObject(**attrs)
+                eio.integriteit = integriteit
+                eio.ondertekening = ondertekening
+                eios.append(eio)
+
+            EnkelvoudigInformatieObjectCanonical.objects.bulk_create(canonicals)
+            for canonical, eio in zip(canonicals, eios):
+                eio.canonical = canonical
+            # the content is saved to the storage while inserting
+            EnkelvoudigInformatieObject.objects.bulk_create(eios)
+
+        bestandsdelen = []
+        for eio in eios:
+            if eio.canonical.lock:
+                bestandsdelen += self.child._build_bestandsdelen(
+                    eio.bestandsomvang, eio.canonical
+                )
+            elif eio.bestandsomvang == 0:
+                eio.inhoud.save("empty_file", ContentFile(""))
+        BestandsDeel.objects.bulk_create(bestandsdelen)
+
+        return eios
+
+
 class EnkelvoudigInformatieObjectCreateLockSerializer(
     EnkelvoudigInformatieObjectSerializer
 ):
@@ -372,6 +526,7 @@ class EnkelvoudigInformatieObjectCreateLockSerializer(
         fields = EnkelvoudigInformatieObjectSerializer.Meta.fields + ("lock",)
         extra_kwargs = EnkelvoudigInformatieObjectSerializer.Meta.extra_kwargs.copy()
         extra_kwargs.update({"lock": {"source": "canonical.lock", "read_only": True}})
+        list_serializer_class = EnkelvoudigInformatieObjectListSerializer
 
     def create(self, validated_data):
         eio = super().create(validated_data)
@@ -405,6 +560,13 @@ class LockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
     @transaction.atomic
     def save(self, **kwargs):
         self.instance.lock = uuid.uuid4().hex
+
+        if settings.EIO_COPY_ON_WRITE:
+            # postpone the new version until the document is actually modified
+            self.instance.copy_on_write = True
+            self.instance.save()
+            return self.instance
+
         self.instance.save()
 
         # create new version of document
@@ -459,28 +621,60 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
 
     @transaction.atomic
     def save(self, **kwargs):
+        # merge the files before unlocking, so content which is rejected leaves
+        # the document locked with its bestandsdelen
+        if not self.instance.canonical.empty_bestandsdelen:
+            if self.instance.canonical.copy_on_write:
+                # the merged content is the first modification during the lock
+                self.instance.pk = None
+                self.instance.versie = self.instance.versie + 1
+            self._merge_bestandsdelen()
+
         # unlock
         self.instance.canonical.lock = ""
+        self.instance.canonical.copy_on_write = False
+        self.instance.canonical.upload_activity = None
         self.instance.canonical.save()
 
-        # merge files and clean bestandsdelen
-        if self.instance.canonical.empty_bestandsdelen:
-            return self.instance
+        return self.instance
+
+    def _merge_bestandsdelen(self) -> None:
+        """
+        Merge the bestandsdelen into the content and delete them.
 
+        A supplied ``integriteit`` which doesn't match the content is rejected,
+        unless the unlock is forced: the calculated ``integriteit`` is stored
+        instead, so an administrator can always unlock the document.
+        """
+        verify = not self.context.get("force_unlock", False)
         bestandsdelen = self.instance.canonical.bestandsdelen.order_by("volgnummer")
         if self.instance.canonical.complete_upload:
-            part_files = [p.inhoud.file for p in bestandsdelen]
-            # create the name of target file using the storage backend to the serializer
+            part_files = [p.inhoud for p in bestandsdelen]
             name = create_filename(self.instance.bestandsnaam)
-            file_field = self.instance._meta.get_field("inhoud")
-            rel_name = file_field.generate_filename(self.instance, name)
-            rel_path, file_name = os.path.split(rel_name)
-            # merge files
-            file_dir = os.path.join(settings.PRIVATE_MEDIA_ROOT, rel_path)
-            target_file = merge_files(part_files, file_dir, file_name)
-            # save full file to the instance FileField
-            with open(target_file, "rb") as file_obj:
-                self.instance.inhoud.save(file_name, File(file_obj))
+            checksum = Checksum(self.instance.integriteit)
+            try:
+                self._compose_files(part_files, name, checksum, verify)
+            except NotImplementedError:
+                # merge the files into a temporary file, which the storage moves
+                # into place
+                with PrivateMediaUploadedFile(
+                    name, self.instance.formaat, 0, None
+                ) as merged_file:
+                    merged_file.size = merge_files(part_files, merged_file, checksum)
+                    merged_file.seek(0)
+
+                    self.instance.integriteit = checksum.get_integriteit(verify)
+                    if should_compress(
+                        merged_file, self.instance.formaat, self.instance.bestandsnaam
+                    ):
+                        self.instance.inhoud_encoding = settings.INHOUD_COMPRESSION
+                        with compress_file(merged_file, name) as compressed_file:
+                            self.instance.inhoud.save(
+                                compressed_file.name, compressed_file
+                            )
+                    else:
+                        self.instance.inhoud_encoding = ""
+                        self.instance.inhoud.save(name, merged_file)
         else:
             self.instance.bestandsomvang = None
             self.instance.save()
@@ -490,11 +684,200 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
             part.inhoud.delete()
             part.delete()
 
-        return self.instance
+    def _compose_files(
+        self, part_files, name: str, checksum: Checksum, verify: bool
+    ) -> None:
+        """
+        Let the storage merge the part files, if it's able to.
+
+        The merged content is only read (once) to verify a supplied
+        ``integriteit``, since reading transfers the whole file from the
+        storage. Without a supplied ``integriteit``, none is calculated.
+
+        Raises :class:`NotImplementedError` if the storage can't merge the part
+        files itself.
+        """
+        storage = self.instance.inhoud.storage
+        # the part files must be stored in the same (kind of) storage
+        if not hasattr(storage, "compose") or any(
+            type(part_file.storage) is not type(storage) for part_file in part_files
+        ):
+            raise NotImplementedError
+
+        file_name = self.instance.inhoud.field.generate_filename(self.instance, name)
+        composed_name = storage.compose(
+            [part_file.name for part_file in part_files], file_name
+        )
+
+        if checksum.integriteit and checksum.hasher is not None:
+            with storage.open(composed_name, "rb") as fileobj:
+                while chunk := fileobj.read(settings.READ_CHUNK):
+                    checksum.update(chunk)
+            try:
+                self.instance.integriteit = checksum.get_integriteit(verify)
+            except serializers.ValidationError:
+                storage.delete(composed_name)
+                raise
+
+        self.instance.inhoud.name = composed_name
+        self.instance.inhoud_encoding = ""
+        self.instance.save()
+
+
+class EnkelvoudigInformatieObjectVersieSerializer(
+    serializers.HyperlinkedModelSerializer
+):
+    """
+    Compact representation of a version of the EnkelvoudigInformatieObject
+    """
+
+    url = VersionedHyperlinkedIdentityField(
+        view_name="enkelvoudiginformatieobject-detail",
+        lookup_field="uuid",
+        help_text=_("URL-referentie naar deze versie van het INFORMATIEOBJECT."),
+    )
+
+    class Meta:
+        model = EnkelvoudigInformatieObject
+        fields = (
+            "url",
+            "versie",
+            "begin_registratie",
+            "titel",
+            "status",
+            "bestandsnaam",
+            "bestandsomvang",
+        )
+
+
+class EIOZoekObjectSerializer(serializers.Serializer):
+    uuid = serializers.UUIDField(help_text=_("Unieke resource identifier (UUID4)"))
+    versie = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        help_text=_("Het (automatische) versienummer van het INFORMATIEOBJECT."),
+    )
+    registratie_op = serializers.DateTimeField(
+        required=False,
+        help_text=_(
+            "Een datumtijd in ISO8601 formaat. De versie van het INFORMATIEOBJECT "
+            "die qua `begin_registratie` het kortst hiervoor zit wordt opgehaald."
+        ),
+    )
 
 
 class EIOZoekSerializer(serializers.Serializer):
     uuid__in = serializers.ListField(
         child=serializers.UUIDField(),
-        help_text=_("Array of unieke resource identifiers (UUID4)"),
+        required=False,
+        help_text=_(
+            "Array of unieke resource identifiers (UUID4). Van elk INFORMATIEOBJECT "
+            "wordt de laatste versie getoond. Het maximum aantal UUIDs is "
+            "configureerbaar en is standaard 1000."
+        ),
+    )
+    objecten = EIOZoekObjectSerializer(
+        many=True,
+        required=False,
+        help_text=_(
+            "Array van INFORMATIEOBJECTen, met optioneel per INFORMATIEOBJECT de "
+            "`versie` en/of `registratieOp` van de gewenste versie. Alternatief "
+            "voor `uuid__in`, met hetzelfde maximum."
+        ),
+    )
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        if "uuid__in" in attrs and "objecten" in attrs:
+            raise serializers.ValidationError(
+                _("Only one of `uuid__in` and `objecten` may be provided."),
+                code="mutually-exclusive",
+            )
+
+        field = "objecten" if "objecten" in attrs else "uuid__in"
+        if field not in attrs:
+            raise serializers.ValidationError(
+                {field: _("This field is required.")}, code="required"
+            )
+
+        if len(attrs[field]) > settings.ZOEK_MAX_UUIDS:
+            raise serializers.ValidationError(
+                {
+                    field: _(
+                        "Ensure this field has no more than {max_length} elements."
+                    ).format(max_length=settings.ZOEK_MAX_UUIDS)
+                },
+                code="max_length",
+            )
+
+        return attrs
+
+    def get_references(self) -> list:
+        """
+        Return the searched informatieobjecten, in the order of the request.
+        """
+        if "objecten" in self.validated_data:
+            return self.validated_data["objecten"]
+        return [{"uuid": uuid} for uuid in self.validated_data["uuid__in"]]
+
+
+class EIOBundelSerializer(serializers.Serializer):
+    informatieobjecten = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_(
+            "Array van URL-referenties naar en/of unieke resource identifiers "
+            "(UUID4) van de INFORMATIEOBJECTen. Van een URL met de `versie` als "
+            "query-string parameter wordt die versie opgenomen, anders de laatste "
+            "versie. Het maximum aantal is configureerbaar en is standaard 1000."
+        ),
+    )
+    object = serializers.URLField(
+        required=False,
+        max_length=1000,
+        help_text=_(
+            "URL-referentie naar het OBJECT, waarvan alle gerelateerde "
+            "INFORMATIEOBJECTen (via OBJECTINFORMATIEOBJECTen) worden opgenomen."
+        ),
     )
+
+    def validate_informatieobjecten(self, value):
+        if len(value) > settings.ZOEK_MAX_UUIDS:
+            raise serializers.ValidationError(
+                _("Ensure this field has no more than {max_length} elements.").format(
+                    max_length=settings.ZOEK_MAX_UUIDS
+                ),
+                code="max_length",
+            )
+        return [self._get_reference(item) for item in value]
+
+    def _get_reference(self, value: str) -> dict:
+        url = urlparse(value)
+        try:
+            reference = {"uuid": uuid.UUID(url.path.rstrip("/").rsplit("/", 1)[-1])}
+            if versie := parse_qs(url.query).get("versie"):
+                reference["versie"] = int(versie[0])
+        except ValueError:
+            raise serializers.ValidationError(
+                _("{value} is not a valid URL or UUID of an informatieobject.").format(
+                    value=value
+                ),
+                code="invalid",
+            )
+        return reference
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        if "informatieobjecten" in attrs and "object" in attrs:
+            raise serializers.ValidationError(
+                _("Only one of `informatieobjecten` and `object` may be provided."),
+                code="mutually-exclusive",
+            )
+        if "informatieobjecten" not in attrs and "object" not in attrs:
+            raise serializers.ValidationError(
+                {"informatieobjecten": _("This field is required.")}, code="required"
+            )
+
+        return attrs
@@ -7,6 +7,7 @@ from vng_api_common.validators import IsImmutableValidator, URLValidator
 from drc.api.auth import get_zrc_auth
 from drc.api.fields import EnkelvoudigInformatieObjectHyperlinkedRelatedField
 from drc.api.validators import (
+    CachedValidator,
     InformatieObjectUniqueValidator,
     ObjectInformatieObjectValidator,
 )
@@ -16,6 +17,17 @@ from drc.datamodel.models.enkelvoudig_informatieobject import (
 from drc.datamodel.models.object_informatieobject import ObjectInformatieObject
 
 
+class ObjectInformatieObjectListSerializer(serializers.ListSerializer):
+    """
+    Create many OBJECT-INFORMATIEOBJECT relaties with one query.
+    """
+
+    def create(self, validated_data):
+        return ObjectInformatieObject.objects.bulk_create(
+            [ObjectInformatieObject(**attrs) for attrs in validated_data]
+        )
+
+
 class ObjectInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
@@ -32,14 +44,17 @@ class ObjectInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
             "informatieobject": {"validators": [IsImmutableValidator()]},
             "object": {
                 "validators": [
-                    URLValidator(
-                        get_auth=get_zrc_auth, headers={"Accept-Crs": "EPSG:4326"}
+                    CachedValidator(
+                        URLValidator(
+                            get_auth=get_zrc_auth, headers={"Accept-Crs": "EPSG:4326"}
+                        )
                     ),
                     IsImmutableValidator(),
                 ]
             },
             "object_type": {"validators": [IsImmutableValidator()]},
         }
+        list_serializer_class = ObjectInformatieObjectListSerializer
         validators = [
             ObjectInformatieObjectValidator(),
             InformatieObjectUniqueValidator("object", "informatieobject"),
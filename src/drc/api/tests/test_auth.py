@@ -1,8 +1,13 @@
 """
 Guarantee that the proper authorization amchinery is in place.
 """
+import io
+import json
+import zipfile
+
 from django.test import override_settings
 
+from privates.test import temp_private_root
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
@@ -84,6 +89,111 @@ class InformatieObjectReadCorrectScopeTests(JWTAuthMixin, APITestCase):
             VertrouwelijkheidsAanduiding.openbaar,
         )
 
+    def test_io_zoek(self):
+        """
+        Assert the search is limited to the INFORMATIEOBJECTen of the
+        informatieobjecttypes and vertrouwelijkheidaanduiding of your authorization
+        """
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/not_ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        url = reverse("enkelvoudiginformatieobject--zoek")
+
+        response = self.client.post(
+            url, {"uuid__in": [eio1.uuid, eio2.uuid, eio3.uuid]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["url"], f"http://testserver{reverse(eio1)}")
+
+    def test_io_export(self):
+        """
+        Assert the export is limited to the INFORMATIEOBJECTen of the
+        informatieobjecttypes and vertrouwelijkheidaanduiding of your authorization
+        """
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/not_ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        url = reverse("enkelvoudiginformatieobject-export")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(
+            results[0]["informatieobjecttype"], "https://informatieobjecttype.nl/ok"
+        )
+        self.assertEqual(
+            results[0]["vertrouwelijkheidaanduiding"],
+            VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    @temp_private_root()
+    def test_io_bundel(self):
+        """
+        Assert the bundle only contains the INFORMATIEOBJECTen of the
+        informatieobjecttypes and vertrouwelijkheidaanduiding of your authorization
+        """
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/not_ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ObjectInformatieObjectFactory.create(
+            informatieobject=eio1.canonical, object="https://zrc.nl/api/v1/zaken/1"
+        )
+        ObjectInformatieObjectFactory.create(
+            informatieobject=eio2.canonical, object="https://zrc.nl/api/v1/zaken/1"
+        )
+        url = reverse("enkelvoudiginformatieobject-bundel")
+
+        with self.subTest("informatieobjecten"):
+            response = self.client.post(
+                url, {"informatieobjecten": [eio1.uuid, eio2.uuid]}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        with self.subTest("object"):
+            response = self.client.post(
+                url, {"object": "https://zrc.nl/api/v1/zaken/1"}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+            self.assertEqual(len(archive.namelist()), 1)
+
     def test_io_retrieve(self):
         """
         Assert you can only read INFORMATIEOBJECTen of the informatieobjecttype and vertrouwelijkheidaanduiding
@@ -1,6 +1,8 @@
+import json
 import uuid
 from base64 import b64encode
 from datetime import date
+from hashlib import sha256
 from unittest.mock import patch
 
 from django.test import override_settings
@@ -106,7 +108,11 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
                 ),
                 "vertrouwelijkheidaanduiding": "openbaar",
                 "bestandsomvang": stored_object.inhoud.size,
-                "integriteit": {"algoritme": "", "waarde": "", "datum": None},
+                "integriteit": {
+                    "algoritme": "sha_256",
+                    "waarde": sha256(b"some file content").hexdigest(),
+                    "datum": "2018-06-27",
+                },
                 "ontvangstdatum": None,
                 "verzenddatum": None,
                 "ondertekening": {"soort": "", "datum": None},
@@ -233,7 +239,7 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
     @patch("vng_api_common.validators.obj_has_shape", return_value=True)
     def test_integrity_empty(self, *mocks):
         """
-        Assert that integrity is optional.
+        Assert that integrity is optional, and calculated if not provided.
         """
         content = {
             "identificatie": uuid.uuid4().hex,
@@ -257,7 +263,12 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         stored_object = EnkelvoudigInformatieObject.objects.get()
         self.assertEqual(
-            stored_object.integriteit, {"algoritme": "", "waarde": "", "datum": None}
+            stored_object.integriteit,
+            {
+                "algoritme": "sha_256",
+                "waarde": sha256(b"some file content").hexdigest(),
+                "datum": date(2018, 6, 27),
+            },
         )
 
     @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
@@ -301,6 +312,40 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
             },
         )
 
+    @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+    @patch("vng_api_common.validators.fetcher")
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    def test_integrity_mismatch(self, *mocks):
+        """
+        Assert that content not matching the provided integrity is rejected.
+        """
+        content = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-12-13",
+            "titel": "Voorbeelddocument",
+            "auteur": "test_auteur",
+            "formaat": "text/plain",
+            "taal": "eng",
+            "bestandsnaam": "dummy.txt",
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "inhoud": b64encode(b"other file content").decode("utf-8"),
+            "bestandsomvang": 18,
+            "informatieobjecttype": "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/1",
+            "integriteit": {
+                "algoritme": "md5",
+                "waarde": "27c3a009a3cbba674d0b3e836f2d4685",
+                "datum": "2018-12-13",
+            },
+        }
+
+        response = self.client.post(self.list_url, content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "integriteit")
+        self.assertEqual(error["code"], "integriteit-mismatch")
+        self.assertFalse(EnkelvoudigInformatieObject.objects.exists())
+
     def test_filter_by_identification(self):
         EnkelvoudigInformatieObjectFactory.create(identificatie="foo")
         EnkelvoudigInformatieObjectFactory.create(identificatie="bar")
@@ -615,7 +660,7 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         response = self.client.get(eio_url, {"versie": "1"})
 
         response = self.client.get(response.data["inhoud"])
-        self.assertEqual(response._container[0], b"inhoud1")
+        self.assertEqual(response.getvalue(), b"inhoud1")
 
     def test_eio_download_content_filter_by_registratie(self):
         with freeze_time("2019-01-01 12:00:00"):
@@ -640,7 +685,72 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         response = self.client.get(eio_url, {"registratieOp": "2019-01-01T12:00:00"})
 
         response = self.client.get(response.data["inhoud"])
-        self.assertEqual(response._container[0], b"inhoud1")
+        self.assertEqual(response.getvalue(), b"inhoud1")
+
+    def test_eio_detail_filter_by_versie_and_registratie_op(self):
+        with freeze_time("2019-01-01 12:00:00"):
+            eio = EnkelvoudigInformatieObjectFactory.create(
+                beschrijving="beschrijving1"
+            )
+
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eio.uuid}
+        )
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+        with freeze_time("2019-01-01 13:00:00"):
+            self.client.patch(eio_url, {"beschrijving": "beschrijving2", "lock": lock})
+
+        response = self.client.get(
+            eio_url, {"versie": 1, "registratieOp": "2019-01-01T14:00:00"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["beschrijving"], "beschrijving1")
+
+        response = self.client.get(
+            eio_url, {"versie": 2, "registratieOp": "2019-01-01T12:30:00"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_eio_versies(self):
+        with freeze_time("2019-01-01 12:00:00"):
+            eio = EnkelvoudigInformatieObjectFactory.create(titel="titel1")
+        EnkelvoudigInformatieObjectFactory.create()
+
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eio.uuid}
+        )
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+        with freeze_time("2019-01-01 13:00:00"):
+            self.client.patch(eio_url, {"titel": "titel2", "lock": lock})
+
+        response = self.client.get(
+            reverse("enkelvoudiginformatieobject-versies", kwargs={"uuid": eio.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "url": f"http://testserver{eio_url}?versie=1",
+                    "versie": 1,
+                    "beginRegistratie": "2019-01-01T12:00:00Z",
+                    "titel": "titel1",
+                    "status": "",
+                    "bestandsnaam": "",
+                    "bestandsomvang": 9,
+                },
+                {
+                    "url": f"http://testserver{eio_url}?versie=2",
+                    "versie": 2,
+                    "beginRegistratie": "2019-01-01T13:00:00Z",
+                    "titel": "titel2",
+                    "status": "",
+                    "bestandsnaam": "",
+                    "bestandsomvang": 9,
+                },
+            ],
+        )
 
 
 @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
@@ -699,3 +809,175 @@ class EIOZoekTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.json()["invalidParams"][0]["code"], "required")
+
+    def test_zoek_uuid_in_request_order(self):
+        eio1, eio2, eio3 = EnkelvoudigInformatieObjectFactory.create_batch(3)
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+        data = {"uuid__in": [eio3.uuid, eio1.uuid, eio2.uuid]}
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [eio["url"] for eio in response.json()["results"]],
+            [
+                f"http://testserver{reverse(eio3)}",
+                f"http://testserver{reverse(eio1)}",
+                f"http://testserver{reverse(eio2)}",
+            ],
+        )
+
+    def test_zoek_uuid_in_latest_version(self):
+        with freeze_time("2022-01-01"):
+            eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="versie 1")
+        with freeze_time("2022-02-01"):
+            EnkelvoudigInformatieObjectFactory.create(
+                canonical=eio.canonical,
+                uuid=eio.uuid,
+                versie=2,
+                beschrijving="versie 2",
+            )
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+
+        response = self.client.post(url, {"uuid__in": [eio.uuid]})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["versie"], 2)
+        self.assertEqual(data[0]["beschrijving"], "versie 2")
+
+    def test_zoek_objecten_versions(self):
+        with freeze_time("2022-01-01"):
+            eio1 = EnkelvoudigInformatieObjectFactory.create(beschrijving="1 versie 1")
+            eio2 = EnkelvoudigInformatieObjectFactory.create(beschrijving="2 versie 1")
+        with freeze_time("2022-02-01"):
+            EnkelvoudigInformatieObjectFactory.create(
+                canonical=eio1.canonical,
+                uuid=eio1.uuid,
+                versie=2,
+                beschrijving="1 versie 2",
+            )
+            EnkelvoudigInformatieObjectFactory.create(
+                canonical=eio2.canonical,
+                uuid=eio2.uuid,
+                versie=2,
+                beschrijving="2 versie 2",
+            )
+        eio3 = EnkelvoudigInformatieObjectFactory.create(beschrijving="3 versie 1")
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+        data = {
+            "objecten": [
+                {"uuid": eio3.uuid},
+                {"uuid": eio1.uuid, "versie": 1},
+                {"uuid": eio2.uuid, "registratieOp": "2022-01-15T00:00:00Z"},
+                {"uuid": eio1.uuid, "registratieOp": "2022-02-15T00:00:00Z"},
+                {"uuid": eio2.uuid, "versie": 3},
+            ]
+        }
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [eio["beschrijving"] for eio in response.json()["results"]],
+            ["3 versie 1", "1 versie 1", "2 versie 1", "1 versie 2"],
+        )
+
+    def test_zoek_objecten_duplicate(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(beschrijving="1")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(beschrijving="2")
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+        data = {
+            "objecten": [
+                {"uuid": eio2.uuid},
+                {"uuid": eio1.uuid},
+                {"uuid": eio2.uuid, "versie": 1},
+            ]
+        }
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # a version is returned once, at the position of its first reference
+        self.assertEqual(
+            [eio["beschrijving"] for eio in response.json()["results"]], ["2", "1"]
+        )
+
+    def test_zoek_uuid_in_and_objecten(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+        data = {"uuid__in": [eio.uuid], "objecten": [{"uuid": eio.uuid}]}
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "mutually-exclusive")
+
+    @override_settings(ZOEK_MAX_UUIDS=2)
+    def test_zoek_maximum(self):
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+        data = {"uuid__in": [uuid.uuid4() for i in range(3)]}
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "uuid__in")
+        self.assertEqual(error["code"], "max_length")
+
+
+@temp_private_root()
+class EnkelvoudigInformatieObjectExportTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("enkelvoudiginformatieobject-export")
+
+    def test_export_latest_versions(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(beschrijving="object1")
+        eio1_url = reverse(eio1)
+        lock = self.client.post(f"{eio1_url}/lock").data["lock"]
+        self.client.patch(eio1_url, {"beschrijving": "object1 versie2", "lock": lock})
+        EnkelvoudigInformatieObjectFactory.create(beschrijving="object2")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        lines = b"".join(response.streaming_content).splitlines()
+        data = [json.loads(line) for line in lines]
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["url"], f"http://testserver{eio1_url}")
+        self.assertEqual(data[0]["beschrijving"], "object1 versie2")
+        self.assertEqual(data[0]["versie"], 2)
+        self.assertTrue(data[0]["inhoud"].endswith("?versie=2"))
+        self.assertEqual(data[1]["beschrijving"], "object2")
+        self.assertTrue(data[1]["inhoud"].endswith("?versie=1"))
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_export_multiple_chunks(self):
+        EnkelvoudigInformatieObjectFactory.create_batch(5)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 5)
+
+    def test_export_filter(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(identificatie="foo")
+        EnkelvoudigInformatieObjectFactory.create(identificatie="bar")
+
+        response = self.client.get(self.url, {"identificatie": "foo"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0])["url"], f"http://testserver{reverse(eio)}"
+        )
+
+    def test_export_unknown_query_params(self):
+        response = self.client.get(self.url, {"someparam": "somevalue"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
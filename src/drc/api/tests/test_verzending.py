@@ -1,5 +1,8 @@
+import json
+import warnings
 from datetime import timedelta
 
+from django.core.paginator import UnorderedObjectListWarning
 from django.utils import timezone
 
 from rest_framework import status
@@ -30,6 +33,35 @@ class VerzendingAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["count"], 3)
 
+    def test_list_ordered(self):
+        verzendingen = VerzendingFactory.create_batch(size=3, has_address=True)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UnorderedObjectListWarning)
+            response = self.client.get(reverse("verzending-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [verzending["url"] for verzending in response.json()["results"]],
+            [f"http://testserver{reverse(verzending)}" for verzending in verzendingen],
+        )
+
+    def test_export(self):
+        verzendingen = VerzendingFactory.create_batch(size=3, has_address=True)
+
+        response = self.client.get(reverse("verzending-export"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("betrokkene", json.loads(lines[0]))
+        self.assertEqual(
+            [json.loads(line)["url"] for line in lines],
+            [f"http://testserver{reverse(verzending)}" for verzending in verzendingen],
+        )
+
     def test_detail(self):
         verzending = VerzendingFactory(has_address=True)
 
@@ -1,5 +1,4 @@
 import os
-import shutil
 
 from django.conf import settings
 from django.contrib.sites.models import Site
@@ -17,18 +16,30 @@ def get_absolute_url(url_name: str, uuid: str) -> str:
     return f"{protocol}://{domain}{path}"
 
 
-def merge_files(part_files, file_dir, file_name) -> str:
-    os.makedirs(file_dir, exist_ok=True)
+def merge_files(part_files, output, checksum=None) -> int:
+    """
+    Concatenate the part files into ``output``, updating the ``checksum`` (if
+    given) on the fly.
 
-    file_path = os.path.join(file_dir, file_name)
-    with open(file_path, "wb") as output:
-        for file in part_files:
-            with file.open("rb") as fileobj:
-                shutil.copyfileobj(fileobj, output, settings.READ_CHUNK)
-    return file_path
+    Return the size of the merged file.
+    """
+    size = 0
+    for file in part_files:
+        with file.open("rb") as fileobj:
+            while chunk := fileobj.read(settings.READ_CHUNK):
+                if checksum is not None:
+                    checksum.update(chunk)
+                output.write(chunk)
+                size += len(chunk)
+    return size
 
 
 def create_filename(name):
     main_part, ext = os.path.splitext(name)
     ext = ext or f".{settings.DEFAULT_EXTENSION}"
     return f"{main_part}{ext}"
+
+
+def delete_files(storage, file_names) -> None:
+    for file_name in file_names:
+        storage.delete(file_name)
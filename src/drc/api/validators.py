@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from typing import Set
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -187,6 +188,38 @@ class OneAddressValidator:
         )
 
 
+class CachedValidator:
+    """
+    Run the wrapped validator once per value for all serializers sharing the
+    ``validation_cache`` of their context.
+
+    The bulk operations validate many objects referring to the same remote
+    resources. Without a cache in the context, the validator always runs.
+    """
+
+    requires_context = True
+
+    def __init__(self, validator):
+        self.validator = validator
+
+    def __call__(self, value, serializer_field):
+        cache = serializer_field.context.get("validation_cache")
+        if cache is None:
+            return self.validator(value)
+
+        key = (type(self.validator), value)
+        if key not in cache:
+            try:
+                self.validator(value)
+            except serializers.ValidationError as exc:
+                cache[key] = exc
+            else:
+                cache[key] = None
+
+        if cache[key] is not None:
+            raise cache[key]
+
+
 class StatusValidator:
     """
     Wrap around drc.datamodel.validate_status to output the errors to the
@@ -207,17 +240,42 @@ class StatusValidator:
             raise serializers.ValidationError(exc.error_dict)
 
 
+def get_remote_informatieobjecten(
+    object_url: str, object_type: str, informatieobject_url: str = None
+) -> Set[str]:
+    """
+    Retrieve the URLs of the INFORMATIEOBJECTen related to the OBJECT in the
+    remote component, with one list call.
+
+    Optionally, only the relation with one INFORMATIEOBJECT is retrieved.
+    """
+    # dynamic so that it can be mocked in tests easily
+    Client = import_string(settings.ZDS_CLIENT_CLASS)
+    client = Client.from_url(object_url)
+    client.auth = APICredential.get_auth(object_url)
+
+    query_params = {object_type: object_url}
+    if informatieobject_url:
+        query_params["informatieobject"] = informatieobject_url
+    relations = client.list(f"{object_type}informatieobject", query_params=query_params)
+    return {relation["informatieobject"] for relation in relations}
+
+
 class ObjectInformatieObjectValidator:
     """
     Validate that the INFORMATIEOBJECT is already linked to the OBJECT in the remote component.
+
+    With a ``validation_cache`` in the serializer context (in bulk operations),
+    the relations of each OBJECT are retrieved once, for all INFORMATIEOBJECTen.
     """
 
     message = _(
         "Het informatieobject is in het {component} nog niet gerelateerd aan het object."
     )
     code = "inconsistent-relation"
+    requires_context = True
 
-    def __call__(self, context: OrderedDict):
+    def __call__(self, context: OrderedDict, serializer):
         object_url = context["object"]
         informatieobject_uuid = str(context["informatieobject"].latest_version.uuid)
         object_type = context["object_type"]
@@ -226,18 +284,40 @@ class ObjectInformatieObjectValidator:
             "enkelvoudiginformatieobject-detail", uuid=informatieobject_uuid
         )
 
-        # dynamic so that it can be mocked in tests easily
-        Client = import_string(settings.ZDS_CLIENT_CLASS)
-        client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        cache = serializer.context.get("validation_cache")
+        if cache is None:
+            is_related = bool(
+                self._get_related(object_url, object_type, informatieobject_url)
+            )
+        else:
+            key = (type(self), object_url)
+            if key not in cache:
+                try:
+                    cache[key] = self._get_related(object_url, object_type)
+                except serializers.ValidationError as exc:
+                    cache[key] = exc
+
+            if isinstance(cache[key], serializers.ValidationError):
+                raise cache[key]
+            is_related = informatieobject_url in cache[key]
+
+        if not is_related:
+            component = "ZRC" if object_type == "zaak" else "BRC"
+            raise serializers.ValidationError(
+                self.message.format(component=component), code=self.code
+            )
+
+    def _get_related(
+        self, object_url: str, object_type: str, informatieobject_url: str = None
+    ) -> Set[str]:
+        """
+        Retrieve the INFORMATIEOBJECTen related to the OBJECT, optionally
+        filtered on one INFORMATIEOBJECT.
+        """
         try:
             if object_type == "zaak":
-                resource = "zaakinformatieobject"
-                component = "ZRC"
                 oas_schema = settings.ZRC_API_SPEC
             elif object_type == "besluit":
-                resource = "besluitinformatieobject"
-                component = "BRC"
                 oas_schema = settings.BRC_API_SPEC
 
             try:
@@ -252,24 +332,14 @@ class ObjectInformatieObjectValidator:
                     {"object": exc.detail}, code=ResourceValidator.code
                 )
 
-            oios = client.list(
-                resource,
-                query_params={
-                    object_type: object_url,
-                    "informatieobject": informatieobject_url,
-                },
+            return get_remote_informatieobjecten(
+                object_url, object_type, informatieobject_url
             )
-
         except ClientError as exc:
             raise serializers.ValidationError(
                 exc.args[0], code="relation-validation-error"
             ) from exc
 
-        if len(oios) == 0:
-            raise serializers.ValidationError(
-                self.message.format(component=component), code=self.code
-            )
-
 
 class RemoteRelationValidator:
     message = _(
@@ -316,12 +386,17 @@ class InformatieObjectUniqueValidator:
 
     message = _("The fields {field_names} must make a unique set.")
     code = "unique"
+    requires_context = True
 
     def __init__(self, remote_resource_field, field: str):
         self.remote_resource_field = remote_resource_field
         self.field = field
 
-    def __call__(self, context: OrderedDict):
+    def __call__(self, context: OrderedDict, serializer):
+        # in bulk operations, the view checks all objects with one query
+        if "validation_cache" in serializer.context:
+            return
+
         object_url = context["object"]
         informatieobject = context["informatieobject"]
 
@@ -1,20 +1,49 @@
 from django.utils.translation import gettext as _
 
-from drf_spectacular.utils import extend_schema, extend_schema_view, inline_serializer
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+    inline_serializer,
+)
 from rest_framework import serializers, viewsets
 from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
 
-from drc.api.mixins import UpdateWithoutPartialMixin
+from drc.api.mixins import ReadReplicaMixin, UpdateWithoutPartialMixin
 from drc.api.permissions import InformationObjectRelatedAuthScopesRequired
 from drc.api.schema import BestandsDeelSchema
 from drc.api.scopes import SCOPE_DOCUMENTEN_BIJWERKEN
-from drc.api.serializers import BestandsDeelSerializer
+from drc.api.serializers import BestandsDeelSerializer, BestandsDeelStreamSerializer
 from drc.datamodel.models.bestandsdeel import BestandsDeel
 
 
 @extend_schema_view(
     update=extend_schema(
         summary=_("Upload een bestandsdeel."),
+        description=_(
+            "Het bestandsdeel kan als `multipart/form-data` geupload worden, of "
+            "als de binaire inhoud van de request body met het content-type "
+            "`application/octet-stream`. In dat laatste geval wordt de `lock` "
+            "in de `Lock`-header meegestuurd."
+        ),
+        request={
+            "multipart/form-data": BestandsDeelSerializer,
+            "application/octet-stream": OpenApiTypes.BINARY,
+        },
+        parameters=[
+            OpenApiParameter(
+                name="Lock",
+                location=OpenApiParameter.HEADER,
+                type=OpenApiTypes.STR,
+                required=False,
+                description=_(
+                    "De `lock` van het informatieobject, bij een upload met het "
+                    "content-type `application/octet-stream`."
+                ),
+            )
+        ],
         responses={
             200: inline_serializer(
                 name="BestandsDeelResponse",
@@ -49,7 +78,9 @@ from drc.datamodel.models.bestandsdeel import BestandsDeel
         },
     ),
 )
-class BestandsDeelViewSet(UpdateWithoutPartialMixin, viewsets.GenericViewSet):
+class BestandsDeelViewSet(
+    ReadReplicaMixin, UpdateWithoutPartialMixin, viewsets.GenericViewSet
+):
     queryset = BestandsDeel.objects.all()
     serializer_class = BestandsDeelSerializer
     lookup_field = "uuid"
@@ -58,3 +89,19 @@ class BestandsDeelViewSet(UpdateWithoutPartialMixin, viewsets.GenericViewSet):
     required_scopes = {"update": SCOPE_DOCUMENTEN_BIJWERKEN}
 
     swagger_schema = BestandsDeelSchema
+
+    def update(self, request, *args, **kwargs):
+        media_type = request.content_type.split(";")[0].strip().lower()
+        if media_type != "application/octet-stream":
+            return super().update(request, *args, **kwargs)
+
+        # stream the request body, without parsing or buffering it first
+        instance = self.get_object()
+        serializer = BestandsDeelStreamSerializer(
+            instance,
+            data={"lock": request.headers.get("Lock", "")},
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(stream=request.stream)
+        return Response(serializer.data)
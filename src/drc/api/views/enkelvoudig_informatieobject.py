@@ -1,4 +1,11 @@
+import os
+from collections import defaultdict
+
+from django.conf import settings
 from django.db import transaction
+from django.http import FileResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 from django.utils.translation import gettext as _
 
 from drf_spectacular.types import OpenApiTypes
@@ -31,6 +38,7 @@ from drc.api.filters import (
     EnkelvoudigInformatieObjectListFilter,
 )
 from drc.api.kanalen import KANAAL_DOCUMENTEN
+from drc.api.mixins import BulkCreateMixin, ExportMixin, ReadReplicaMixin
 from drc.api.permissions import InformationObjectAuthScopesRequired
 from drc.api.renderers import BinaryFileRenderer
 from drc.api.schema import EIOAutoSchema
@@ -46,18 +54,59 @@ from drc.api.scopes import (
 from drc.api.serializers import (
     EnkelvoudigInformatieObjectCreateLockSerializer,
     EnkelvoudigInformatieObjectSerializer,
+    EnkelvoudigInformatieObjectVersieSerializer,
     EnkelvoudigInformatieObjectWithLockSerializer,
     LockEnkelvoudigInformatieObjectSerializer,
     UnlockEnkelvoudigInformatieObjectSerializer,
 )
-from drc.api.serializers.enkelvoudig_informatieobject import EIOZoekSerializer
+from drc.api.serializers.enkelvoudig_informatieobject import (
+    EIOBundelSerializer,
+    EIOZoekSerializer,
+)
+from drc.api.utils import delete_files
 from drc.api.views.constants import REGISTRATIE_QUERY_PARAM, VERSIE_QUERY_PARAM
-from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.models import EnkelvoudigInformatieObject, ObjectInformatieObject
+from drc.utils.compression import accepts_encoding, is_compressible, iter_decompressed
+from drc.utils.storages import is_local_storage
+from drc.utils.zipstream import ZipEntry, iter_zip
 
 PATH_PARAMETER_NAME = "enkelvoudiginformatieobject_uuid"
 PATH_PARAMETER_DESCRIPTION = "Unieke resource identifier (UUID4)"
 
 
+def get_unique_name(eio: EnkelvoudigInformatieObject, names: set) -> str:
+    """
+    Name the content of the document in an archive, without overwriting others.
+    """
+    name = eio.bestandsnaam or os.path.basename(eio.inhoud.name)
+    # strip the suffix of the encoding, added when the content was compressed
+    if not eio.bestandsnaam and eio.inhoud_encoding:
+        name, _ext = os.path.splitext(name)
+    name = name.replace("/", "_").replace("\\", "_")
+
+    stem, ext = os.path.splitext(name)
+    counter = 1
+    while name in names:
+        counter += 1
+        name = f"{stem} ({counter}){ext}"
+    return name
+
+
+def iter_content(eio: EnkelvoudigInformatieObject):
+    """
+    Stream the (uncompressed) content of the document.
+    """
+    file = eio.inhoud.open("rb")
+    if encoding := eio.inhoud_encoding:
+        yield from iter_decompressed(file, encoding)
+        return
+
+    try:
+        yield from file.chunks(chunk_size=settings.READ_CHUNK)
+    finally:
+        file.close()
+
+
 @conditional_retrieve()
 @extend_schema_view(
     list=extend_schema(
@@ -119,6 +168,28 @@ PATH_PARAMETER_DESCRIPTION = "Unieke resource identifier (UUID4)"
             "- audit trail regels"
         ),
     ),
+    export=extend_schema(
+        summary=_("Exporteer alle (ENKELVOUDIGe) INFORMATIEOBJECTen."),
+        description=_(
+            "Geeft de laatste versie van elk (ENKELVOUDIG) INFORMATIEOBJECT terug "
+            "als newline delimited JSON (één object per regel), zonder paginering. "
+            "Deze lijst kan gefilterd worden met dezelfde query-string parameters "
+            "als de lijst-operatie."
+        ),
+    ),
+    bulk_create=extend_schema(
+        summary=_("Maak meerdere (ENKELVOUDIGe) INFORMATIEOBJECTen aan."),
+        description=_(
+            "Maakt de opgegeven (ENKELVOUDIGe) INFORMATIEOBJECTen in één keer aan. "
+            "Elk INFORMATIEOBJECT wordt gevalideerd zoals bij het aanmaken van een "
+            "enkel INFORMATIEOBJECT; de geldige INFORMATIEOBJECTen worden "
+            "aangemaakt, ook als andere ongeldig zijn. Het resultaat bevat per "
+            "INFORMATIEOBJECT de `status` en het aangemaakte INFORMATIEOBJECT of de "
+            "validatiefouten, in de volgorde van de aanvraag. Het maximum aantal "
+            "INFORMATIEOBJECTen is configureerbaar en is standaard 100."
+        ),
+        request=EnkelvoudigInformatieObjectCreateLockSerializer(many=True),
+    ),
     download=extend_schema(
         summary=_("Download de binaire data van het (ENKELVOUDIG) INFORMATIEOBJECT."),
         description=_(
@@ -143,9 +214,12 @@ PATH_PARAMETER_DESCRIPTION = "Unieke resource identifier (UUID4)"
     ),
 )
 class EnkelvoudigInformatieObjectViewSet(
+    ReadReplicaMixin,
     NotificationViewSetMixin,
     CheckQueryParamsMixin,
     SearchMixin,
+    ExportMixin,
+    BulkCreateMixin,
     ListFilterByAuthorizationsMixin,
     AuditTrailViewsetMixin,
     viewsets.ModelViewSet,
@@ -159,18 +233,25 @@ class EnkelvoudigInformatieObjectViewSet(
     lookup_field = "uuid"
     pagination_class = PageNumberPagination
     search_input_serializer_class = EIOZoekSerializer
+    export_prefetch_related = ("canonical__bestandsdelen",)
+    bulk_unique_together = ("bronorganisatie", "identificatie")
+    bulk_prefetch_related = ("canonical__bestandsdelen",)
 
     permission_classes = (InformationObjectAuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "_zoek": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "export": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "create": SCOPE_DOCUMENTEN_AANMAKEN,
+        "bulk_create": SCOPE_DOCUMENTEN_AANMAKEN,
         "destroy": SCOPE_DOCUMENTEN_ALLES_VERWIJDEREN,
         "update": SCOPE_DOCUMENTEN_BIJWERKEN | SCOPE_DOCUMENTEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_DOCUMENTEN_BIJWERKEN
         | SCOPE_DOCUMENTEN_GEFORCEERD_BIJWERKEN,
         "download": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "bundel": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "versies": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "lock": SCOPE_DOCUMENTEN_LOCK,
         "unlock": SCOPE_DOCUMENTEN_LOCK | SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
     }
@@ -202,16 +283,21 @@ class EnkelvoudigInformatieObjectViewSet(
     @extend_schema(
         summary=_("Voer een zoekopdracht uit op (ENKELVOUDIG) INFORMATIEOBJECTen."),
         description=_(
-            "Zoeken/filteren gaat normaal via de `list` operatie, deze is echter niet geschikt voor zoekopdrachten met UUIDs."
+            "Zoeken/filteren gaat normaal via de `list` operatie, deze is echter niet geschikt voor zoekopdrachten met UUIDs. "
+            "De resultaten worden teruggegeven in de volgorde van de zoekopdracht. "
+            "Een versie die meerdere keren gevonden wordt, wordt eenmaal teruggegeven, "
+            "op de positie van de eerste verwijzing."
         ),
     )
     @action(methods=("post",), detail=False)
     def _zoek(self, request, *args, **kwargs):
-        search_input = self.get_search_input()
-        queryset = self.filter_queryset(self.get_queryset())
-        for name, value in search_input.items():
-            queryset = queryset.filter(**{name: value})
+        search_serializer = self.get_search_input_serializer_class()(data=request.data)
+        search_serializer.is_valid(raise_exception=True)
 
+        queryset = EnkelvoudigInformatieObject.objects.for_references(
+            search_serializer.get_references()
+        )
+        queryset = self.filter_queryset(self.filter_by_authorizations(queryset))
         return self.get_search_output(queryset)
 
     _zoek.is_search_action = True
@@ -233,8 +319,18 @@ class EnkelvoudigInformatieObjectViewSet(
                 code="destroy-locked",
             )
 
+        file_names = set(
+            instance.canonical.enkelvoudiginformatieobject_set.exclude(
+                inhoud=""
+            ).values_list("inhoud", flat=True)
+        )
         super().perform_destroy(instance.canonical)
 
+        # remove the content once the deletion is committed - a storage sharing
+        # files between documents only deletes files that aren't referenced anymore
+        storage = instance.inhoud.storage
+        transaction.on_commit(lambda: delete_files(storage, file_names))
+
     @property
     def filterset_class(self):
         """
@@ -250,8 +346,10 @@ class EnkelvoudigInformatieObjectViewSet(
         """
         if self.action in ["update", "partial_update"]:
             return EnkelvoudigInformatieObjectWithLockSerializer
-        if self.action == "create":
+        if self.action in ["create", "bulk_create"]:
             return EnkelvoudigInformatieObjectCreateLockSerializer
+        if self.action == "versies":
+            return EnkelvoudigInformatieObjectVersieSerializer
         return EnkelvoudigInformatieObjectSerializer
 
     @extend_schema(parameters=[VERSIE_QUERY_PARAM, REGISTRATIE_QUERY_PARAM])
@@ -268,6 +366,12 @@ class EnkelvoudigInformatieObjectViewSet(
                 description=_("De binaire bestandsinhoud"),
                 response=OpenApiTypes.BINARY,
             ),
+            status.HTTP_302_FOUND: OpenApiResponse(
+                description=_(
+                    "Redirect naar de bestandsinhoud in de objectopslag, indien "
+                    "ingeschakeld"
+                ),
+            ),
             status.HTTP_401_UNAUTHORIZED: FoutSerializer,
             status.HTTP_403_FORBIDDEN: FoutSerializer,
             status.HTTP_404_NOT_FOUND: FoutSerializer,
@@ -282,12 +386,185 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(methods=["get"], detail=True, name="enkelvoudiginformatieobject_download")
     def download(self, request, *args, **kwargs):
         eio = self.get_object()
-        return sendfile(
-            request,
-            eio.inhoud.path,
-            attachment=True,
-            mimetype="application/octet-stream",
+        storage = eio.inhoud.storage
+        encoding = eio.inhoud_encoding
+        filename = os.path.basename(eio.inhoud.name)
+        if encoding:
+            # strip the suffix of the encoding, added when the content was compressed
+            filename, _ext = os.path.splitext(filename)
+
+        # compressed content is sent as-is to clients which accept the encoding
+        send_encoded = bool(encoding) and accepts_encoding(
+            request.headers.get("Accept-Encoding", ""), encoding
+        )
+        if encoding and not send_encoded:
+            response = StreamingHttpResponse(
+                iter_decompressed(eio.inhoud.open("rb"), encoding),
+                content_type="application/octet-stream",
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            if eio.bestandsomvang is not None:
+                response["Content-Length"] = eio.bestandsomvang
+        elif (
+            settings.INHOUD_DOWNLOAD_REDIRECT
+            and not encoding
+            and hasattr(storage, "get_download_url")
+        ):
+            return HttpResponseRedirect(
+                storage.get_download_url(eio.inhoud.name, filename)
+            )
+        elif not is_local_storage(storage):
+            response = FileResponse(
+                eio.inhoud.open("rb"),
+                as_attachment=True,
+                filename=filename,
+                content_type="application/octet-stream",
+            )
+        else:
+            response = sendfile(
+                request,
+                eio.inhoud.path,
+                attachment=True,
+                attachment_filename=filename,
+                mimetype="application/octet-stream",
+            )
+
+        # sendfile guesses the encoding from the name of the file, which the
+        # client may have chosen
+        if "Content-Encoding" in response:
+            del response["Content-Encoding"]
+        if encoding:
+            if send_encoded:
+                response["Content-Encoding"] = encoding
+            patch_vary_headers(response, ["Accept-Encoding"])
+        return response
+
+    @extend_schema(
+        summary=_("Download de binaire data van meerdere INFORMATIEOBJECTen."),
+        description=_(
+            "Geeft een ZIP-archief met de binaire data van de opgegeven "
+            "(ENKELVOUDIGe) INFORMATIEOBJECTen, of van alle INFORMATIEOBJECTen "
+            "gerelateerd aan het opgegeven `object`. Het archief wordt gestreamd. "
+            "\n\n**Er wordt gevalideerd op**\n"
+            "- de autorisaties voor elk opgegeven INFORMATIEOBJECT - van een "
+            "`object` worden alleen de INFORMATIEOBJECTen opgenomen waarvoor de "
+            "autorisaties gelden"
+        ),
+        request=EIOBundelSerializer,
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                description=_("ZIP-archief met de bestandsinhoud"),
+                response=OpenApiTypes.BINARY,
+            ),
+            status.HTTP_400_BAD_REQUEST: FoutSerializer,
+            status.HTTP_401_UNAUTHORIZED: FoutSerializer,
+            status.HTTP_403_FORBIDDEN: FoutSerializer,
+            status.HTTP_406_NOT_ACCEPTABLE: FoutSerializer,
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: FoutSerializer,
+            status.HTTP_429_TOO_MANY_REQUESTS: FoutSerializer,
+            status.HTTP_500_INTERNAL_SERVER_ERROR: FoutSerializer,
+        },
+    )
+    @action(methods=["post"], detail=False)
+    def bundel(self, request, *args, **kwargs):
+        serializer = EIOBundelSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if "object" in serializer.validated_data:
+            queryset = self.queryset.filter(
+                canonical__in=ObjectInformatieObject.objects.filter(
+                    object=serializer.validated_data["object"]
+                ).values("informatieobject")
+            )
+            eios = list(self.filter_by_authorizations(queryset))
+        else:
+            eios = self._get_referenced(serializer.validated_data["informatieobjecten"])
+            for eio in eios:
+                self.check_object_permissions(request, eio)
+
+        response = StreamingHttpResponse(
+            iter_zip(self._get_zip_entries(eios)), content_type="application/zip"
+        )
+        response["Content-Disposition"] = 'attachment; filename="documenten.zip"'
+        return response
+
+    def _get_referenced(self, references: list) -> list:
+        eios = list(EnkelvoudigInformatieObject.objects.for_references(references))
+
+        # the versions found per document - without a versie, any version will do
+        versies = defaultdict(set)
+        for eio in eios:
+            versies[eio.uuid].update({eio.versie, None})
+        missing = [
+            reference
+            for reference in references
+            if reference.get("versie") not in versies[reference["uuid"]]
+        ]
+        if missing:
+            raise serializers.ValidationError(
+                {
+                    "informatieobjecten": _(
+                        "The informatieobject {uuid} does not exist."
+                    ).format(uuid=missing[0]["uuid"])
+                },
+                code="does-not-exist",
+            )
+        return eios
+
+    def _get_zip_entries(self, eios: list):
+        names = set()
+        for eio in eios:
+            # documents without content, e.g. uploads in progress, are skipped
+            if not eio.inhoud:
+                continue
+
+            name = get_unique_name(eio, names)
+            names.add(name)
+            yield ZipEntry(
+                name=name,
+                modified=timezone.make_naive(eio.begin_registratie),
+                content=iter_content(eio),
+                size=eio.bestandsomvang,
+                compress=is_compressible(eio.formaat, name),
+            )
+
+    @extend_schema(
+        operation_id="enkelvoudiginformatieobject_versies",
+        summary=_("Alle versies van een (ENKELVOUDIG) INFORMATIEOBJECT opvragen."),
+        description=_(
+            "Geeft de metadata van alle versies van het (ENKELVOUDIG) "
+            "INFORMATIEOBJECT terug, op volgorde van `versie`. De `url` van een "
+            "versie verwijst naar die specifieke versie."
+        ),
+        responses={
+            status.HTTP_200_OK: EnkelvoudigInformatieObjectVersieSerializer(many=True),
+            status.HTTP_401_UNAUTHORIZED: FoutSerializer,
+            status.HTTP_403_FORBIDDEN: FoutSerializer,
+            status.HTTP_404_NOT_FOUND: FoutSerializer,
+            status.HTTP_406_NOT_ACCEPTABLE: FoutSerializer,
+            status.HTTP_410_GONE: FoutSerializer,
+            status.HTTP_429_TOO_MANY_REQUESTS: FoutSerializer,
+            status.HTTP_500_INTERNAL_SERVER_ERROR: FoutSerializer,
+        },
+    )
+    @action(methods=["get"], detail=True)
+    def versies(self, request, *args, **kwargs):
+        eio = self.get_object()
+        versions = (
+            EnkelvoudigInformatieObject.objects.filter(canonical=eio.canonical_id)
+            .only(
+                "uuid",
+                "versie",
+                "begin_registratie",
+                "titel",
+                "status",
+                "bestandsnaam",
+                "bestandsomvang",
+            )
+            .order_by("versie")
         )
+        serializer = self.get_serializer(versions, many=True)
+        return Response(serializer.data)
 
     @extend_schema(
         request=LockEnkelvoudigInformatieObjectSerializer,
@@ -370,7 +647,7 @@ class EnkelvoudigInformatieObjectViewSet(
         description=_("Een specifieke audit trail regel opvragen."),
     ),
 )
-class EnkelvoudigInformatieObjectAuditTrailViewSet(AuditTrailViewSet):
+class EnkelvoudigInformatieObjectAuditTrailViewSet(ReadReplicaMixin, AuditTrailViewSet):
     main_resource_lookup_field = "enkelvoudiginformatieobject_uuid"
     global_description = "Opvragen van de audit trail regels."
 
@@ -11,6 +11,7 @@ from drc.api.audits import AUDIT_DRC
 from drc.api.data_filtering import ListFilterByAuthorizationsMixin
 from drc.api.filters import GebruiksrechtenFilter
 from drc.api.kanalen import KANAAL_DOCUMENTEN
+from drc.api.mixins import ReadReplicaMixin
 from drc.api.permissions import InformationObjectRelatedAuthScopesRequired
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
@@ -60,6 +61,7 @@ from drc.datamodel.models.gebruiksrechten import Gebruiksrechten
     ),
 )
 class GebruiksrechtenViewSet(
+    ReadReplicaMixin,
     NotificationViewSetMixin,
     CheckQueryParamsMixin,
     ListFilterByAuthorizationsMixin,
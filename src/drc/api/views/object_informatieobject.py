@@ -1,13 +1,18 @@
+from collections import defaultdict
+
 from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import mixins, serializers, viewsets
+from rest_framework.exceptions import ErrorDetail
 from rest_framework.settings import api_settings
 from vng_api_common.caching.decorators import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
+from zds_client import ClientError
 
 from drc.api.data_filtering import ListFilterByAuthorizationsMixin
 from drc.api.filters import ObjectInformatieObjectFilter
+from drc.api.mixins import BulkCreateMixin, BulkDestroyMixin, ReadReplicaMixin
 from drc.api.permissions import InformationObjectRelatedAuthScopesRequired
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
@@ -16,7 +21,8 @@ from drc.api.scopes import (
     SCOPE_DOCUMENTEN_BIJWERKEN,
 )
 from drc.api.serializers import ObjectInformatieObjectSerializer
-from drc.api.validators import RemoteRelationValidator
+from drc.api.utils import get_absolute_url
+from drc.api.validators import RemoteRelationValidator, get_remote_informatieobjecten
 from drc.datamodel.models.object_informatieobject import ObjectInformatieObject
 
 
@@ -50,9 +56,34 @@ from drc.datamodel.models.object_informatieobject import ObjectInformatieObject
             " endpoint bij het synchroniseren van relaties."
         ),
     ),
+    bulk_create=extend_schema(
+        summary=_("Maak meerdere OBJECT-INFORMATIEOBJECT relaties aan."),
+        description=_(
+            "**LET OP: Dit endpoint hoor je als consumer niet zelf aan te spreken.**"
+            " Andere API's, zoals de Zaken API en de Besluiten API, gebruiken dit"
+            " endpoint bij het synchroniseren van relaties."
+            " Elke relatie wordt gevalideerd zoals bij het aanmaken van een enkele"
+            " relatie; de relaties met een OBJECT worden in één keer opgevraagd."
+        ),
+        request=ObjectInformatieObjectSerializer(many=True),
+    ),
+    bulk_destroy=extend_schema(
+        summary=_("Verwijder meerdere OBJECT-INFORMATIEOBJECT relaties."),
+        description=_(
+            "**LET OP: Dit endpoint hoor je als consumer niet zelf aan te spreken.**"
+            " Andere API's, zoals de Zaken API en de Besluiten API, gebruiken dit"
+            " endpoint bij het synchroniseren van relaties."
+            " Een relatie kan alleen verwijderd worden als de relatie in de andere"
+            " API niet meer bestaat; de relaties met een OBJECT worden in één keer"
+            " opgevraagd."
+        ),
+    ),
 )
 class ObjectInformatieObjectViewSet(
+    ReadReplicaMixin,
     CheckQueryParamsMixin,
+    BulkCreateMixin,
+    BulkDestroyMixin,
     ListFilterByAuthorizationsMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -67,11 +98,14 @@ class ObjectInformatieObjectViewSet(
     filterset_class = ObjectInformatieObjectFilter
     lookup_field = "uuid"
     permission_classes = (InformationObjectRelatedAuthScopesRequired,)
+    bulk_unique_together = ("informatieobject", "object")
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "create": SCOPE_DOCUMENTEN_AANMAKEN,
+        "bulk_create": SCOPE_DOCUMENTEN_AANMAKEN,
         "destroy": SCOPE_DOCUMENTEN_ALLES_VERWIJDEREN,
+        "bulk_destroy": SCOPE_DOCUMENTEN_ALLES_VERWIJDEREN,
         "update": SCOPE_DOCUMENTEN_BIJWERKEN,
         "partial_update": SCOPE_DOCUMENTEN_BIJWERKEN,
     }
@@ -88,3 +122,36 @@ class ObjectInformatieObjectViewSet(
             )
         else:
             super().perform_destroy(instance)
+
+    def get_bulk_permission_object(self, validated_data: dict):
+        return validated_data["informatieobject"].latest_version
+
+    def get_bulk_destroy_errors(self, instances: list) -> dict:
+        """
+        Check that the remote relations no longer exist, with one list call per
+        OBJECT.
+        """
+        by_object = defaultdict(list)
+        for instance in instances:
+            by_object[(instance.object, instance.object_type)].append(instance)
+
+        errors = {}
+        for (object_url, object_type), object_instances in by_object.items():
+            try:
+                related = get_remote_informatieobjecten(object_url, object_type)
+            except ClientError as exc:
+                error = ErrorDetail(str(exc.args[0]), code="relation-lookup-error")
+                errors.update({instance.pk: error for instance in object_instances})
+                continue
+
+            for instance in object_instances:
+                informatieobject_url = get_absolute_url(
+                    "enkelvoudiginformatieobject-detail",
+                    uuid=instance.informatieobject.latest_version.uuid,
+                )
+                if informatieobject_url in related:
+                    errors[instance.pk] = ErrorDetail(
+                        RemoteRelationValidator.message,
+                        code=RemoteRelationValidator.code,
+                    )
+        return errors
@@ -6,7 +6,9 @@ from rest_framework.pagination import PageNumberPagination
 from vng_api_common.caching.decorators import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from drc.api.data_filtering import ListFilterByAuthorizationsMixin
 from drc.api.filters import VerzendingFilter
+from drc.api.mixins import ExportMixin, ReadReplicaMixin
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
     SCOPE_DOCUMENTEN_ALLES_LEZEN,
@@ -45,15 +47,26 @@ from drc.datamodel.models import Verzending
         summary=_("Verwijder een VERZENDING"),
         description=_("Verwijder een VERZENDING."),
     ),
+    export=extend_schema(
+        summary=_("Exporteer alle VERZENDINGen."),
+        description=_(
+            "Geeft alle VERZENDINGen terug als newline delimited JSON (één object "
+            "per regel), zonder paginering. Deze lijst kan gefilterd worden met "
+            "dezelfde query-string parameters als de lijst-operatie."
+        ),
+    ),
 )
 class VerzendingViewSet(
+    ReadReplicaMixin,
     CheckQueryParamsMixin,
+    ExportMixin,
+    ListFilterByAuthorizationsMixin,
     viewsets.ModelViewSet,
 ):
 
     global_description = _("Opvragen en bewerken van VERZENDINGen.")
 
-    queryset = Verzending.objects.select_related("informatieobject")
+    queryset = Verzending.objects.select_related("informatieobject").order_by("pk")
     serializer_class = VerzendingSerializer
     pagination_class = PageNumberPagination
     filterset_class = VerzendingFilter
@@ -61,6 +74,7 @@ class VerzendingViewSet(
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "export": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "create": SCOPE_DOCUMENTEN_AANMAKEN,
         "destroy": SCOPE_DOCUMENTEN_ALLES_VERWIJDEREN,
         "update": SCOPE_DOCUMENTEN_BIJWERKEN,
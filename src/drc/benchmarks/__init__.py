@@ -0,0 +1,8 @@
+"""
+Performance benchmarks of the API.
+
+The scenarios in :mod:`drc.benchmarks.scenarios` are run by the ``benchmark``
+management command against a test database, with the remote APIs replaced by
+the stand-ins in :mod:`drc.benchmarks.stubs`. The benchmarks use the factories
+of the test suite, so they require the testing requirements.
+"""
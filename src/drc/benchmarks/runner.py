@@ -0,0 +1,180 @@
+"""
+Run the scenarios and compare the results with a baseline.
+
+Per scenario, the latency percentiles, the number of database queries and
+calls to the remote APIs per request, the bytes in the request and response
+and the peak memory allocated by a request are recorded.
+"""
+import math
+import time
+import tracemalloc
+from typing import Dict, List
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+from vng_api_common.tests import JWTAuthMixin, generate_jwt_auth
+
+from .scenarios import Request, Scenario
+
+# metrics of which any increase is a regression
+COUNTED = ("queries", "remote_calls")
+# metrics of which an increase beyond the tolerance is a regression
+MEASURED = ("p95", "bytes", "memory")
+
+
+def percentile(values: List[float], percent: int) -> float:
+    """
+    Return the nearest-rank percentile of the values.
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def get_client(scenario: Scenario) -> APIClient:
+    client_id = f"benchmark-{scenario.name}"
+    JWTAuthMixin._create_credentials(
+        client_id,
+        "benchmark",
+        heeft_alle_autorisaties=scenario.heeft_alle_autorisaties,
+        max_vertrouwelijkheidaanduiding=scenario.max_vertrouwelijkheidaanduiding,
+        scopes=scenario.scopes,
+        informatieobjecttype=scenario.informatieobjecttype,
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=generate_jwt_auth(client_id, "benchmark"))
+    return client
+
+
+def perform_request(scenario: Scenario, client: APIClient, request: Request):
+    """
+    Perform the request of the scenario, returning the response and its content.
+    """
+    response = getattr(client, request.method)(
+        request.path, request.data, format=request.format
+    )
+    content = response.getvalue()
+
+    if response.status_code != request.status:
+        raise AssertionError(
+            f"{scenario.name}: expected status {request.status}, "
+            f"got {response.status_code}: {content[:500]!r}"
+        )
+    return response, content
+
+
+def measure_memory(scenario: Scenario, client: APIClient) -> int:
+    """
+    Return the peak memory in kilobytes allocated during a request.
+
+    Unlike the maximum resident set size of the process, this doesn't include
+    the memory of earlier scenarios. Tracing slows down the allocations, so
+    it's a separate request.
+    """
+    request = scenario.get_request()
+    tracemalloc.start()
+    try:
+        perform_request(scenario, client, request)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak // 1024
+
+
+def run_scenario(scenario: Scenario, iterations: int, warmup: int) -> dict:
+    """
+    Run the request of the scenario and return its metrics.
+
+    The counts of queries, remote calls and bytes are the maximum over the
+    iterations, the latencies are in milliseconds.
+    """
+    with override_settings(**scenario.settings):
+        scenario.setup()
+        client = get_client(scenario)
+
+        timings, queries, remote_calls, sizes = [], [], [], []
+        for iteration in range(warmup + iterations):
+            request = scenario.get_request()
+            calls = scenario.stubs.calls
+
+            # the log is limited, so it stops growing after many queries
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response, content = perform_request(scenario, client, request)
+                duration = time.perf_counter() - start
+
+            if iteration < warmup:
+                continue
+
+            timings.append(duration * 1000)
+            queries.append(len(context.captured_queries))
+            remote_calls.append(scenario.stubs.calls - calls)
+            sizes.append(
+                int(response.request.get("CONTENT_LENGTH") or 0) + len(content)
+            )
+
+        memory = measure_memory(scenario, client)
+
+    return {
+        "p50": round(percentile(timings, 50), 2),
+        "p95": round(percentile(timings, 95), 2),
+        "queries": max(queries),
+        "remote_calls": max(remote_calls),
+        "bytes": max(sizes),
+        "memory": memory,
+        "latency": scenario.stubs.latency * 1000,
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float):
+    """
+    Return the regressions of the results compared with the baseline.
+
+    Latencies are only compared if the remote APIs had the same latency.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+
+        for metric in COUNTED:
+            if result[metric] > expected[metric]:
+                regressions.append(
+                    f"{name}: {metric} increased from {expected[metric]} "
+                    f"to {result[metric]}"
+                )
+
+        for metric in MEASURED:
+            # baselines of older versions lack the metric
+            if metric not in expected:
+                continue
+            if metric == "p95" and result["latency"] != expected["latency"]:
+                continue
+            if result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} increased from {expected[metric]} "
+                    f"to {result[metric]}"
+                )
+
+    return regressions
+
+
+def format_results(results: Dict[str, dict]) -> str:
+    columns = ("p50", "p95", "queries", "remote_calls", "bytes", "memory")
+    width = max([len("scenario")] + [len(name) for name in results])
+    lines = [
+        "  ".join(["scenario".ljust(width)] + [column.rjust(12) for column in columns])
+    ]
+    for name, result in results.items():
+        lines.append(
+            "  ".join(
+                [name.ljust(width)]
+                + [str(result[column]).rjust(12) for column in columns]
+            )
+        )
+    return "\n".join(lines)
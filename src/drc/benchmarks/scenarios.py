@@ -0,0 +1,292 @@
+"""
+The benchmarked scenarios.
+
+Each scenario creates its data in :meth:`Scenario.setup` and describes the
+benchmarked request in :meth:`Scenario.get_request`, which is called before
+every iteration. Data for requests that change it (e.g. an upload) is created
+in :meth:`Scenario.get_request`, outside of the measurement.
+"""
+import base64
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from django.core.files.base import ContentFile
+
+from rest_framework import status
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from drc.api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+
+from .stubs import StubServer
+
+KB = 1024
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    data: Any = None
+    format: Optional[str] = None
+    status: int = status.HTTP_200_OK
+
+
+class Scenario:
+    """
+    A benchmarked request, with the data and authorizations it needs.
+    """
+
+    name = ""
+    settings: Dict[str, Any] = {}
+
+    heeft_alle_autorisaties = True
+    scopes: List[str] = []
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.zeer_geheim
+
+    def __init__(self, stubs: StubServer):
+        self.stubs = stubs
+        self.informatieobjecttype = stubs.get_resource_url(
+            "ztc", "informatieobjecttypen"
+        )
+
+    def setup(self) -> None:
+        pass
+
+    def get_request(self) -> Request:
+        raise NotImplementedError
+
+    def get_eio_data(self, **kwargs) -> dict:
+        return {
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-06-27",
+            "titel": "benchmark",
+            "auteur": "benchmark",
+            "formaat": "txt",
+            "taal": "nld",
+            "bestandsnaam": "benchmark.bin",
+            "informatieobjecttype": self.informatieobjecttype,
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            **kwargs,
+        }
+
+
+class ListScenario(Scenario):
+    name = "list"
+
+    def setup(self):
+        EnkelvoudigInformatieObjectFactory.create_batch(
+            100, informatieobjecttype=self.informatieobjecttype
+        )
+
+    def get_request(self):
+        return Request("get", reverse("enkelvoudiginformatieobject-list"))
+
+
+class FilteredListScenario(ListScenario):
+    """
+    List the documents with an autorisatie on one informatieobjecttype, of
+    which half of the documents are confidential.
+    """
+
+    name = "list-filtered"
+    heeft_alle_autorisaties = False
+    scopes = [SCOPE_DOCUMENTEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    def setup(self):
+        super().setup()
+        EnkelvoudigInformatieObjectFactory.create_batch(
+            50,
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        EnkelvoudigInformatieObjectFactory.create_batch(
+            50,
+            informatieobjecttype=self.stubs.get_resource_url(
+                "ztc", "informatieobjecttypen"
+            ),
+        )
+
+
+class DetailScenario(Scenario):
+    name = "detail"
+
+    def setup(self):
+        self.eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype
+        )
+
+    def get_request(self):
+        return Request("get", reverse(self.eio))
+
+
+class ZoekScenario(Scenario):
+    name = "zoek"
+
+    def setup(self):
+        eios = EnkelvoudigInformatieObjectFactory.create_batch(
+            100, informatieobjecttype=self.informatieobjecttype
+        )
+        self.uuids = [str(eio.uuid) for eio in eios[::2]]
+
+    def get_request(self):
+        return Request(
+            "post",
+            reverse("enkelvoudiginformatieobject--zoek"),
+            {"uuid__in": self.uuids},
+        )
+
+
+class CreateScenario(Scenario):
+    name = "create"
+
+    def setup(self):
+        self.inhoud = base64.b64encode(os.urandom(256 * KB)).decode("ascii")
+
+    def get_request(self):
+        return Request(
+            "post",
+            reverse("enkelvoudiginformatieobject-list"),
+            self.get_eio_data(inhoud=self.inhoud, bestandsomvang=256 * KB),
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class CreateLargeFileScenario(Scenario):
+    """
+    Create a document of which the content is uploaded in bestandsdelen.
+    """
+
+    name = "create-bestandsdelen"
+    settings = {"CHUNK_SIZE": 256 * KB}
+
+    def get_request(self):
+        return Request(
+            "post",
+            reverse("enkelvoudiginformatieobject-list"),
+            self.get_eio_data(inhoud=None, bestandsomvang=1024 * KB),
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class UploadBestandsDeelScenario(Scenario):
+    name = "upload-bestandsdeel"
+    settings = {"CHUNK_SIZE": 256 * KB}
+
+    def setup(self):
+        self.content = os.urandom(256 * KB)
+
+    def get_request(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            lock=uuid.uuid4().hex,
+            latest_version__informatieobjecttype=self.informatieobjecttype,
+        )
+        bestandsdeel = BestandsDeelFactory.create(
+            informatieobject=canonical, inhoud="", omvang=256 * KB, volgnummer=1
+        )
+        return Request(
+            "put",
+            reverse(bestandsdeel),
+            {
+                "inhoud": ContentFile(self.content, name="part.bin"),
+                "lock": canonical.lock,
+            },
+            format="multipart",
+        )
+
+
+class UnlockScenario(Scenario):
+    """
+    Unlock a document, which merges its four bestandsdelen.
+    """
+
+    name = "unlock"
+
+    def setup(self):
+        self.content = os.urandom(256 * KB)
+
+    def get_request(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            lock=uuid.uuid4().hex,
+            latest_version__informatieobjecttype=self.informatieobjecttype,
+            latest_version__inhoud="",
+            latest_version__bestandsomvang=1024 * KB,
+        )
+        for volgnummer in range(1, 5):
+            BestandsDeelFactory.create(
+                informatieobject=canonical,
+                inhoud__data=self.content,
+                volgnummer=volgnummer,
+            )
+        return Request(
+            "post",
+            reverse(
+                "enkelvoudiginformatieobject-unlock",
+                kwargs={"uuid": canonical.latest_version.uuid},
+            ),
+            {"lock": canonical.lock},
+            status=status.HTTP_204_NO_CONTENT,
+        )
+
+
+class DownloadScenario(Scenario):
+    name = "download"
+
+    def setup(self):
+        self.eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            inhoud__data=os.urandom(1024 * KB),
+        )
+
+    def get_request(self):
+        return Request(
+            "get",
+            reverse(
+                "enkelvoudiginformatieobject-download", kwargs={"uuid": self.eio.uuid}
+            ),
+        )
+
+
+class CreateObjectInformatieObjectScenario(Scenario):
+    """
+    Relate a document with a zaak, which is validated against the ZRC.
+    """
+
+    name = "create-objectinformatieobject"
+
+    def get_request(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype
+        )
+        return Request(
+            "post",
+            reverse("objectinformatieobject-list"),
+            {
+                "object": self.stubs.get_resource_url("zrc", "zaken"),
+                "informatieobject": f"http://testserver{reverse(eio)}",
+                "objectType": "zaak",
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+SCENARIOS = [
+    ListScenario,
+    FilteredListScenario,
+    DetailScenario,
+    ZoekScenario,
+    CreateScenario,
+    CreateLargeFileScenario,
+    UploadBestandsDeelScenario,
+    UnlockScenario,
+    DownloadScenario,
+    CreateObjectInformatieObjectScenario,
+]
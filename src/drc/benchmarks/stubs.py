@@ -0,0 +1,160 @@
+"""
+In-process stand-ins for the remote APIs.
+
+The Catalogi (ZTC), Zaken (ZRC), Besluiten (BRC) and Notificaties (NRC) APIs
+are served by one HTTP server in a thread, under the ``/ztc/``, ``/zrc/``,
+``/brc/`` and ``/nrc/`` prefixes. Each API serves a minimal OAS schema, so the
+validators and clients talk to them as to the real APIs. Every response is
+delayed by the configured latency, and the requests are counted.
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def _get_schema(resources: list, paths: dict) -> dict:
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Stub", "version": "1.0.0"},
+        "paths": paths,
+        "components": {
+            "schemas": {
+                resource: {
+                    "type": "object",
+                    "required": ["url"],
+                    "properties": {"url": {"type": "string"}},
+                }
+                for resource in resources
+            }
+        },
+    }
+
+
+SCHEMAS = {
+    "ztc": _get_schema(
+        ["InformatieObjectType"],
+        {
+            "/informatieobjecttypen/{uuid}": {
+                "get": {"operationId": "informatieobjecttype_read"}
+            }
+        },
+    ),
+    "zrc": _get_schema(
+        ["Zaak"],
+        {
+            "/zaken/{uuid}": {"get": {"operationId": "zaak_read"}},
+            "/zaakinformatieobjecten": {
+                "get": {"operationId": "zaakinformatieobject_list"}
+            },
+        },
+    ),
+    "brc": _get_schema(
+        ["Besluit"],
+        {
+            "/besluiten/{uuid}": {"get": {"operationId": "besluit_read"}},
+            "/besluitinformatieobjecten": {
+                "get": {"operationId": "besluitinformatieobject_list"}
+            },
+        },
+    ),
+    "nrc": _get_schema(
+        [], {"/notificaties": {"post": {"operationId": "notificaties_create"}}}
+    ),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _handle(self):
+        self.server.add_call()
+        time.sleep(self.server.latency)
+
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        url = urlparse(self.path)
+        status, data = self.server.respond(self.command, url.path, parse_qs(url.query))
+
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Serve the stand-ins of the remote APIs on a free local port.
+
+    The relations of zaken and besluiten with informatieobjecten are empty,
+    unless they are registered in ``relations``. If the request is filtered on
+    an informatieobject, the relation always exists.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.relations = {}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+    def get_url(self, api: str, path: str = "") -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/{api}/api/v1/{path}"
+
+    def get_resource_url(self, api: str, collection: str) -> str:
+        return self.get_url(api, f"{collection}/{uuid.uuid4()}")
+
+    def add_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def respond(self, method: str, path: str, query: dict) -> tuple:
+        api, _, path = path.lstrip("/").partition("/api/v1/")
+
+        if path == "schema/openapi.yaml" and api in SCHEMAS:
+            return 200, SCHEMAS[api]
+
+        if method == "POST":
+            return (201, {}) if (api, path) == ("nrc", "notificaties") else (405, {})
+
+        if path.endswith("informatieobjecten"):
+            object_type = path[: -len("informatieobjecten")]
+            object_url = query.get(object_type, [""])[0]
+            informatieobjecten = query.get("informatieobject") or self.relations.get(
+                object_url, []
+            )
+            return 200, [
+                {
+                    "url": self.get_resource_url(api, path),
+                    object_type: object_url,
+                    "informatieobject": informatieobject,
+                }
+                for informatieobject in informatieobjecten
+            ]
+
+        return 200, {
+            "url": self.get_url(api, path),
+            "concept": False,
+            "vertrouwelijkheidaanduiding": "openbaar",
+        }
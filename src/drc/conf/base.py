@@ -40,6 +40,22 @@ DATABASES = {
     }
 }
 
+# read replicas of the default database, which serve the read-only API requests
+DB_REPLICAS = []
+for index, host in enumerate(
+    filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(","))
+):
+    alias = f"replica_{index + 1}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "OPTIONS": {"connect_timeout": 2},
+        "TEST": {"MIRROR": "default"},
+    }
+    DB_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["drc.utils.db.ReplicaRouter"]
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -80,6 +96,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "drc.utils.middleware.PerformanceMiddleware",
     "drc.utils.middleware.LogHeadersMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
@@ -250,6 +267,11 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": False,
         },
+        "drc.performance": {
+            "handlers": ["performance"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.request": {"handlers": ["django"], "level": "ERROR", "propagate": True},
         "django.template": {
             "handlers": ["console"],
@@ -357,7 +379,17 @@ NOTIFICATIONS_KANAAL = "documenten"
 # settings for private media files
 PRIVATE_MEDIA_ROOT = os.path.join(BASE_DIR, "private-media")
 PRIVATE_MEDIA_URL = "/private-media/"
-SENDFILE_BACKEND = "sendfile.backends.simple"
+# offloads downloads to nginx or Apache, see drc.utils.sendfile
+SENDFILE_BACKEND = os.getenv("SENDFILE_BACKEND", "drc.utils.sendfile")
+# the header handled by the proxy: X-Accel-Redirect (see nginx/), X-Sendfile or
+# empty to send the files from the Python workers
+SENDFILE_PROXY = os.getenv("SENDFILE_PROXY", "X-Accel-Redirect")
+# only enable if the proxy always sets the X-Sendfile-Type request header
+SENDFILE_TRUST_PROXY_HEADER = os.getenv("SENDFILE_TRUST_PROXY_HEADER", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
 SENDFILE_ROOT = PRIVATE_MEDIA_ROOT
 SENDFILE_URL = PRIVATE_MEDIA_URL
 
@@ -371,5 +403,85 @@ DEFAULT_EXTENSION = "bin"
 # next version.
 DATA_UPLOAD_MAX_MEMORY_SIZE = MIN_UPLOAD_SIZE
 
+# spool large uploads next to the private media, so they are moved into place
+# with a rename instead of copied
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "drc.utils.uploadhandlers.PrivateMediaUploadHandler",
+]
+FILE_UPLOAD_TEMP_DIR = os.getenv("FILE_UPLOAD_TEMP_DIR") or None
+
+# number of objects fetched (and serialized) at once by the streaming exports
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 500))
+
+# maximum number of informatieobjecten that can be searched for at once
+ZOEK_MAX_UUIDS = int(os.getenv("ZOEK_MAX_UUIDS", 1000))
+
+# the maximum number of objects created by one request to the bulk endpoints
+BULK_MAX_OBJECTS = int(os.getenv("BULK_MAX_OBJECTS", 100))
+
+# checksum algorithm of the `integriteit` calculated for uploaded content, if
+# the client doesn't provide it. Leave empty to not calculate it.
+INTEGRITEIT_ALGORITME = os.getenv("INTEGRITEIT_ALGORITME", "sha_256")
+
+# storage of the content of the informatieobjecten, use
+# ``drc.utils.storages.ContentAddressedStorage`` to store identical content once
+INHOUD_STORAGE = os.getenv(
+    "INHOUD_STORAGE", "privates.storages.PrivateMediaFileSystemStorage"
+)
+
+# storage of the bestandsdelen of large uploads. Use the same object store as
+# the INHOUD_STORAGE to merge the bestandsdelen server-side
+BESTANDSDELEN_STORAGE = os.getenv(
+    "BESTANDSDELEN_STORAGE", "privates.storages.PrivateMediaFileSystemStorage"
+)
+
+# compress the content of compressible formats at rest, with "gzip" or "zstd",
+# if a sample of the content compresses at least INHOUD_COMPRESSION_MIN_RATIO
+INHOUD_COMPRESSION = os.getenv("INHOUD_COMPRESSION", "")
+INHOUD_COMPRESSION_MIN_RATIO = float(os.getenv("INHOUD_COMPRESSION_MIN_RATIO", 1.5))
+
+# redirect downloads to a (presigned) URL of the storage, if it supports it
+INHOUD_DOWNLOAD_REDIRECT = os.getenv("INHOUD_DOWNLOAD_REDIRECT", "false").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+
+# object store for ``drc.utils.s3.S3Storage``, see django-storages
+AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME")
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL")
+AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME")
+AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
+AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
+AWS_DEFAULT_ACL = None
+AWS_S3_FILE_OVERWRITE = False
+
+# only create a new version of a locked document when it's actually modified,
+# instead of when it's locked
+EIO_COPY_ON_WRITE = os.getenv("EIO_COPY_ON_WRITE", "0").lower() in ["true", "1", "yes"]
+
+# uploads in bestandsdelen without activity for this number of hours are expired
+# by the ``expire_uploads`` command
+UPLOAD_TTL_HOURS = int(os.getenv("UPLOAD_TTL_HOURS", 7 * 24))
+
+# the fraction of the requests of which the performance metrics are logged, and
+# the duration in milliseconds from which requests are always logged (0 to only
+# log the sampled requests)
+PERFORMANCE_LOG_SAMPLE_RATE = float(os.getenv("PERFORMANCE_LOG_SAMPLE_RATE", 0))
+PERFORMANCE_LOG_SLOW_THRESHOLD = int(os.getenv("PERFORMANCE_LOG_SLOW_THRESHOLD", 1000))
+
+# the bearer token Prometheus scrapes /metrics with, the endpoint is disabled if
+# it's empty
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# the maximum replication lag in seconds of a read replica, and the number of
+# seconds a client reads from the primary database after a write
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", 5))
+DB_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", 10))
+# the cache alias which tracks the clients reading from the primary, which must
+# be shared by all processes
+DB_REPLICA_CACHE = os.getenv("DB_REPLICA_CACHE", "default")
+
 # URL for documentation that's shown in API schema
 DOCUMENTATION_URL = "https://vng-realisatie.github.io/gemma-zaken"
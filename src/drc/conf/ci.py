@@ -38,3 +38,11 @@ AXES_BEHIND_REVERSE_PROXY = (
 AXES_CACHE = "axes_cache"
 
 NOTIFICATIONS_DISABLED = True
+
+# the tests read the content of the downloads, there's no proxy sending them
+SENDFILE_PROXY = ""
+
+# a replica mirroring the test database, for the tests of the read replicas
+DATABASES.setdefault(
+    "replica_1", {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+)
@@ -8,6 +8,9 @@ os.environ.setdefault("DB_NAME", "drc")
 os.environ.setdefault("DB_USER", "drc")
 os.environ.setdefault("DB_PASSWORD", "drc")
 
+# the development server runs without a proxy sending the files
+os.environ.setdefault("SENDFILE_PROXY", "")
+
 os.environ.setdefault("ZTC_JWT_SECRET", "drc-to-ztc")
 os.environ.setdefault("ZRC_JWT_SECRET", "drc-to-zrc")
 
@@ -38,7 +38,13 @@ CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     # https://github.com/jazzband/django-axes/blob/master/docs/configuration.rst#cache-problems
     "axes_cache": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    # shared by the uwsgi processes, see docker_start.sh
+    "replicas": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "replica_cache",
+    },
 }
+DB_REPLICA_CACHE = getenv("DB_REPLICA_CACHE", "replicas")
 
 # Deal with being hosted on a subpath
 subpath = getenv("SUBPATH")
@@ -83,9 +89,6 @@ SESSION_COOKIE_SECURE = getenv("SESSION_COOKIE_SECURE", False)
 SESSION_COOKIE_HTTPONLY = getenv("SESSION_COOKIE_HTTPONLY", False)
 CSRF_COOKIE_SECURE = getenv("CSRF_COOKIE_SECURE", False)
 
-# requires an nginx container running in front
-SENDFILE_BACKEND = getenv("SENDFILE_BACKEND", "sendfile.backends.nginx")
-
 #
 # Custom settings
 #
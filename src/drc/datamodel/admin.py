@@ -1,9 +1,15 @@
 from django.contrib import admin
+from django.db.models import OuterRef, Subquery
 from django.utils.translation import gettext_lazy as _
 
 from privates.admin import PrivateMediaMixin
 
 from drc.datamodel.forms import VerzendingForm
+from drc.utils.admin import (
+    AutocompleteFilter,
+    AutocompleteFilterMixin,
+    EstimatedCountPaginator,
+)
 
 from .models import (
     BestandsDeel,
@@ -15,6 +21,35 @@ from .models import (
 )
 
 
+def latest_version(field: str, canonical: str = "informatieobject") -> Subquery:
+    """
+    Select the ``field`` of the latest version of the related document.
+    """
+    versions = EnkelvoudigInformatieObject.objects.filter(
+        canonical=OuterRef(canonical)
+    ).order_by("-versie", "-pk")
+    return Subquery(versions.values(field)[:1])
+
+
+class InformatieobjectAdminMixin(AutocompleteFilterMixin):
+    """
+    Display the related document without querying its latest version per row.
+    """
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(informatieobject_identificatie=latest_version("identificatie"))
+        )
+
+    def get_informatieobject_display(self, obj) -> str:
+        return obj.informatieobject_identificatie
+
+    get_informatieobject_display.short_description = _("informatieobject")
+    get_informatieobject_display.admin_order_field = "informatieobject"
+
+
 class GebruiksrechtenInline(admin.TabularInline):
     model = Gebruiksrechten
     extra = 1
@@ -31,10 +66,25 @@ def unlock(modeladmin, request, queryset):
 
 @admin.register(EnkelvoudigInformatieObjectCanonical)
 class EnkelvoudigInformatieObjectCanonicalAdmin(PrivateMediaMixin, admin.ModelAdmin):
-    list_display = ["__str__", "get_not_lock_display"]
+    list_display = ["get_identificatie_display", "get_not_lock_display"]
+    search_fields = ("^enkelvoudiginformatieobject__identificatie",)
     inlines = [EnkelvoudigInformatieObjectInline, GebruiksrechtenInline]
     private_media_fields = ("inhoud",)
     actions = [unlock]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(latest_identificatie=latest_version("identificatie", "pk"))
+        )
+
+    def get_identificatie_display(self, obj) -> str:
+        return obj.latest_identificatie
+
+    get_identificatie_display.short_description = _("identificatie")
 
     def get_not_lock_display(self, obj) -> bool:
         return not bool(obj.lock)
@@ -50,31 +100,51 @@ class EnkelvoudigInformatieObjectAdmin(admin.ModelAdmin):
     search_fields = ("identificatie", "uuid")
     ordering = ("-begin_registratie",)
     raw_id_fields = ("canonical",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(ObjectInformatieObject)
-class ObjectInformatieObjectAdmin(admin.ModelAdmin):
-    list_display = ["informatieobject", "object", "__str__"]
-    list_select_related = ("informatieobject",)
-    search_fields = ("informatieobject__titel", "object")
+class ObjectInformatieObjectAdmin(InformatieobjectAdminMixin, admin.ModelAdmin):
+    list_display = ["get_informatieobject_display", "object", "__str__"]
+    search_fields = ("object",)
+    raw_id_fields = ("informatieobject",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # used by ``__str__``
+        return super().get_queryset(request).annotate(titel=latest_version("titel"))
 
 
 @admin.register(Gebruiksrechten)
-class GebruiksrechtenAdmin(admin.ModelAdmin):
-    list_display = ("uuid", "informatieobject")
-    list_filter = ("informatieobject",)
+class GebruiksrechtenAdmin(InformatieobjectAdminMixin, admin.ModelAdmin):
+    list_display = ("uuid", "get_informatieobject_display")
+    list_filter = (("informatieobject", AutocompleteFilter),)
     raw_id_fields = ("informatieobject",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(BestandsDeel)
-class BestandsDeelAdmin(PrivateMediaMixin, admin.ModelAdmin):
-    list_display = ("__str__", "informatieobject", "volgnummer", "voltooid")
-    list_filter = ("informatieobject",)
+class BestandsDeelAdmin(
+    InformatieobjectAdminMixin, PrivateMediaMixin, admin.ModelAdmin
+):
+    list_display = (
+        "__str__",
+        "get_informatieobject_display",
+        "volgnummer",
+        "voltooid",
+    )
+    list_filter = (("informatieobject", AutocompleteFilter),)
+    autocomplete_fields = ("informatieobject",)
     private_media_fields = ("inhoud",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Verzending)
-class VerzendingAdmin(admin.ModelAdmin):
+class VerzendingAdmin(AutocompleteFilterMixin, admin.ModelAdmin):
     form = VerzendingForm
 
     list_display = (
@@ -86,7 +156,7 @@ class VerzendingAdmin(admin.ModelAdmin):
     )
     list_filter = (
         "aard_relatie",
-        "informatieobject",
+        ("informatieobject", AutocompleteFilter),
     )
     ordering = (
         "-verzenddatum",
@@ -97,6 +167,8 @@ class VerzendingAdmin(admin.ModelAdmin):
         "uuid",
     )
     raw_id_fields = ("informatieobject",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     readonly_fields = ("uuid",)
 
@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from notifications_api_common.models import NotificationsConfig
+from vng_api_common.oas import fetcher
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+DEFAULT_BASELINE = os.path.join(
+    settings.DJANGO_PROJECT_DIR, "benchmarks", "baseline.json"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API against a test database, with local stand-ins for the "
+        "remote APIs, and compare the results with a baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="The number of measured requests per scenario (default: 20)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="The number of requests per scenario before measuring (default: 2)",
+        )
+        parser.add_argument(
+            "--latency",
+            type=int,
+            default=0,
+            help="The response time of the remote APIs in milliseconds (default: 0)",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Only run this scenario, can be repeated",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=DEFAULT_BASELINE,
+            help="The file with the baseline results (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Save the results as the baseline instead of comparing them",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.5,
+            help=(
+                "The allowed relative increase of the latency, bytes and memory "
+                "usage (default: 0.5)"
+            ),
+        )
+
+    def handle(self, **options):
+        try:
+            from drc.benchmarks.runner import compare, format_results, run_scenario
+            from drc.benchmarks.scenarios import SCENARIOS
+            from drc.benchmarks.stubs import SCHEMAS, StubServer
+        except ImportError as exc:
+            raise CommandError(
+                f"The benchmarks require the testing requirements: {exc}"
+            )
+
+        scenarios = [
+            scenario
+            for scenario in SCENARIOS
+            if not options["scenarios"] or scenario.name in options["scenarios"]
+        ]
+        if not scenarios:
+            raise CommandError(
+                "Unknown scenario, choose from: "
+                + ", ".join(scenario.name for scenario in SCENARIOS)
+            )
+
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with StubServer(latency=options["latency"] / 1000) as stubs:
+                with tempfile.TemporaryDirectory() as private_media:
+                    # the validators fetch the schemas of the configured APIs
+                    with patch.dict(
+                        fetcher.cache,
+                        {
+                            settings.ZTC_API_SPEC: SCHEMAS["ztc"],
+                            settings.ZRC_API_SPEC: SCHEMAS["zrc"],
+                            settings.BRC_API_SPEC: SCHEMAS["brc"],
+                        },
+                    ), override_settings(
+                        PRIVATE_MEDIA_ROOT=private_media,
+                        SENDFILE_ROOT=private_media,
+                        NOTIFICATIONS_DISABLED=False,
+                    ):
+                        self._configure_notifications(stubs)
+                        results = {}
+                        for scenario in scenarios:
+                            results[scenario.name] = run_scenario(
+                                scenario(stubs),
+                                options["iterations"],
+                                options["warmup"],
+                            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(format_results(results))
+
+        if options["save_baseline"]:
+            with open(options["baseline"], "w") as baseline_file:
+                json.dump(results, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write("\n")
+            self.stdout.write(f"Saved the baseline in {options['baseline']}")
+            return
+
+        if not os.path.exists(options["baseline"]):
+            self.stdout.write("No baseline to compare with.")
+            return
+
+        with open(options["baseline"]) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        if regressions := compare(results, baseline, options["tolerance"]):
+            raise CommandError("Performance regressions:\n" + "\n".join(regressions))
+        self.stdout.write("No regressions compared with the baseline.")
+
+    @staticmethod
+    def _configure_notifications(stubs) -> None:
+        service = Service.objects.create(
+            label="Notificaties API",
+            api_type=APITypes.nrc,
+            api_root=stubs.get_url("nrc"),
+            oas=stubs.get_url("nrc", "schema/openapi.yaml"),
+            auth_type=AuthTypes.no_auth,
+        )
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = service
+        config.save()
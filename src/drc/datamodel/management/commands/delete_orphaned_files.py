@@ -0,0 +1,204 @@
+import os
+import time
+from datetime import timedelta
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from humanize import naturalsize
+
+from drc.datamodel.models import BestandsDeel, EnkelvoudigInformatieObject
+from drc.utils.storages import (
+    ContentAddressedStorage,
+    bestandsdelen_storage,
+    inhoud_storage,
+)
+from drc.utils.uploadhandlers import UPLOAD_TEMP_DIR
+
+# the directories with the files of this app - other apps, such as
+# simple_certmanager, store their files in the same private media
+OWNED_DIRECTORIES = sorted(
+    {
+        EnkelvoudigInformatieObject._meta.get_field("inhoud").upload_to.split("/")[0],
+        BestandsDeel._meta.get_field("inhoud").upload_to.split("/")[0],
+        ContentAddressedStorage.prefix,
+        UPLOAD_TEMP_DIR,
+    }
+)
+
+
+def walk(storage, start_after: Tuple[str, ...] = (), path: str = "") -> Iterator[str]:
+    """
+    Yield the names of all files in the storage, in a stable order.
+
+    The files are ordered by their path components, so a walk can be resumed
+    after the file ``start_after`` without listing the directories before it.
+    """
+    try:
+        dirs, files = storage.listdir(path)
+    except FileNotFoundError:
+        return
+    entries = sorted(
+        [(name, True) for name in dirs] + [(name, False) for name in files]
+    )
+
+    for entry, is_dir in entries:
+        name = f"{path}/{entry}" if path else entry
+        parts = tuple(name.split("/"))
+
+        # skip everything before the file to resume after, except the
+        # directories which contain it
+        if parts <= start_after and start_after[: len(parts)] != parts:
+            continue
+
+        if is_dir:
+            yield from walk(storage, start_after, name)
+        elif parts != start_after:
+            yield name
+
+
+def walk_owned(storage, start_after: Tuple[str, ...] = ()) -> Iterator[str]:
+    """
+    Yield the names of the files in the directories of this app, in a stable order.
+    """
+    for directory in OWNED_DIRECTORIES:
+        yield from walk(storage, start_after, directory)
+
+
+def get_referenced_names(names: List[str]) -> set:
+    references = set(
+        EnkelvoudigInformatieObject.objects.filter(inhoud__in=names).values_list(
+            "inhoud", flat=True
+        )
+    )
+    references.update(
+        BestandsDeel.objects.filter(inhoud__in=names).values_list("inhoud", flat=True)
+    )
+    return references
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the files in the private media which aren't referenced by any "
+        "document or bestandsdeel anymore"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-period",
+            type=int,
+            default=24,
+            help="Keep files modified in the last number of hours (default: 24)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of files checked with one query (default: 1000)",
+        )
+        parser.add_argument(
+            "--max-files",
+            type=int,
+            help="Stop after checking this number of files",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "File to save the progress in. The next run resumes after the "
+                "last checked file, until all files are checked."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the files which would be deleted",
+        )
+
+    def handle(self, **options):
+        self.verbosity = options["verbosity"]
+        self.dry_run = options["dry_run"]
+        self.cutoff = timezone.now() - timedelta(hours=options["grace_period"])
+        checkpoint = options["checkpoint"]
+        start_after = self._read_checkpoint(checkpoint)
+
+        # the content and bestandsdelen can be stored in the same storage
+        storages = []
+        for storage in [inhoud_storage(), bestandsdelen_storage()]:
+            if storage.deconstruct() not in [s.deconstruct() for s in storages]:
+                storages.append(storage)
+
+        self.checked = self.deleted = self.freed = 0
+        start = time.monotonic()
+        last_name = None
+        finished = True
+
+        for index, storage in enumerate(storages):
+            if start_after and start_after[0] > index:
+                continue
+            resume = start_after[1] if start_after and start_after[0] == index else ""
+
+            names = walk_owned(storage, tuple(resume.split("/")) if resume else ())
+            if options["max_files"] is not None:
+                names = islice(names, options["max_files"] - self.checked)
+
+            while batch := list(islice(names, options["batch_size"])):
+                self._collect(storage, batch)
+                last_name = (index, batch[-1])
+                self._write_checkpoint(checkpoint, last_name)
+
+            if (
+                options["max_files"] is not None
+                and self.checked >= options["max_files"]
+            ):
+                finished = False
+                break
+
+        if finished and checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        elapsed = time.monotonic() - start
+        rate = self.checked / elapsed if elapsed else 0
+        action = "Would delete" if self.dry_run else "Deleted"
+        self.stdout.write(
+            f"Checked {self.checked} files in {elapsed:.1f}s ({rate:.0f} files/s). "
+            f"{action} {self.deleted} files, {naturalsize(self.freed, binary=True)}."
+        )
+        if not finished:
+            self.stdout.write(
+                "Stopped before all files are checked, run the command again with "
+                "the same checkpoint to continue."
+            )
+
+    def _collect(self, storage, names: List[str]) -> None:
+        self.checked += len(names)
+        references = get_referenced_names(names)
+
+        for name in names:
+            if name in references:
+                continue
+            if storage.get_modified_time(name) > self.cutoff:
+                continue
+
+            size = storage.size(name)
+            if self.verbosity >= 2:
+                self.stdout.write(f"  {name} ({naturalsize(size, binary=True)})")
+            if not self.dry_run:
+                storage.delete(name)
+
+            self.deleted += 1
+            self.freed += size
+
+    def _read_checkpoint(self, checkpoint: Optional[str]) -> Optional[Tuple[int, str]]:
+        if not checkpoint or not os.path.exists(checkpoint):
+            return None
+
+        with open(checkpoint) as checkpoint_file:
+            index, name = checkpoint_file.read().strip().split(":", 1)
+        return int(index), name
+
+    def _write_checkpoint(self, checkpoint: Optional[str], last_name) -> None:
+        if checkpoint and not self.dry_run:
+            with open(checkpoint, "w") as checkpoint_file:
+                checkpoint_file.write(f"{last_name[0]}:{last_name[1]}")
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from drc.api.utils import delete_files
+from drc.datamodel.models import BestandsDeel, EnkelvoudigInformatieObjectCanonical
+
+
+class Command(BaseCommand):
+    help = (
+        "Expire the uploads in bestandsdelen without activity during the "
+        "UPLOAD_TTL_HOURS: delete the uploaded bestandsdelen and unlock the "
+        "documents"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of uploads expired per transaction (default: 100)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of expired uploads",
+        )
+
+    def handle(self, **options):
+        cutoff = timezone.now() - timedelta(hours=settings.UPLOAD_TTL_HOURS)
+        expired = EnkelvoudigInformatieObjectCanonical.objects.filter(
+            upload_activity__lt=cutoff
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(f"{expired.count()} uploads are expired.")
+            return
+
+        count = 0
+        while batch := self._expire_batch(expired, options["batch_size"]):
+            count += batch
+        self.stdout.write(f"Expired {count} uploads.")
+
+    @transaction.atomic
+    def _expire_batch(self, expired, batch_size: int) -> int:
+        # skip the uploads expired by a concurrent run
+        canonicals = list(
+            expired.select_for_update(skip_locked=True).order_by("upload_activity")[
+                :batch_size
+            ]
+        )
+        if not canonicals:
+            return 0
+
+        bestandsdelen = BestandsDeel.objects.filter(informatieobject__in=canonicals)
+        storage = BestandsDeel._meta.get_field("inhoud").storage
+        file_names = [
+            name for name in bestandsdelen.values_list("inhoud", flat=True) if name
+        ]
+        bestandsdelen.delete()
+        transaction.on_commit(lambda: delete_files(storage, file_names))
+
+        for canonical in canonicals:
+            # the size of the incomplete content is unknown, as with a forced unlock
+            eio = canonical.latest_version
+            if not eio.inhoud:
+                eio.bestandsomvang = None
+                eio.save()
+
+            canonical.lock = ""
+            canonical.copy_on_write = False
+            canonical.upload_activity = None
+            canonical.save()
+
+        return len(canonicals)
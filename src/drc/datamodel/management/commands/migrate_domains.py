@@ -1,5 +1,8 @@
 from django.apps import apps
 from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
 
 ZRC = ("https://ref.tst.vng.cloud/zrc/", "https://zaken-api.vng.cloud/")
 DRC = ("https://ref.tst.vng.cloud/drc/", "https://documenten-api.vng.cloud/")
@@ -41,13 +44,66 @@ MAPPING = BASE_MAPPING + (
 class Command(BaseCommand):
     help = "Update data references from old to new domains"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of objects updated per transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of objects to update",
+        )
+
     def handle(self, **options):
         for model, field, old, new in MAPPING:
             self.stdout.write(f"Migrating {model}.{field}")
             model = apps.get_model(model)
 
             objects = model.objects.filter(**{f"{field}__startswith": old})
-            self.stdout.write(f"  Updating {objects.count()} objects...\n\n")
-            for obj in objects:
-                setattr(obj, field, getattr(obj, field).replace(old, new, 1))
-                obj.save()
+            # don't migrate the objects of an earlier run again
+            if new.startswith(old):
+                objects = objects.exclude(**{f"{field}__startswith": new})
+
+            total = objects.count()
+            if options["dry_run"]:
+                self.stdout.write(f"  {total} objects to update.\n\n")
+                continue
+
+            self.stdout.write(f"  Updating {total} objects...")
+            if not total:
+                self.stdout.write("\n")
+                continue
+
+            updated, last_pk = 0, None
+            while pks := self._get_batch(objects, last_pk, options["batch_size"]):
+                updated += self._update_batch(objects, pks, field, old, new)
+                last_pk = pks[-1]
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"  {updated}/{total} objects updated")
+            self.stdout.write(f"  Updated {updated} objects.\n\n")
+
+    def _get_batch(self, objects, last_pk, batch_size: int) -> list:
+        if last_pk is not None:
+            objects = objects.filter(pk__gt=last_pk)
+        return list(objects.order_by("pk").values_list("pk", flat=True)[:batch_size])
+
+    @transaction.atomic
+    def _update_batch(self, objects, pks: list, field: str, old: str, new: str) -> int:
+        """
+        Replace the old domain in a single ``UPDATE``, without saving the objects.
+        """
+        model = objects.model
+        values = {
+            field: Concat(
+                Value(new),
+                Substr(F(field), len(old) + 1),
+                output_field=model._meta.get_field(field),
+            )
+        }
+        # the ETags are recalculated on the next request of the objects
+        if any(f.name == "_etag" for f in model._meta.get_fields()):
+            values["_etag"] = ""
+        return objects.filter(pk__in=pks).update(**values)
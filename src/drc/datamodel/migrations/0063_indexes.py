@@ -0,0 +1,51 @@
+# Generated by Django 3.2.13 on 2026-10-19 10:32
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the indexes are built without locking the tables for writes, which can not
+    # be done inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0062_auto_20230222_1424"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["canonical", "-versie"], name="eio_canonical_versie_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["informatieobjecttype"],
+                include=("vertrouwelijkheidaanduiding", "canonical"),
+                name="eio_informatieobjecttype_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="gebruiksrechten",
+            index=models.Index(fields=["startdatum"], name="gebruiksrechten_start_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="gebruiksrechten",
+            index=models.Index(
+                condition=models.Q(("einddatum__isnull", False)),
+                fields=["einddatum"],
+                name="gebruiksrechten_eind_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="objectinformatieobject",
+            index=models.Index(fields=["object"], name="oio_object_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="verzending",
+            index=models.Index(fields=["betrokkene"], name="verzending_betrokkene_idx"),
+        ),
+    ]
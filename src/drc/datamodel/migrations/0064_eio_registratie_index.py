@@ -0,0 +1,22 @@
+# Generated by Django 3.2.13 on 2026-10-19 10:35
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0063_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["canonical", "begin_registratie"],
+                name="eio_canonical_registratie_idx",
+            ),
+        ),
+    ]
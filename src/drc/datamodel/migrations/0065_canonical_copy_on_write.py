@@ -0,0 +1,21 @@
+# Generated by Django 3.2.13 on 2026-10-19 10:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0064_eio_registratie_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="copy_on_write",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates that the next modification of the locked document creates a new version. Only used if `EIO_COPY_ON_WRITE` is enabled.",
+            ),
+        ),
+    ]
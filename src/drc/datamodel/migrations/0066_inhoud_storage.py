@@ -0,0 +1,30 @@
+# Generated by Django 3.2.13 on 2026-10-19 10:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+import privates.fields
+
+import drc.utils.storages
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0065_canonical_copy_on_write"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="enkelvoudiginformatieobject",
+            name="inhoud",
+            field=privates.fields.PrivateMediaFileField(
+                storage=drc.utils.storages.inhoud_storage, upload_to="uploads/%Y/%m/"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(fields=["inhoud"], name="eio_inhoud_idx"),
+        ),
+    ]
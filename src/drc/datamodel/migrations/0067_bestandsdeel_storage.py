@@ -0,0 +1,27 @@
+# Generated by Django 3.2.13 on 2026-10-19 10:54
+
+from django.db import migrations
+
+import privates.fields
+
+import drc.utils.storages
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0066_inhoud_storage"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bestandsdeel",
+            name="inhoud",
+            field=privates.fields.PrivateMediaFileField(
+                blank=True,
+                help_text="De (binaire) bestandsinhoud van dit specifieke bestandsdeel.",
+                storage=drc.utils.storages.bestandsdelen_storage,
+                upload_to="part-uploads/%Y/%m/",
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 3.2.13 on 2026-10-19 11:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def start_upload_activity(apps, schema_editor):
+    """
+    Let the uploads in progress expire after the TTL from now on.
+    """
+    EnkelvoudigInformatieObjectCanonical = apps.get_model(
+        "datamodel.EnkelvoudigInformatieObjectCanonical"
+    )
+    EnkelvoudigInformatieObjectCanonical.objects.filter(
+        bestandsdelen__isnull=False
+    ).update(upload_activity=timezone.now())
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0067_bestandsdeel_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="upload_activity",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The moment of the last activity of the upload in bestandsdelen, which is still in progress. Uploads without activity during the `UPLOAD_TTL_HOURS` are expired.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(start_upload_activity, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            index=models.Index(
+                condition=models.Q(("upload_activity__isnull", False)),
+                fields=["upload_activity"],
+                name="canonical_upload_activity_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 3.2.13 on 2026-10-19 11:52
+
+from django.db import migrations, models
+from django.db.models import Max
+from django.db.models.functions import Substr
+
+PREFIX = "DOCUMENT"
+
+
+def seed_counters(apps, schema_editor):
+    """
+    Continue numbering after the highest identificatie issued in each year.
+    """
+    EnkelvoudigInformatieObject = apps.get_model(
+        "datamodel.EnkelvoudigInformatieObject"
+    )
+    IdentificatieTeller = apps.get_model("datamodel.IdentificatieTeller")
+
+    issued = (
+        EnkelvoudigInformatieObject.objects.filter(
+            identificatie__regex=rf"^{PREFIX}-\d{{4}}-\d{{10}}$"
+        )
+        .annotate(jaar=Substr("identificatie", len(PREFIX) + 2, 4))
+        .values("jaar")
+        .annotate(max_identificatie=Max("identificatie"))
+    )
+    IdentificatieTeller.objects.bulk_create(
+        IdentificatieTeller(
+            prefix=PREFIX,
+            jaar=int(row["jaar"]),
+            nummer=int(row["max_identificatie"][-10:]),
+        )
+        for row in issued
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0068_canonical_upload_activity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdentificatieTeller",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("prefix", models.CharField(max_length=20)),
+                ("jaar", models.PositiveSmallIntegerField()),
+                (
+                    "nummer",
+                    models.PositiveBigIntegerField(
+                        help_text="The last number issued in the year."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "identificatie teller",
+                "verbose_name_plural": "identificatie tellers",
+                "unique_together": {("prefix", "jaar")},
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.13 on 2026-10-19 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0069_identificatie_teller"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="inhoud_encoding",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="The encoding (`gzip` or `zstd`) of the stored content, if it's compressed by the API because of `INHOUD_COMPRESSION`.",
+                max_length=10,
+                verbose_name="inhoud encoding",
+            ),
+        ),
+    ]
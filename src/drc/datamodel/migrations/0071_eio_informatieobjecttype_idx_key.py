@@ -0,0 +1,33 @@
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # the covering index of 0063 needs INCLUDE, which PostgreSQL 10 ignores - the
+    # covered columns are moved into the key of the index
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0070_eio_inhoud_encoding"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            name="eio_informatieobjecttype_idx",
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=[
+                    "informatieobjecttype",
+                    "vertrouwelijkheidaanduiding",
+                    "canonical",
+                ],
+                name="eio_informatieobjecttype_idx",
+            ),
+        ),
+    ]
@@ -4,6 +4,7 @@ from .enkelvoudig_informatieobject import (  # noqa
     EnkelvoudigInformatieObjectCanonical,
 )
 from .gebruiksrechten import Gebruiksrechten  # noqa
+from .identificatie import IdentificatieTeller  # noqa
 from .informatieobject import InformatieObject  # noqa
 from .object_informatieobject import ObjectInformatieObject  # noqa
 from .verzending import Verzending  # noqa
@@ -6,6 +6,8 @@ from django.utils.translation import ugettext_lazy as _
 
 from privates.fields import PrivateMediaFileField
 
+from drc.utils.storages import bestandsdelen_storage
+
 
 class BestandsDeel(models.Model):
     uuid = models.UUIDField(
@@ -25,6 +27,7 @@ class BestandsDeel(models.Model):
     )
     inhoud = PrivateMediaFileField(
         upload_to="part-uploads/%Y/%m/",
+        storage=bestandsdelen_storage,
         blank=True,
         help_text=_("De (binaire) bestandsinhoud van dit specifieke bestandsdeel."),
     )
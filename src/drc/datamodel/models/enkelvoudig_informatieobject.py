@@ -2,6 +2,7 @@ import uuid as _uuid
 
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from privates.fields import PrivateMediaFileField
@@ -9,6 +10,8 @@ from vng_api_common.caching import ETagMixin
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.models import APIMixin
 
+from drc.utils.storages import inhoud_storage
+
 from ..constants import ChecksumAlgoritmes
 from .informatieobject import InformatieObject
 
@@ -24,6 +27,32 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         max_length=100,
         help_text=_("Hash string, which represents id of the lock"),
     )
+    copy_on_write = models.BooleanField(
+        default=False,
+        help_text=_(
+            "Indicates that the next modification of the locked document creates "
+            "a new version. Only used if `EIO_COPY_ON_WRITE` is enabled."
+        ),
+    )
+    upload_activity = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_(
+            "The moment of the last activity of the upload in bestandsdelen, "
+            "which is still in progress. Uploads without activity during the "
+            "`UPLOAD_TTL_HOURS` are expired."
+        ),
+    )
+
+    class Meta:
+        indexes = [
+            # selecting the expired uploads
+            models.Index(
+                fields=["upload_activity"],
+                condition=models.Q(upload_activity__isnull=False),
+                name="canonical_upload_activity_idx",
+            ),
+        ]
 
     def __str__(self):
         return str(self.latest_version)
@@ -43,6 +72,15 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         empty_parts = self.bestandsdelen.filter(inhoud="")
         return empty_parts.count() == self.bestandsdelen.count()
 
+    def touch_upload(self) -> None:
+        """
+        Record activity of the upload in bestandsdelen.
+        """
+        self.upload_activity = timezone.now()
+        EnkelvoudigInformatieObjectCanonical.objects.filter(pk=self.pk).update(
+            upload_activity=self.upload_activity
+        )
+
 
 class EnkelvoudigInformatieObject(ETagMixin, APIMixin, InformatieObject):
     """
@@ -95,7 +133,17 @@ class EnkelvoudigInformatieObject(ETagMixin, APIMixin, InformatieObject):
         help_text=_("Aantal bytes dat de inhoud van INFORMATIEOBJECT in beslag neemt."),
     )
 
-    inhoud = PrivateMediaFileField(upload_to="uploads/%Y/%m/")
+    inhoud = PrivateMediaFileField(upload_to="uploads/%Y/%m/", storage=inhoud_storage)
+    inhoud_encoding = models.CharField(
+        _("inhoud encoding"),
+        max_length=10,
+        blank=True,
+        default="",
+        help_text=_(
+            "The encoding (`gzip` or `zstd`) of the stored content, if it's "
+            "compressed by the API because of `INHOUD_COMPRESSION`."
+        ),
+    )
 
     link = models.URLField(
         max_length=200,
@@ -150,3 +198,27 @@ class EnkelvoudigInformatieObject(ETagMixin, APIMixin, InformatieObject):
 
     class Meta:
         unique_together = ("uuid", "versie")
+        indexes = [
+            # selecting the latest version of each document (DISTINCT ON canonical)
+            models.Index(
+                fields=["canonical", "-versie"], name="eio_canonical_versie_idx"
+            ),
+            # selecting the version valid at a given moment (registratieOp)
+            models.Index(
+                fields=["canonical", "begin_registratie"],
+                name="eio_canonical_registratie_idx",
+            ),
+            # filtering on the authorizations, covers the lookup of the canonicals
+            # for the related resources. The covered columns are part of the key,
+            # since INCLUDE requires PostgreSQL 11
+            models.Index(
+                fields=[
+                    "informatieobjecttype",
+                    "vertrouwelijkheidaanduiding",
+                    "canonical",
+                ],
+                name="eio_informatieobjecttype_idx",
+            ),
+            # counting the references to a file
+            models.Index(fields=["inhoud"], name="eio_inhoud_idx"),
+        ]
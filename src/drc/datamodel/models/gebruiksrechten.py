@@ -5,7 +5,8 @@ from django.utils.translation import ugettext_lazy as _
 
 from vng_api_common.caching import ETagMixin
 
-from ..query import InformatieobjectRelatedQuerySet
+from ..query import GebruiksrechtenQuerySet
+from .enkelvoudig_informatieobject import EnkelvoudigInformatieObject
 
 
 class Gebruiksrechten(ETagMixin, models.Model):
@@ -40,33 +41,39 @@ class Gebruiksrechten(ETagMixin, models.Model):
         ),
     )
 
-    objects = InformatieobjectRelatedQuerySet.as_manager()
+    objects = GebruiksrechtenQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("gebruiksrecht informatieobject")
         verbose_name_plural = _("gebruiksrechten informatieobject")
+        indexes = [
+            models.Index(fields=["startdatum"], name="gebruiksrechten_start_idx"),
+            # open-ended gebruiksrechten can not match a filter on the einddatum
+            models.Index(
+                fields=["einddatum"],
+                condition=models.Q(einddatum__isnull=False),
+                name="gebruiksrechten_eind_idx",
+            ),
+        ]
 
     def __str__(self):
         return str(self.informatieobject.latest_version)
 
     @transaction.atomic
     def save(self, *args, **kwargs):
-        informatieobject_versie = self.informatieobject.latest_version
-        # ensure the indication is set properly on the IO
-        if not informatieobject_versie.indicatie_gebruiksrecht:
-            informatieobject_versie.indicatie_gebruiksrecht = True
-            informatieobject_versie.save()
         super().save(*args, **kwargs)
+        # ensure the indication is set properly on the IO
+        EnkelvoudigInformatieObject.objects.update_indicatie_gebruiksrecht(
+            [self.informatieobject_id]
+        )
 
     @transaction.atomic
     def delete(self, *args, **kwargs):
-        super().delete(*args, **kwargs)
-        informatieobject = self.informatieobject
-        other_gebruiksrechten = informatieobject.gebruiksrechten_set.exclude(pk=self.pk)
-        if not other_gebruiksrechten.exists():
-            informatieobject_versie = self.informatieobject.latest_version
-            informatieobject_versie.indicatie_gebruiksrecht = None
-            informatieobject_versie.save()
+        result = super().delete(*args, **kwargs)
+        EnkelvoudigInformatieObject.objects.update_indicatie_gebruiksrecht(
+            [self.informatieobject_id]
+        )
+        return result
 
     def unique_representation(self):
         informatieobject = self.informatieobject.latest_version
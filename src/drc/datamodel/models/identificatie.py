@@ -0,0 +1,84 @@
+from django.db import connections, models, router
+from django.utils.translation import ugettext_lazy as _
+
+
+class IdentificatieTellerManager(models.Manager):
+    def reserve(self, prefix: str, jaar: int, count: int = 1) -> int:
+        """
+        Reserve ``count`` consecutive numbers for the year, returning the first.
+
+        The counter is incremented with a single upsert, which locks the row of
+        the year until the transaction ends, so concurrent transactions never
+        issue the same number. Numbers of transactions which are rolled back
+        are not reused.
+        """
+        table = self.model._meta.db_table
+        with self.db_connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (prefix, jaar, nummer) VALUES (%s, %s, %s)
+                ON CONFLICT (prefix, jaar)
+                DO UPDATE SET nummer = {table}.nummer + EXCLUDED.nummer
+                RETURNING nummer
+                """,
+                [prefix, jaar, count],
+            )
+            (last,) = cursor.fetchone()
+        return last - count + 1
+
+    def register(self, prefix: str, jaar: int, nummer: int) -> None:
+        """
+        Make sure numbers up to ``nummer`` are not issued for the year anymore.
+
+        Used for the identificaties supplied by clients in the generated format.
+        The upsert locks the row of the year even if it doesn't advance the
+        counter, so the counter is read first: numbers which were issued
+        already don't make concurrent transactions wait for the row.
+        """
+        connection = self.db_connection
+        current = (
+            self.using(connection.alias)
+            .filter(prefix=prefix, jaar=jaar)
+            .values_list("nummer", flat=True)
+            .first()
+        )
+        if current is not None and current >= nummer:
+            return
+
+        table = self.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (prefix, jaar, nummer) VALUES (%s, %s, %s)
+                ON CONFLICT (prefix, jaar)
+                DO UPDATE SET nummer = EXCLUDED.nummer
+                WHERE {table}.nummer < EXCLUDED.nummer
+                """,
+                [prefix, jaar, nummer],
+            )
+
+    @property
+    def db_connection(self):
+        return connections[router.db_for_write(self.model)]
+
+
+class IdentificatieTeller(models.Model):
+    """
+    The last issued number of the generated ``identificatie`` per year.
+    """
+
+    prefix = models.CharField(max_length=20)
+    jaar = models.PositiveSmallIntegerField()
+    nummer = models.PositiveBigIntegerField(
+        help_text=_("The last number issued in the year.")
+    )
+
+    objects = IdentificatieTellerManager()
+
+    class Meta:
+        verbose_name = _("identificatie teller")
+        verbose_name_plural = _("identificatie tellers")
+        unique_together = ("prefix", "jaar")
+
+    def __str__(self):
+        return f"{self.prefix}-{self.jaar}: {self.nummer}"
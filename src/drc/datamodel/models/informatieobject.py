@@ -1,14 +1,18 @@
+import re
+from collections import defaultdict
+from typing import Iterable
+
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import RSINField, VertrouwelijkheidsAanduidingField
-from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
 from ..constants import OndertekeningSoorten, Statussen
 from ..query import InformatieobjectQuerySet
 from ..validators import validate_status
+from .identificatie import IdentificatieTeller
 
 
 class InformatieObject(models.Model):
@@ -156,10 +160,43 @@ class InformatieObject(models.Model):
         return self.identificatie
 
     def save(self, *args, **kwargs):
-        if not self.identificatie:
-            self.identificatie = generate_unique_identification(self, "creatiedatum")
+        if self._state.adding or not self.identificatie:
+            self.assign_identificaties([self])
         super().save(*args, **kwargs)
 
+    @classmethod
+    def assign_identificaties(cls, objs: Iterable["InformatieObject"]) -> None:
+        """
+        Generate the missing ``identificatie`` values, numbered per year.
+
+        The numbers are issued by the :class:`IdentificatieTeller` of the year,
+        with one query per year instead of one per object. Supplied
+        identificaties in the generated format advance the counter, so they're
+        not issued again.
+        """
+        prefix = cls.IDENTIFICATIE_PREFIX
+        pattern = re.compile(rf"^{re.escape(prefix)}-(\d{{4}})-(\d{{10}})$")
+
+        missing = defaultdict(list)
+        supplied = defaultdict(int)
+        for obj in objs:
+            if not obj.identificatie:
+                missing[obj.creatiedatum.year].append(obj)
+            elif match := pattern.match(obj.identificatie):
+                jaar, nummer = int(match.group(1)), int(match.group(2))
+                supplied[jaar] = max(supplied[jaar], nummer)
+
+        # lock the counters in a fixed order, to avoid deadlocks
+        for jaar in sorted(missing.keys() | supplied.keys()):
+            if jaar in supplied:
+                IdentificatieTeller.objects.register(prefix, jaar, supplied[jaar])
+            if jaar in missing:
+                first = IdentificatieTeller.objects.reserve(
+                    prefix, jaar, len(missing[jaar])
+                )
+                for nummer, obj in enumerate(missing[jaar], start=first):
+                    obj.identificatie = f"{prefix}-{jaar}-{nummer:010d}"
+
     def clean(self):
         super().clean()
         validate_status(
@@ -44,6 +44,7 @@ class ObjectInformatieObject(ETagMixin, APIMixin, models.Model):
         verbose_name = "Oobject-informatieobject"
         verbose_name_plural = "object-informatieobjecten"
         unique_together = ("informatieobject", "object")
+        indexes = [models.Index(fields=["object"], name="oio_object_idx")]
 
     def __str__(self):
         return self.get_title()
@@ -8,6 +8,7 @@ from vng_api_common.caching.models import ETagMixin
 from vng_api_common.descriptors import GegevensGroepType
 
 from ..constants import AfzenderTypes, PostAdresTypes
+from ..query import InformatieobjectRelatedQuerySet
 from ..validators import validate_postal_code
 
 
@@ -306,9 +307,14 @@ class Verzending(ETagMixin, models.Model):
         required=False,
     )
 
+    objects = InformatieobjectRelatedQuerySet.as_manager()
+
     def __str__(self):
         return _("Verzending %(uuid)s") % {"uuid": str(self.uuid)}
 
     class Meta:
         verbose_name = _("Verzending")
         verbose_name_plural = _("Verzendingen")
+        indexes = [
+            models.Index(fields=["betrokkene"], name="verzending_betrokkene_idx")
+        ]
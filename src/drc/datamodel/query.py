@@ -1,6 +1,9 @@
+from typing import List
+
 from django.apps import apps
-from django.db import models
-from django.db.models import Case, IntegerField, Value, When
+from django.db import connection, models, transaction
+from django.db.models import Case, Exists, IntegerField, OuterRef, Q, Value, When
+from django.db.models.expressions import RawSQL
 
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
@@ -97,8 +100,126 @@ class AuthorizationsFilterMixin:
 
 
 class InformatieobjectQuerySet(AuthorizationsFilterMixin, models.QuerySet):
-    pass
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Generate the missing ``identificatie`` values, as ``save`` does.
+        """
+        objs = list(objs)
+        self.model.assign_identificaties(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def update_indicatie_gebruiksrecht(self, canonicals) -> int:
+        """
+        Update the ``indicatie_gebruiksrecht`` of the latest versions of the documents.
+
+        The indication is ``True`` if the document has gebruiksrechten, and
+        ``None`` otherwise. Only the versions of which the indication changes
+        are updated, with a single ``UPDATE`` - the documents aren't saved, so
+        their ``begin_registratie`` doesn't change. Their ETag is cleared, to be
+        recalculated on the next request.
+        """
+        Gebruiksrechten = apps.get_model("datamodel", "Gebruiksrechten")
+        latest_versions = (
+            self.model._default_manager.filter(canonical__in=canonicals)
+            .order_by("canonical", "-versie", "-pk")
+            .distinct("canonical")
+            .values("pk")
+        )
+        has_gebruiksrechten = Exists(
+            Gebruiksrechten.objects.filter(informatieobject=OuterRef("canonical"))
+        )
+        changed = Q(has_gebruiksrechten, ~Q(indicatie_gebruiksrecht=True)) | Q(
+            ~has_gebruiksrechten, indicatie_gebruiksrecht__isnull=False
+        )
+        return (
+            self.filter(pk__in=latest_versions)
+            .filter(changed)
+            .update(
+                indicatie_gebruiksrecht=Case(
+                    When(has_gebruiksrechten, then=Value(True)), default=Value(None)
+                ),
+                _etag="",
+            )
+        )
+
+    def for_references(self, references: List[dict]) -> models.QuerySet:
+        """
+        Select the referenced versions of the informatieobjecten.
+
+        Each reference is a dict with an ``uuid`` and optionally a ``versie``
+        and/or ``registratie_op``, selecting the latest version matching these
+        (in the same way as the query parameters of the detail endpoint).
+
+        The references are passed to the database as arrays, which are joined
+        against the ``(uuid, versie)`` index - the size of the query does not
+        grow with the number of references. The results are ordered as the
+        references. A version selected by several references is returned once,
+        at the position of the first of these references.
+        """
+        uuids = [reference["uuid"] for reference in references]
+        versies = [reference.get("versie") for reference in references]
+        registratie_ops = [reference.get("registratie_op") for reference in references]
+        params = (uuids, versies, registratie_ops)
+
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        selected = f"""
+            SELECT DISTINCT ON (ref.position) eio.id
+            FROM unnest(%s::uuid[], %s::integer[], %s::timestamptz[])
+                WITH ORDINALITY AS ref(uuid, versie, registratie_op, position)
+            INNER JOIN {table} eio ON eio.uuid = ref.uuid
+            WHERE (ref.versie IS NULL OR eio.versie = ref.versie)
+                AND (
+                    ref.registratie_op IS NULL
+                    OR eio.begin_registratie <= ref.registratie_op
+                )
+            ORDER BY ref.position, eio.versie DESC
+        """
+        # the selected ids in the order of the references, which is evaluated once
+        position = RawSQL(
+            f"array_position(ARRAY({selected}), {table}.id)",
+            params,
+            output_field=IntegerField(),
+        )
+        return (
+            self.filter(pk__in=RawSQL(selected, params))
+            .annotate(_position=position)
+            .order_by("_position")
+        )
 
 
 class InformatieobjectRelatedQuerySet(AuthorizationsFilterMixin, models.QuerySet):
     authorizations_lookup = "informatieobject"
+
+
+class GebruiksrechtenQuerySet(InformatieobjectRelatedQuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Update the ``indicatie_gebruiksrecht`` of the documents, as ``save`` does.
+        """
+        EnkelvoudigInformatieObject = apps.get_model(
+            "datamodel", "EnkelvoudigInformatieObject"
+        )
+        with transaction.atomic(using=self.db, savepoint=False):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            EnkelvoudigInformatieObject.objects.update_indicatie_gebruiksrecht(
+                {obj.informatieobject_id for obj in objs}
+            )
+        return objs
+
+    def delete(self):
+        """
+        Update the ``indicatie_gebruiksrecht`` of the documents, as ``delete`` does.
+        """
+        EnkelvoudigInformatieObject = apps.get_model(
+            "datamodel", "EnkelvoudigInformatieObject"
+        )
+        with transaction.atomic(using=self.db, savepoint=False):
+            canonicals = set(self.values_list("informatieobject", flat=True))
+            result = super().delete()
+            EnkelvoudigInformatieObject.objects.update_indicatie_gebruiksrecht(
+                canonicals
+            )
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
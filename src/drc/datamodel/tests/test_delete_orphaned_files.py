@@ -0,0 +1,119 @@
+import os
+import tempfile
+from datetime import datetime
+from io import StringIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from privates.storages import PrivateMediaFileSystemStorage
+from privates.test import temp_private_root
+
+from .factories import BestandsDeelFactory, EnkelvoudigInformatieObjectFactory
+
+
+class DeleteOrphanedFilesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # a private media root per test
+        override = temp_private_root()
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.storage = PrivateMediaFileSystemStorage()
+
+    def _create_file(self, name: str, old: bool = True) -> str:
+        name = self.storage.save(name, ContentFile(b"some data"))
+        if old:
+            timestamp = datetime(2020, 1, 1).timestamp()
+            os.utime(self.storage.path(name), (timestamp, timestamp))
+        return name
+
+    def _get_files(self) -> set:
+        return {
+            os.path.relpath(os.path.join(root, file_name), settings.PRIVATE_MEDIA_ROOT)
+            for root, _, file_names in os.walk(settings.PRIVATE_MEDIA_ROOT)
+            for file_name in file_names
+        }
+
+    def test_delete_unreferenced_files(self):
+        EnkelvoudigInformatieObjectFactory.create()
+        BestandsDeelFactory.create()
+        referenced = self._get_files()
+        timestamp = datetime(2020, 1, 1).timestamp()
+        for name in referenced:
+            os.utime(self.storage.path(name), (timestamp, timestamp))
+        orphan = self._create_file("uploads/2020/01/orphan.bin")
+        part_orphan = self._create_file("part-uploads/2020/01/orphan.bin")
+        stdout = StringIO()
+
+        call_command("delete_orphaned_files", stdout=stdout)
+
+        self.assertEqual(self._get_files(), referenced)
+        self.assertFalse(self.storage.exists(orphan))
+        self.assertFalse(self.storage.exists(part_orphan))
+        self.assertIn(f"Checked {len(referenced) + 2} files", stdout.getvalue())
+        self.assertIn("Deleted 2 files", stdout.getvalue())
+
+    def test_grace_period(self):
+        recent = self._create_file("uploads/2020/01/recent.bin", old=False)
+
+        call_command("delete_orphaned_files", stdout=StringIO())
+
+        self.assertTrue(self.storage.exists(recent))
+
+    def test_dry_run(self):
+        orphan = self._create_file("uploads/2020/01/orphan.bin")
+        stdout = StringIO()
+
+        call_command("delete_orphaned_files", dry_run=True, stdout=stdout)
+
+        self.assertTrue(self.storage.exists(orphan))
+        self.assertIn("Would delete 1 files", stdout.getvalue())
+
+    def test_keep_files_of_other_apps(self):
+        # simple_certmanager stores the certificates in the private media
+        key = self._create_file("ssl_certs_keys/2025/01/01/client.key")
+        certificate = self._create_file("ssl_certs_keys/2025/01/01/client.crt")
+        orphan = self._create_file("uploads/2020/01/orphan.bin")
+        stdout = StringIO()
+
+        call_command("delete_orphaned_files", stdout=stdout)
+
+        self.assertTrue(self.storage.exists(key))
+        self.assertTrue(self.storage.exists(certificate))
+        self.assertFalse(self.storage.exists(orphan))
+        self.assertIn("Checked 1 files", stdout.getvalue())
+
+    def test_resume_from_checkpoint(self):
+        names = [
+            self._create_file(f"uploads/2020/{month:02}/orphan.bin")
+            for month in range(1, 6)
+        ]
+        checkpoint = os.path.join(tempfile.mkdtemp(), "checkpoint")
+
+        call_command(
+            "delete_orphaned_files",
+            max_files=2,
+            batch_size=1,
+            checkpoint=checkpoint,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(self._get_files(), set(names[2:]))
+        self.assertTrue(os.path.exists(checkpoint))
+
+        stdout = StringIO()
+        call_command(
+            "delete_orphaned_files",
+            max_files=10,
+            checkpoint=checkpoint,
+            stdout=stdout,
+        )
+
+        self.assertEqual(self._get_files(), set())
+        self.assertIn("Checked 3 files", stdout.getvalue())
+        self.assertFalse(os.path.exists(checkpoint))
@@ -0,0 +1,85 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+from privates.test import temp_private_root
+
+from ..models import BestandsDeel
+from .factories import BestandsDeelFactory, EnkelvoudigInformatieObjectFactory
+
+
+@temp_private_root()
+@override_settings(UPLOAD_TTL_HOURS=24)
+class ExpireUploadsTests(TestCase):
+    def _create_upload(self, hours_ago: int):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None,
+            bestandsomvang=18,
+            canonical__lock="some-lock",
+            canonical__upload_activity=timezone.now() - timedelta(hours=hours_ago),
+        )
+        part = BestandsDeelFactory.create(informatieobject=eio.canonical, volgnummer=1)
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=2, inhoud=None, omvang=9
+        )
+        return eio, part
+
+    def test_expire_stale_upload(self):
+        eio, part = self._create_upload(hours_ago=25)
+        storage = part.inhoud.storage
+        stdout = StringIO()
+
+        with capture_on_commit_callbacks(execute=True):
+            call_command("expire_uploads", stdout=stdout)
+
+        eio.refresh_from_db()
+        eio.canonical.refresh_from_db()
+        self.assertEqual(eio.canonical.lock, "")
+        self.assertIsNone(eio.canonical.upload_activity)
+        self.assertIsNone(eio.canonical.latest_version.bestandsomvang)
+        self.assertFalse(BestandsDeel.objects.exists())
+        self.assertFalse(storage.exists(part.inhoud.name))
+        self.assertIn("Expired 1 uploads", stdout.getvalue())
+
+    def test_keep_active_upload(self):
+        eio, part = self._create_upload(hours_ago=1)
+
+        call_command("expire_uploads", stdout=StringIO())
+
+        eio.canonical.refresh_from_db()
+        self.assertEqual(eio.canonical.lock, "some-lock")
+        self.assertEqual(BestandsDeel.objects.count(), 2)
+
+    def test_dry_run(self):
+        eio, part = self._create_upload(hours_ago=25)
+        stdout = StringIO()
+
+        call_command("expire_uploads", dry_run=True, stdout=stdout)
+
+        eio.canonical.refresh_from_db()
+        self.assertEqual(eio.canonical.lock, "some-lock")
+        self.assertIn("1 uploads are expired", stdout.getvalue())
+
+    def test_batches(self):
+        for _ in range(3):
+            self._create_upload(hours_ago=25)
+        stdout = StringIO()
+
+        call_command("expire_uploads", batch_size=2, stdout=stdout)
+
+        self.assertFalse(BestandsDeel.objects.exists())
+        self.assertIn("Expired 3 uploads", stdout.getvalue())
+
+    def test_touch_upload(self):
+        eio, part = self._create_upload(hours_ago=25)
+
+        eio.canonical.touch_upload()
+
+        eio.canonical.refresh_from_db()
+        self.assertAlmostEqual(
+            eio.canonical.upload_activity, timezone.now(), delta=timedelta(seconds=5)
+        )
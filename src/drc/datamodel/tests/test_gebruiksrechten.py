@@ -0,0 +1,84 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import EnkelvoudigInformatieObject, Gebruiksrechten
+from .factories import EnkelvoudigInformatieObjectFactory, GebruiksrechtenFactory
+
+
+class IndicatieGebruiksrechtTests(TestCase):
+    def test_create_updates_latest_version(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        latest = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, versie=2, uuid=eio.uuid
+        )
+        latest.calculate_etag_value()
+        begin_registratie = latest.begin_registratie
+
+        GebruiksrechtenFactory.create(informatieobject=eio.canonical)
+
+        eio.refresh_from_db()
+        latest.refresh_from_db()
+        self.assertIsNone(eio.indicatie_gebruiksrecht)
+        self.assertTrue(latest.indicatie_gebruiksrecht)
+        self.assertEqual(latest._etag, "")
+        # the document isn't saved
+        self.assertEqual(latest.begin_registratie, begin_registratie)
+
+    def test_unchanged_indication_not_updated(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        GebruiksrechtenFactory.create(informatieobject=eio.canonical)
+        eio.calculate_etag_value()
+
+        GebruiksrechtenFactory.create(informatieobject=eio.canonical)
+
+        eio.refresh_from_db()
+        self.assertTrue(eio.indicatie_gebruiksrecht)
+        self.assertNotEqual(eio._etag, "")
+
+    def test_delete_last_gebruiksrecht(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        first, last = GebruiksrechtenFactory.create_batch(
+            2, informatieobject=eio.canonical
+        )
+
+        first.delete()
+        eio.refresh_from_db()
+        self.assertTrue(eio.indicatie_gebruiksrecht)
+
+        last.delete()
+        eio.refresh_from_db()
+        self.assertIsNone(eio.indicatie_gebruiksrecht)
+
+    def test_bulk_create(self):
+        eios = EnkelvoudigInformatieObjectFactory.create_batch(3)
+        gebruiksrechten = [
+            Gebruiksrechten(
+                informatieobject=eio.canonical,
+                omschrijving_voorwaarden="voorwaarden",
+                startdatum=timezone.now(),
+            )
+            for eio in eios
+        ]
+
+        # the insert and the update of the documents
+        with self.assertNumQueries(2):
+            Gebruiksrechten.objects.bulk_create(gebruiksrechten)
+
+        self.assertEqual(
+            EnkelvoudigInformatieObject.objects.filter(
+                indicatie_gebruiksrecht=True
+            ).count(),
+            3,
+        )
+
+    def test_queryset_delete(self):
+        eio, other = EnkelvoudigInformatieObjectFactory.create_batch(2)
+        GebruiksrechtenFactory.create(informatieobject=eio.canonical)
+        GebruiksrechtenFactory.create(informatieobject=other.canonical)
+
+        Gebruiksrechten.objects.filter(informatieobject=eio.canonical).delete()
+
+        eio.refresh_from_db()
+        other.refresh_from_db()
+        self.assertIsNone(eio.indicatie_gebruiksrecht)
+        self.assertTrue(other.indicatie_gebruiksrecht)
@@ -1,8 +1,17 @@
 from datetime import date
+from importlib import import_module
 
+from django.apps import apps
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from ..models import EnkelvoudigInformatieObject, EnkelvoudigInformatieObjectCanonical
+from ..models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    IdentificatieTeller,
+)
+from .factories import EnkelvoudigInformatieObjectFactory
 
 
 class EIOTests(TestCase):
@@ -29,3 +38,80 @@ class EIOTests(TestCase):
         )
 
         self.assertEqual(eio2.identificatie, "DOCUMENT-2019-0000000016")
+
+    def test_counter_per_year(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2019-0000000015"
+        )
+        eios = EnkelvoudigInformatieObjectFactory.build_batch(
+            3, identificatie="", creatiedatum=date(2019, 7, 1)
+        )
+        eios.append(
+            EnkelvoudigInformatieObjectFactory.build(
+                identificatie="", creatiedatum=date(2020, 1, 1)
+            )
+        )
+
+        with self.assertNumQueries(2):
+            EnkelvoudigInformatieObject.assign_identificaties(eios)
+
+        self.assertEqual(
+            [eio.identificatie for eio in eios],
+            [
+                "DOCUMENT-2019-0000000016",
+                "DOCUMENT-2019-0000000017",
+                "DOCUMENT-2019-0000000018",
+                "DOCUMENT-2020-0000000001",
+            ],
+        )
+        self.assertEqual(
+            IdentificatieTeller.objects.get(prefix="DOCUMENT", jaar=2019).nummer, 18
+        )
+
+    def test_supplied_lower_number(self):
+        IdentificatieTeller.objects.create(prefix="DOCUMENT", jaar=2019, nummer=20)
+        eio = EnkelvoudigInformatieObjectFactory.build(
+            identificatie="DOCUMENT-2019-0000000003"
+        )
+
+        # the counter isn't locked by an upsert
+        with CaptureQueriesContext(connection) as queries:
+            EnkelvoudigInformatieObject.assign_identificaties([eio])
+
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("SELECT"))
+        self.assertEqual(
+            IdentificatieTeller.objects.get(prefix="DOCUMENT", jaar=2019).nummer, 20
+        )
+
+    def test_supplied_higher_number(self):
+        IdentificatieTeller.objects.create(prefix="DOCUMENT", jaar=2019, nummer=20)
+
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2019-0000000030"
+        )
+
+        self.assertEqual(
+            IdentificatieTeller.objects.get(prefix="DOCUMENT", jaar=2019).nummer, 30
+        )
+
+    def test_seed_counters(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2018-0000000100"
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2018-0000000007"
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2019-0000000002"
+        )
+        EnkelvoudigInformatieObjectFactory.create(identificatie="OTHER-2019-1")
+        IdentificatieTeller.objects.all().delete()
+
+        migration = import_module("drc.datamodel.migrations.0069_identificatie_teller")
+        migration.seed_counters(apps, None)
+
+        self.assertEqual(
+            set(IdentificatieTeller.objects.values_list("prefix", "jaar", "nummer")),
+            {("DOCUMENT", 2018, 100), ("DOCUMENT", 2019, 2)},
+        )
@@ -0,0 +1,117 @@
+"""
+Guarantee that the frequently used queries are backed by an index.
+
+The test tables are (nearly) empty, so sequential scans are disabled for the
+planner - if no index can be used, the query plan still contains a sequential
+scan.
+"""
+import uuid
+from datetime import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import (
+    EnkelvoudigInformatieObject,
+    Gebruiksrechten,
+    ObjectInformatieObject,
+    Verzending,
+)
+
+
+class IndexUsageTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # only applies to the transaction of the test
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertIndexUsed(self, queryset, index: str = ""):
+        """
+        Assert the query is answered using an index, ``index`` if given.
+        """
+        plan = queryset.explain().lower()
+        table = queryset.model._meta.db_table
+
+        self.assertNotIn(f"seq scan on {table}", plan)
+        # the planner may also fall back to a full scan of an unrelated index
+        if index:
+            self.assertRegex(plan, rf"(using|bitmap index scan on) {index}\b")
+
+    def test_eio_latest_versions(self):
+        queryset = EnkelvoudigInformatieObject.objects.order_by(
+            "canonical", "-versie"
+        ).distinct("canonical")
+
+        self.assertIndexUsed(queryset, "eio_canonical_versie_idx")
+
+    def test_eio_detail(self):
+        queryset = (
+            EnkelvoudigInformatieObject.objects.filter(uuid=uuid.uuid4())
+            .order_by("canonical", "-versie")
+            .distinct("canonical")
+        )
+
+        self.assertIndexUsed(queryset)
+
+    def test_eio_versions(self):
+        queryset = EnkelvoudigInformatieObject.objects.filter(canonical=1).order_by(
+            "versie"
+        )
+
+        self.assertIndexUsed(queryset, "eio_canonical_versie_idx")
+
+    def test_eio_registratie_op(self):
+        # with a single estimated row sorting is free, the index must make the sort
+        # unnecessary
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_sort = off")
+
+        queryset = EnkelvoudigInformatieObject.objects.filter(
+            canonical=1,
+            begin_registratie__lte=timezone.make_aware(datetime(2022, 1, 1)),
+        ).order_by("-begin_registratie")[:1]
+
+        self.assertIndexUsed(queryset, "eio_canonical_registratie_idx")
+
+    def test_eio_authorizations(self):
+        queryset = EnkelvoudigInformatieObject.objects.filter(
+            informatieobjecttype__in=["https://example.com/informatieobjecttype/1"]
+        ).values("canonical", "vertrouwelijkheidaanduiding")
+
+        self.assertIndexUsed(queryset, "eio_informatieobjecttype_idx")
+        # the index covers the selected columns, also on PostgreSQL 10
+        self.assertIn(
+            "index only scan using eio_informatieobjecttype_idx",
+            queryset.explain().lower(),
+        )
+
+    def test_oio_object(self):
+        queryset = ObjectInformatieObject.objects.filter(
+            object="https://example.com/zaken/1"
+        )
+
+        self.assertIndexUsed(queryset, "oio_object_idx")
+
+    def test_verzending_betrokkene(self):
+        queryset = Verzending.objects.filter(
+            betrokkene="https://example.com/betrokkenen/1"
+        )
+
+        self.assertIndexUsed(queryset, "verzending_betrokkene_idx")
+
+    def test_gebruiksrechten_startdatum(self):
+        queryset = Gebruiksrechten.objects.filter(
+            startdatum__gte=timezone.make_aware(datetime(2022, 1, 1))
+        )
+
+        self.assertIndexUsed(queryset, "gebruiksrechten_start_idx")
+
+    def test_gebruiksrechten_einddatum(self):
+        queryset = Gebruiksrechten.objects.filter(
+            einddatum__lt=timezone.make_aware(datetime(2022, 1, 1))
+        )
+
+        self.assertIndexUsed(queryset, "gebruiksrechten_eind_idx")
@@ -0,0 +1,92 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import EnkelvoudigInformatieObject
+from .factories import EnkelvoudigInformatieObjectFactory
+
+OLD = "https://ref.tst.vng.cloud/drc/"
+NEW = "https://documenten-api.vng.cloud/"
+
+
+class MigrateDomainsTests(TestCase):
+    def test_migrate_in_batches(self):
+        eios = [
+            EnkelvoudigInformatieObjectFactory.create(
+                informatieobjecttype=f"{OLD}api/v1/informatieobjecttypen/{i}"
+            )
+            for i in range(3)
+        ]
+        other = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://example.com/api/v1/informatieobjecttypen/1"
+        )
+        for eio in eios + [other]:
+            eio.calculate_etag_value()
+        stdout = StringIO()
+
+        mapping = (
+            ("datamodel.EnkelvoudigInformatieObject", "informatieobjecttype", OLD, NEW),
+        )
+
+        # a count, and per batch a select of the primary keys and an update in
+        # a savepoint
+        with patch(
+            "drc.datamodel.management.commands.migrate_domains.MAPPING", mapping
+        ):
+            with self.assertNumQueries(10):
+                call_command("migrate_domains", batch_size=2, stdout=stdout)
+
+        for i, eio in enumerate(eios):
+            eio.refresh_from_db()
+            self.assertEqual(
+                eio.informatieobjecttype, f"{NEW}api/v1/informatieobjecttypen/{i}"
+            )
+            self.assertEqual(eio._etag, "")
+        other.refresh_from_db()
+        self.assertEqual(
+            other.informatieobjecttype,
+            "https://example.com/api/v1/informatieobjecttypen/1",
+        )
+        self.assertNotEqual(other._etag, "")
+        self.assertIn("Updated 3 objects.", stdout.getvalue())
+
+    def test_dry_run(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=f"{OLD}api/v1/informatieobjecttypen/1"
+        )
+        stdout = StringIO()
+
+        call_command("migrate_domains", dry_run=True, stdout=stdout)
+
+        eio.refresh_from_db()
+        self.assertEqual(
+            eio.informatieobjecttype, f"{OLD}api/v1/informatieobjecttypen/1"
+        )
+        self.assertIn("1 objects to update.", stdout.getvalue())
+
+    def test_new_domain_below_old_domain(self):
+        mapping = (
+            (
+                "datamodel.EnkelvoudigInformatieObject",
+                "informatieobjecttype",
+                "https://example.com/",
+                "https://example.com/v2/",
+            ),
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://example.com/informatieobjecttypen/1"
+        )
+
+        with patch(
+            "drc.datamodel.management.commands.migrate_domains.MAPPING", mapping
+        ):
+            call_command("migrate_domains", stdout=StringIO())
+            # running again doesn't migrate the objects twice
+            call_command("migrate_domains", stdout=StringIO())
+
+        self.assertEqual(
+            EnkelvoudigInformatieObject.objects.get().informatieobjecttype,
+            "https://example.com/v2/informatieobjecttypen/1",
+        )
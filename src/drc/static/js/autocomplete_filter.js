@@ -0,0 +1,16 @@
+'use strict';
+{
+    const $ = django.jQuery;
+
+    $(function() {
+        $('.autocomplete-filter select').on('change', function() {
+            const queryString = $(this).closest('.autocomplete-filter').data('query-string');
+            if (!this.value) {
+                window.location.search = queryString;
+                return;
+            }
+            const separator = queryString === '?' ? '' : '&';
+            window.location.search = `${queryString}${separator}${this.name}=${encodeURIComponent(this.value)}`;
+        });
+    });
+}
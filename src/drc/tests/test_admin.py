@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from privates.test import temp_private_root
+
+from drc.datamodel.models import BestandsDeel
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+    ObjectInformatieObjectFactory,
+)
+from drc.utils.admin import EstimatedCountPaginator
+
+User = get_user_model()
+
+
+@temp_private_root()
+class ChangelistTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        user = User.objects.create_superuser("admin", "admin@example.com", "secret")
+        self.client.force_login(user)
+
+    def _count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_queries_independent_of_rows(self):
+        urls = [
+            reverse("admin:datamodel_enkelvoudiginformatieobjectcanonical_changelist"),
+            reverse("admin:datamodel_bestandsdeel_changelist"),
+            reverse("admin:datamodel_gebruiksrechten_changelist"),
+            reverse("admin:datamodel_objectinformatieobject_changelist"),
+        ]
+
+        def create_objects():
+            eio = EnkelvoudigInformatieObjectFactory.create()
+            BestandsDeelFactory.create(informatieobject=eio.canonical)
+            GebruiksrechtenFactory.create(informatieobject=eio.canonical)
+            ObjectInformatieObjectFactory.create(informatieobject=eio.canonical)
+
+        create_objects()
+        counts = [self._count_queries(url) for url in urls]
+        create_objects()
+        create_objects()
+
+        self.assertEqual([self._count_queries(url) for url in urls], counts)
+
+    def test_autocomplete_filter(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(identificatie="filtered")
+        part = BestandsDeelFactory.create(informatieobject=eio.canonical)
+        BestandsDeelFactory.create()
+        url = reverse("admin:datamodel_bestandsdeel_changelist")
+
+        response = self.client.get(
+            url, {"informatieobject__id__exact": eio.canonical.pk}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["cl"].result_list), [part])
+        self.assertContains(response, 'class="autocomplete-filter"')
+        self.assertContains(response, "js/autocomplete_filter.js")
+        # only the selected document is rendered as choice
+        self.assertContains(response, f'<option value="{eio.canonical.pk}" selected>')
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    @patch("drc.utils.admin.get_estimated_count", return_value=50000)
+    def test_estimate_unfiltered_large_table(self, mock_estimate):
+        BestandsDeelFactory.create()
+
+        paginator = EstimatedCountPaginator(BestandsDeel.objects.order_by("pk"), 100)
+
+        self.assertEqual(paginator.count, 50000)
+
+    @patch("drc.utils.admin.get_estimated_count", return_value=50000)
+    def test_count_filtered(self, mock_estimate):
+        BestandsDeelFactory.create(volgnummer=1)
+
+        paginator = EstimatedCountPaginator(
+            BestandsDeel.objects.filter(volgnummer=1).order_by("pk"), 100
+        )
+
+        self.assertEqual(paginator.count, 1)
+        mock_estimate.assert_not_called()
+
+    def test_count_small_table(self):
+        BestandsDeelFactory.create()
+
+        paginator = EstimatedCountPaginator(BestandsDeel.objects.order_by("pk"), 100)
+
+        # the estimate of the small (or never analyzed) table is ignored
+        self.assertEqual(paginator.count, 1)
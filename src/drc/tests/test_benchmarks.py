@@ -0,0 +1,94 @@
+import requests
+from privates.test import temp_private_root
+from rest_framework.test import APITestCase
+
+from drc.benchmarks.runner import compare, percentile, run_scenario
+from drc.benchmarks.scenarios import DetailScenario
+from drc.benchmarks.stubs import StubServer
+
+
+def get_result(**kwargs) -> dict:
+    return {
+        "p50": 10,
+        "p95": 20,
+        "queries": 5,
+        "remote_calls": 1,
+        "bytes": 1000,
+        "memory": 1000,
+        "latency": 0,
+        **kwargs,
+    }
+
+
+class CompareTests(APITestCase):
+    def test_percentile(self):
+        values = list(range(1, 21))
+
+        self.assertEqual(percentile(values, 50), 10)
+        self.assertEqual(percentile(values, 95), 19)
+        self.assertEqual(percentile([3], 95), 3)
+
+    def test_compare_within_tolerance(self):
+        regressions = compare(
+            {"list": get_result(p95=24, bytes=1100)}, {"list": get_result()}, 0.25
+        )
+
+        self.assertEqual(regressions, [])
+
+    def test_compare_regressions(self):
+        regressions = compare(
+            {"list": get_result(p95=30, queries=6), "new": get_result()},
+            {"list": get_result()},
+            0.25,
+        )
+
+        self.assertEqual(
+            regressions,
+            [
+                "list: queries increased from 5 to 6",
+                "list: p95 increased from 20 to 30",
+            ],
+        )
+
+    def test_compare_other_latency(self):
+        regressions = compare(
+            {"list": get_result(p95=200, latency=50)}, {"list": get_result()}, 0.25
+        )
+
+        self.assertEqual(regressions, [])
+
+
+class StubServerTests(APITestCase):
+    def test_stubs(self):
+        with StubServer() as stubs:
+            zaak = stubs.get_resource_url("zrc", "zaken")
+            stubs.relations[zaak] = ["http://testserver/document"]
+
+            response = requests.get(zaak)
+            relations = requests.get(
+                stubs.get_url("zrc", "zaakinformatieobjecten"), {"zaak": zaak}
+            )
+            notification = requests.post(stubs.get_url("nrc", "notificaties"), json={})
+
+        self.assertEqual(response.json()["url"], zaak)
+        self.assertEqual(
+            [relation["informatieobject"] for relation in relations.json()],
+            ["http://testserver/document"],
+        )
+        self.assertEqual(notification.status_code, 201)
+        self.assertEqual(stubs.calls, 3)
+
+    @temp_private_root()
+    def test_run_scenario(self):
+        # memory allocated before the scenario isn't included
+        allocated = bytearray(20 * 2**20)
+
+        with StubServer() as stubs:
+            result = run_scenario(DetailScenario(stubs), iterations=2, warmup=1)
+
+        self.assertGreater(result["memory"], 0)
+        self.assertLess(result["memory"], len(allocated) // 1024)
+        self.assertGreater(result["queries"], 0)
+        self.assertEqual(result["remote_calls"], 0)
+        self.assertGreater(result["bytes"], 0)
+        self.assertLessEqual(result["p50"], result["p95"])
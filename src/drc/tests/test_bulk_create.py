@@ -0,0 +1,206 @@
+import base64
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+from freezegun import freeze_time
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.api.scopes import SCOPE_DOCUMENTEN_AANMAKEN
+from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
+
+INFORMATIEOBJECTTYPE = (
+    "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/1"
+)
+INFORMATIEOBJECTTYPE_2 = (
+    "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/2"
+)
+
+
+def get_data(**kwargs) -> dict:
+    return {
+        "bronorganisatie": "159351741",
+        "creatiedatum": "2018-06-27",
+        "titel": "detailed summary",
+        "auteur": "test_auteur",
+        "formaat": "txt",
+        "taal": "eng",
+        "bestandsnaam": "dummy.txt",
+        "inhoud": base64.b64encode(b"some file content").decode("utf-8"),
+        "bestandsomvang": 17,
+        "informatieobjecttype": INFORMATIEOBJECTTYPE,
+        "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+        **kwargs,
+    }
+
+
+@freeze_time("2018-06-27")
+@temp_private_root()
+@override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+@patch("vng_api_common.validators.fetcher")
+class BulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("enkelvoudiginformatieobject-bulk-create")
+
+    def test_bulk_create(self, mock_fetcher, mock_has_shape):
+        response = self.client.post(
+            self.url, [get_data(titel="eerste"), get_data(titel="tweede")]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual([result["status"] for result in results], [201, 201])
+        self.assertEqual(
+            [result["resultaat"]["titel"] for result in results], ["eerste", "tweede"]
+        )
+
+        eios = EnkelvoudigInformatieObject.objects.order_by("pk")
+        self.assertEqual(eios.count(), 2)
+        for eio, result in zip(eios, results):
+            self.assertEqual(eio.inhoud.read(), b"some file content")
+            self.assertEqual(eio.versie, 1)
+            self.assertEqual(
+                result["resultaat"]["url"], f"http://testserver{reverse(eio)}"
+            )
+        # the informatieobjecttype is validated once
+        mock_has_shape.assert_called_once()
+
+    def test_bulk_create_generates_identificatie(self, *mocks):
+        EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOCUMENT-2018-0000000007"
+        )
+
+        response = self.client.post(self.url, [get_data(), get_data()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["resultaat"]["identificatie"] for result in response.json()],
+            ["DOCUMENT-2018-0000000008", "DOCUMENT-2018-0000000009"],
+        )
+
+    def test_bulk_create_partially_invalid(self, *mocks):
+        response = self.client.post(
+            self.url,
+            [get_data(titel="eerste"), get_data(taal="invalid"), get_data()],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual([result["status"] for result in results], [201, 400, 201])
+        self.assertEqual(results[1]["invalidParams"][0]["name"], "taal")
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 2)
+
+    def test_bulk_create_duplicate(self, *mocks):
+        response = self.client.post(
+            self.url,
+            [get_data(identificatie="12345"), get_data(identificatie="12345")],
+        )
+
+        results = response.json()
+        self.assertEqual([result["status"] for result in results], [201, 400])
+        self.assertEqual(results[1]["invalidParams"][0]["code"], "unique")
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 1)
+
+    def test_bulk_create_existing_identificatie(self, *mocks):
+        EnkelvoudigInformatieObjectFactory.create(
+            bronorganisatie="159351741", identificatie="12345"
+        )
+
+        response = self.client.post(self.url, [get_data(identificatie="12345")])
+
+        results = response.json()
+        self.assertEqual([result["status"] for result in results], [400])
+        self.assertEqual(results[0]["invalidParams"][0]["code"], "unique")
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 1)
+
+    def test_bulk_create_large_file(self, *mocks):
+        with self.settings(CHUNK_SIZE=10):
+            response = self.client.post(
+                self.url, [get_data(inhoud=None, bestandsomvang=25)]
+            )
+
+        result = response.json()[0]
+        self.assertEqual(result["status"], 201)
+        self.assertTrue(result["resultaat"]["lock"])
+        self.assertEqual(
+            [deel["omvang"] for deel in result["resultaat"]["bestandsdelen"]],
+            [10, 10, 5],
+        )
+
+    def test_bulk_create_audittrails(self, *mocks):
+        response = self.client.post(self.url, [get_data(), get_data()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        trails = AuditTrail.objects.order_by("pk")
+        self.assertEqual(trails.count(), 2)
+        for trail, result in zip(trails, response.json()):
+            self.assertEqual(trail.actie, "create")
+            self.assertEqual(trail.resultaat, 201)
+            self.assertEqual(trail.hoofd_object, result["resultaat"]["url"])
+            self.assertEqual(trail.nieuw["titel"], "detailed summary")
+
+    @override_settings(NOTIFICATIONS_DISABLED=False)
+    @patch("notifications_api_common.models.NotificationsConfig.get_client")
+    def test_bulk_create_notifications(self, mock_client, *mocks):
+        with capture_on_commit_callbacks(execute=True):
+            response = self.client.post(self.url, [get_data(), get_data()])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        client = mock_client.return_value
+        self.assertEqual(client.create.call_count, 2)
+        for call, result in zip(client.create.call_args_list, response.json()):
+            message = call.args[1]
+            self.assertEqual(message["actie"], "create")
+            self.assertEqual(message["resourceUrl"], result["resultaat"]["url"])
+
+    @override_settings(BULK_MAX_OBJECTS=1)
+    def test_bulk_create_too_many(self, *mocks):
+        response = self.client.post(self.url, [get_data(), get_data()])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "max_length")
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 0)
+
+    def test_bulk_create_not_a_list(self, *mocks):
+        response = self.client.post(self.url, get_data())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "not_a_list")
+
+
+@freeze_time("2018-06-27")
+@temp_private_root()
+@override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+@patch("vng_api_common.validators.fetcher")
+class BulkCreateAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_DOCUMENTEN_AANMAKEN]
+    informatieobjecttype = INFORMATIEOBJECTTYPE
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    url = reverse("enkelvoudiginformatieobject-bulk-create")
+
+    def test_bulk_create_unauthorized(self, *mocks):
+        response = self.client.post(
+            self.url,
+            [
+                get_data(),
+                get_data(informatieobjecttype=INFORMATIEOBJECTTYPE_2),
+                get_data(
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim
+                ),
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["status"] for result in response.json()], [201, 403, 403]
+        )
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 1)
@@ -0,0 +1,143 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.api.utils import get_absolute_url
+from drc.datamodel.models import ObjectInformatieObject
+from drc.datamodel.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+    ObjectInformatieObjectFactory,
+)
+
+ZAAK = "https://zrc.nl/api/v1/zaken/1234"
+BESLUIT = "https://brc.nl/api/v1/besluiten/4321"
+
+
+def get_url(eio) -> str:
+    return get_absolute_url("enkelvoudiginformatieobject-detail", uuid=eio.uuid)
+
+
+@override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+@patch("vng_api_common.validators.fetcher")
+class BulkCreateObjectInformatieObjectTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("objectinformatieobject-bulk-create")
+
+    @patch("drc.api.validators.get_remote_informatieobjecten")
+    def test_bulk_create(self, mock_remote, *mocks):
+        eio1, eio2 = EnkelvoudigInformatieObjectFactory.create_batch(2)
+        mock_remote.return_value = {get_url(eio1), get_url(eio2)}
+
+        response = self.client.post(
+            self.url,
+            [
+                {
+                    "object": ZAAK,
+                    "informatieobject": get_url(eio1),
+                    "objectType": "zaak",
+                },
+                {
+                    "object": ZAAK,
+                    "informatieobject": get_url(eio2),
+                    "objectType": "zaak",
+                },
+                {
+                    "object": BESLUIT,
+                    "informatieobject": get_url(eio1),
+                    "objectType": "besluit",
+                },
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual([result["status"] for result in results], [201, 201, 201])
+        self.assertEqual(
+            [result["resultaat"]["object"] for result in results],
+            [ZAAK, ZAAK, BESLUIT],
+        )
+        self.assertEqual(ObjectInformatieObject.objects.count(), 3)
+        # the remote relations are retrieved once per object
+        self.assertEqual(mock_remote.call_count, 2)
+
+    @patch("drc.api.validators.get_remote_informatieobjecten")
+    def test_bulk_create_unique(self, mock_remote, *mocks):
+        oio = ObjectInformatieObjectFactory.create(is_zaak=True, object=ZAAK)
+        eio1 = oio.informatieobject.latest_version
+        eio2 = EnkelvoudigInformatieObjectFactory.create()
+        mock_remote.return_value = {get_url(eio1), get_url(eio2)}
+        data = [
+            {"object": ZAAK, "informatieobject": get_url(eio1), "objectType": "zaak"},
+            {"object": ZAAK, "informatieobject": get_url(eio2), "objectType": "zaak"},
+            {"object": ZAAK, "informatieobject": get_url(eio2), "objectType": "zaak"},
+        ]
+
+        response = self.client.post(self.url, data)
+
+        results = response.json()
+        self.assertEqual([result["status"] for result in results], [400, 201, 400])
+        self.assertEqual(results[0]["invalidParams"][0]["code"], "unique")
+        self.assertEqual(results[2]["invalidParams"][0]["code"], "unique")
+        self.assertEqual(ObjectInformatieObject.objects.count(), 2)
+
+    @patch("drc.api.validators.get_remote_informatieobjecten", return_value=set())
+    def test_bulk_create_inconsistent_relation(self, *mocks):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.post(
+            self.url,
+            [{"object": ZAAK, "informatieobject": get_url(eio), "objectType": "zaak"}],
+        )
+
+        result = response.json()[0]
+        self.assertEqual(result["status"], 400)
+        self.assertEqual(result["invalidParams"][0]["code"], "inconsistent-relation")
+        self.assertFalse(ObjectInformatieObject.objects.exists())
+
+
+class BulkDestroyObjectInformatieObjectTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("objectinformatieobject-bulk-destroy")
+
+    @patch("drc.api.views.object_informatieobject.get_remote_informatieobjecten")
+    def test_bulk_destroy(self, mock_remote):
+        oio1, oio2 = ObjectInformatieObjectFactory.create_batch(
+            2, is_zaak=True, object=ZAAK
+        )
+        oio3 = ObjectInformatieObjectFactory.create(is_besluit=True, object=BESLUIT)
+        # the second relation still exists in the ZRC
+        mock_remote.side_effect = lambda object_url, object_type: (
+            {get_url(oio2.informatieobject.latest_version)}
+            if object_url == ZAAK
+            else set()
+        )
+
+        response = self.client.post(
+            self.url,
+            [
+                f"http://testserver{reverse(oio1)}",
+                f"http://testserver{reverse(oio2)}",
+                str(oio3.uuid),
+                str(uuid.uuid4()),
+                "invalid",
+            ],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(
+            [result["status"] for result in results], [204, 400, 204, 404, 400]
+        )
+        self.assertEqual(
+            results[1]["invalidParams"][0]["code"], "remote-relation-exists"
+        )
+        self.assertEqual(results[4]["invalidParams"][0]["code"], "invalid")
+        self.assertEqual(list(ObjectInformatieObject.objects.all()), [oio2])
+        # the remote relations are retrieved once per object
+        self.assertEqual(mock_remote.call_count, 2)
@@ -0,0 +1,143 @@
+import gzip
+import io
+import zipfile
+
+from django.core.files.base import ContentFile
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+    ObjectInformatieObjectFactory,
+)
+
+ZAAK = "https://zrc.nl/api/v1/zaken/1"
+
+
+@temp_private_root()
+class BundelTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse("enkelvoudiginformatieobject-bundel")
+
+    def _get_archive(self, data) -> zipfile.ZipFile:
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        return zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+
+    def test_bundel_informatieobjecten(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            bestandsnaam="brief.txt",
+            formaat="text/plain",
+            inhoud__data=b"some text" * 100,
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            bestandsnaam="foto.png", formaat="image/png", inhoud__data=b"some image"
+        )
+
+        archive = self._get_archive(
+            {"informatieobjecten": [f"http://testserver{reverse(eio1)}", eio2.uuid]}
+        )
+
+        self.assertEqual(archive.namelist(), ["brief.txt", "foto.png"])
+        self.assertEqual(archive.read("brief.txt"), b"some text" * 100)
+        self.assertEqual(archive.read("foto.png"), b"some image")
+        self.assertEqual(
+            archive.getinfo("brief.txt").compress_type, zipfile.ZIP_DEFLATED
+        )
+        self.assertEqual(archive.getinfo("foto.png").compress_type, zipfile.ZIP_STORED)
+
+    def test_bundel_object(self):
+        oio1 = ObjectInformatieObjectFactory.create(
+            object=ZAAK, informatieobject__latest_version__bestandsnaam="a.txt"
+        )
+        ObjectInformatieObjectFactory.create(
+            object=ZAAK, informatieobject__latest_version__bestandsnaam="b.txt"
+        )
+        ObjectInformatieObjectFactory.create(
+            object="https://zrc.nl/api/v1/zaken/2",
+            informatieobject__latest_version__bestandsnaam="c.txt",
+        )
+
+        archive = self._get_archive({"object": ZAAK})
+
+        self.assertEqual(archive.namelist(), ["a.txt", "b.txt"])
+        self.assertEqual(
+            archive.read("a.txt"),
+            oio1.informatieobject.latest_version.inhoud.read(),
+        )
+
+    def test_bundel_versie(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            bestandsnaam="brief.txt", inhoud__data=b"versie 1"
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=2,
+            bestandsnaam="brief.txt",
+            inhoud__data=b"versie 2",
+        )
+
+        archive = self._get_archive(
+            {"informatieobjecten": [f"http://testserver{reverse(eio)}?versie=1"]}
+        )
+
+        self.assertEqual(archive.read("brief.txt"), b"versie 1")
+
+    def test_bundel_unique_names(self):
+        eio1, eio2 = EnkelvoudigInformatieObjectFactory.create_batch(
+            2, bestandsnaam="brief.txt"
+        )
+
+        archive = self._get_archive({"informatieobjecten": [eio1.uuid, eio2.uuid]})
+
+        self.assertEqual(archive.namelist(), ["brief.txt", "brief (2).txt"])
+
+    def test_bundel_skips_without_inhoud(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(bestandsnaam="brief.txt")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None, bestandsomvang=None
+        )
+
+        archive = self._get_archive({"informatieobjecten": [eio1.uuid, eio2.uuid]})
+
+        self.assertEqual(archive.namelist(), ["brief.txt"])
+
+    def test_bundel_compressed_inhoud(self):
+        content = b"some text" * 100
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            bestandsnaam="brief.txt", inhoud__data=content, inhoud_encoding="gzip"
+        )
+        eio.inhoud.save("brief.txt.gz", ContentFile(gzip.compress(content)))
+
+        archive = self._get_archive({"informatieobjecten": [eio.uuid]})
+
+        self.assertEqual(archive.read("brief.txt"), content)
+
+    def test_bundel_unknown_informatieobject(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.post(
+            self.url,
+            {"informatieobjecten": [f"http://testserver{reverse(eio)}?versie=2"]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "does-not-exist")
+
+    def test_bundel_invalid_reference(self):
+        response = self.client.post(self.url, {"informatieobjecten": ["not-a-uuid"]})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "invalid")
+
+    def test_bundel_without_params(self):
+        response = self.client.post(self.url, {})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "required")
@@ -0,0 +1,260 @@
+import gzip
+import os
+import unittest
+import uuid
+from base64 import b64encode
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url, reverse
+
+from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+from drc.utils.checks import check_inhoud_compression
+from drc.utils.compression import accepts_encoding
+
+from .mixins import MockValidationsMixin
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+INFORMATIEOBJECTTYPE = (
+    "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/1"
+)
+CONTENT = b"<document><titel>Voorbeeld</titel></document>\n" * 100
+
+
+class CompressionMixin(MockValidationsMixin, JWTAuthMixin):
+    heeft_alle_autorisaties = True
+
+    def _create(
+        self,
+        content: bytes,
+        formaat: str = "application/xml",
+        bestandsnaam: str = "document.xml",
+    ):
+        data = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-06-27",
+            "titel": "detailed summary",
+            "auteur": "test_auteur",
+            "formaat": formaat,
+            "taal": "eng",
+            "bestandsnaam": bestandsnaam,
+            "inhoud": b64encode(content).decode("utf-8"),
+            "bestandsomvang": len(content),
+            "informatieobjecttype": INFORMATIEOBJECTTYPE,
+            "vertrouwelijkheidaanduiding": "openbaar",
+        }
+
+        response = self.client.post(reverse(EnkelvoudigInformatieObject), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(response.json()["bestandsomvang"], len(content))
+        return EnkelvoudigInformatieObject.objects.get(
+            uuid=response.json()["url"].split("/")[-1]
+        )
+
+    def _download(self, eio, **headers):
+        url = get_operation_url("enkelvoudiginformatieobject_download", uuid=eio.uuid)
+        response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+
+@temp_private_root()
+@override_settings(
+    INHOUD_COMPRESSION="gzip",
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+)
+class CompressionTests(CompressionMixin, APITestCase):
+    def test_compress_content(self):
+        eio = self._create(CONTENT)
+
+        self.assertTrue(eio.inhoud.name.endswith(".gz"))
+        self.assertLess(eio.inhoud.size, len(CONTENT))
+        self.assertEqual(eio.bestandsomvang, len(CONTENT))
+        with eio.inhoud.open("rb") as stored:
+            self.assertEqual(gzip.decompress(stored.read()), CONTENT)
+
+    def test_download_decompressed(self):
+        eio = self._create(CONTENT)
+
+        response = self._download(eio)
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.getvalue(), CONTENT)
+        self.assertIn('filename="', response["Content-Disposition"])
+        self.assertNotIn(".gz", response["Content-Disposition"])
+
+    def test_download_encoding_passthrough(self):
+        eio = self._create(CONTENT)
+
+        response = self._download(eio, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        content = response.getvalue()
+        self.assertEqual(gzip.decompress(content), CONTENT)
+
+    def test_download_encoding_refused(self):
+        eio = self._create(CONTENT)
+
+        response = self._download(eio, HTTP_ACCEPT_ENCODING="gzip;q=0, deflate")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.getvalue(), CONTENT)
+
+    @override_settings(INHOUD_COMPRESSION="")
+    def test_compressed_file_of_client(self):
+        # the name of the file is supplied by the client, it doesn't indicate
+        # that the API compressed the content
+        content = gzip.compress(CONTENT)
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            bestandsnaam="",
+            bestandsomvang=len(content),
+            inhoud__filename="export.csv.gz",
+            inhoud__data=content,
+        )
+
+        response = self._download(eio)
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.getvalue(), content)
+        self.assertIn('filename="export.csv.gz"', response["Content-Disposition"])
+
+    def test_incompressible_format(self):
+        eio = self._create(CONTENT, formaat="image/png", bestandsnaam="image.png")
+
+        self.assertFalse(eio.inhoud.name.endswith(".gz"))
+
+    def test_incompressible_content(self):
+        content = os.urandom(1000)
+
+        eio = self._create(content)
+
+        self.assertFalse(eio.inhoud.name.endswith(".gz"))
+        self.assertEqual(self._download(eio).getvalue(), content)
+
+    def test_update_metadata_compressed_content(self):
+        eio = self._create(CONTENT)
+        lock = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_lock", uuid=eio.uuid)
+        ).json()["lock"]
+
+        response = self.client.patch(
+            reverse(eio), {"titel": "other title", "lock": lock}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["bestandsomvang"], len(CONTENT))
+
+    def test_unlock_compresses_merged_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None,
+            formaat="text/plain",
+            bestandsomvang=len(CONTENT),
+            canonical__lock="some-lock",
+        )
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=1, inhoud__data=CONTENT[:100]
+        )
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=2, inhoud__data=CONTENT[100:]
+        )
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": "some-lock"})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        eio.refresh_from_db()
+        self.assertTrue(eio.inhoud.name.endswith(".gz"))
+        self.assertEqual(self._download(eio).getvalue(), CONTENT)
+
+
+@unittest.skipIf(zstandard is None, "zstandard is not installed")
+@temp_private_root()
+@override_settings(
+    INHOUD_COMPRESSION="zstd",
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+)
+class ZstdCompressionTests(CompressionMixin, APITestCase):
+    def test_compress_content(self):
+        eio = self._create(CONTENT)
+
+        self.assertTrue(eio.inhoud.name.endswith(".zst"))
+        self.assertEqual(eio.inhoud_encoding, "zstd")
+        self.assertLess(eio.inhoud.size, len(CONTENT))
+        with eio.inhoud.open("rb") as stored:
+            decompressed = zstandard.ZstdDecompressor().stream_reader(stored).read()
+        self.assertEqual(decompressed, CONTENT)
+
+    def test_download_decompressed(self):
+        eio = self._create(CONTENT)
+
+        response = self._download(eio, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.getvalue(), CONTENT)
+
+    def test_download_encoding_passthrough(self):
+        eio = self._create(CONTENT)
+
+        response = self._download(eio, HTTP_ACCEPT_ENCODING="zstd")
+
+        self.assertEqual(response["Content-Encoding"], "zstd")
+        reader = zstandard.ZstdDecompressor().stream_reader(response.getvalue())
+        self.assertEqual(reader.read(), CONTENT)
+
+
+class CompressionChecksTests(SimpleTestCase):
+    @override_settings(INHOUD_COMPRESSION="")
+    def test_disabled(self):
+        self.assertEqual(check_inhoud_compression(None), [])
+
+    @override_settings(INHOUD_COMPRESSION="gzip")
+    def test_gzip(self):
+        self.assertEqual(check_inhoud_compression(None), [])
+
+    @override_settings(INHOUD_COMPRESSION="brotli")
+    def test_unsupported(self):
+        errors = check_inhoud_compression(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E008"])
+
+    @override_settings(INHOUD_COMPRESSION="zstd")
+    def test_zstd_not_installed(self):
+        with patch("drc.utils.checks.importlib.util.find_spec", return_value=None):
+            errors = check_inhoud_compression(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E009"])
+
+
+class AcceptsEncodingTests(SimpleTestCase):
+    def test_accepts_encoding(self):
+        cases = [
+            ("gzip", "gzip", True),
+            ("deflate, gzip;q=0.5", "gzip", True),
+            ("x-gzip", "gzip", True),
+            ("*", "zstd", True),
+            ("gzip;q=0", "gzip", False),
+            ("gzip;q=0, *", "gzip", False),
+            ("deflate, br", "gzip", False),
+            ("notgzip", "gzip", False),
+            ("", "gzip", False),
+        ]
+        for header, encoding, accepted in cases:
+            with self.subTest(header=header, encoding=encoding):
+                self.assertEqual(accepts_encoding(header, encoding), accepted)
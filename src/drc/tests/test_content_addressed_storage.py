@@ -0,0 +1,162 @@
+import hashlib
+import os
+import threading
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
+from drc.utils.storages import ContentAddressedStorage
+
+
+@temp_private_root()
+class ContentAddressedStorageTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.storage = ContentAddressedStorage()
+        field = EnkelvoudigInformatieObject._meta.get_field("inhoud")
+        patcher = patch.object(field, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_save_content_hash(self):
+        digest = hashlib.sha256(b"some data").hexdigest()
+
+        name = self.storage.save("uploads/file.bin", ContentFile(b"some data"))
+
+        self.assertEqual(name, f"sha256/{digest[:2]}/{digest[2:4]}/{digest}")
+        with self.storage.open(name) as stored:
+            self.assertEqual(stored.read(), b"some data")
+
+    def test_identical_content_stored_once(self):
+        name1 = self.storage.save("uploads/file1.bin", ContentFile(b"some data"))
+        name2 = self.storage.save("uploads/file2.bin", ContentFile(b"some data"))
+        name3 = self.storage.save("uploads/file3.bin", ContentFile(b"other data"))
+
+        self.assertEqual(name1, name2)
+        self.assertNotEqual(name1, name3)
+        files = [
+            file_name
+            for _, _, file_names in os.walk(settings.PRIVATE_MEDIA_ROOT)
+            for file_name in file_names
+        ]
+        self.assertEqual(len(files), 2)
+
+    def test_delete_referenced_file(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some data")
+        eio2 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some data")
+        self.assertEqual(eio1.inhoud.name, eio2.inhoud.name)
+
+        eio1.delete()
+        self.storage.delete(eio1.inhoud.name)
+
+        self.assertTrue(self.storage.exists(eio2.inhoud.name))
+
+        eio2.delete()
+        self.storage.delete(eio2.inhoud.name)
+
+        self.assertFalse(self.storage.exists(eio2.inhoud.name))
+
+
+@temp_private_root()
+class DestroyContentTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_destroy_removes_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        storage = eio.inhoud.storage
+        self.assertTrue(storage.exists(eio.inhoud.name))
+
+        with capture_on_commit_callbacks(execute=True):
+            response = self.client.delete(reverse(eio))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(storage.exists(eio.inhoud.name))
+
+    def test_destroy_keeps_shared_content(self):
+        storage = ContentAddressedStorage()
+        field = EnkelvoudigInformatieObject._meta.get_field("inhoud")
+        with patch.object(field, "storage", storage):
+            eio1 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"data")
+            eio2 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"data")
+
+            with capture_on_commit_callbacks(execute=True):
+                response = self.client.delete(reverse(eio1))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(storage.exists(eio2.inhoud.name))
+
+
+@temp_private_root()
+class ContentAddressedStorageConcurrencyTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.storage = ContentAddressedStorage()
+        field = EnkelvoudigInformatieObject._meta.get_field("inhoud")
+        patcher = patch.object(field, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_delete_during_save_of_same_content(self):
+        # the content of a destroyed document, which isn't deleted yet
+        name = self.storage.save("uploads/old.bin", ContentFile(b"some data"))
+
+        def delete():
+            try:
+                self.storage.delete(name)
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            # the same content is saved again, for a new document
+            eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some data")
+            self.assertEqual(eio.inhoud.name, name)
+
+            thread = threading.Thread(target=delete)
+            thread.start()
+            # the delete waits until the new reference is committed
+            thread.join(timeout=0.5)
+            self.assertTrue(thread.is_alive())
+
+        thread.join()
+        self.assertTrue(self.storage.exists(name))
+
+    def test_save_during_delete_of_same_content(self):
+        name = self.storage.save("uploads/old.bin", ContentFile(b"some data"))
+        saved = []
+
+        def save():
+            try:
+                eio = EnkelvoudigInformatieObjectFactory.create(
+                    inhoud__data=b"some data"
+                )
+                saved.append(eio.inhoud.name)
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            self.storage.lock(name)
+            thread = threading.Thread(target=save)
+            thread.start()
+            thread.join(timeout=0.5)
+            self.assertTrue(thread.is_alive())
+            # the unreferenced file is deleted while the save waits
+            self.storage.delete(name)
+
+        thread.join()
+        self.assertEqual(saved, [name])
+        # the content is written again
+        with self.storage.open(name) as stored:
+            self.assertEqual(stored.read(), b"some data")
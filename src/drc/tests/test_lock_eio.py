@@ -10,7 +10,10 @@ from rest_framework.test import APITestCase
 from vng_api_common.tests import JWTAuthMixin, get_operation_url, get_validation_errors
 
 from drc.api.scopes import SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK, SCOPE_DOCUMENTEN_LOCK
-from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectCanonicalFactory
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectCanonicalFactory,
+)
 
 INFORMATIEOBJECTTYPE = "https://example.com/informatieobjecttype/foo"
 
@@ -212,3 +215,122 @@ class EioUnlockAPITests(JWTAuthMixin, APITestCase):
         eio.refresh_from_db()
 
         self.assertEqual(eio.lock, "")
+
+
+@override_settings(
+    MEDIA_ROOT=tempfile.mkdtemp(),
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+    EIO_COPY_ON_WRITE=True,
+)
+class EioCopyOnWriteAPITests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def _lock(self, canonical) -> str:
+        url = get_operation_url(
+            "enkelvoudiginformatieobject_lock", uuid=canonical.latest_version.uuid
+        )
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.json()["lock"]
+
+    def test_lock_unlock_no_new_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            latest_version__informatieobjecttype=INFORMATIEOBJECTTYPE
+        )
+        eio = canonical.latest_version
+
+        lock = self._lock(canonical)
+        response = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_unlock", uuid=eio.uuid),
+            {"lock": lock},
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.enkelvoudiginformatieobject_set.count(), 1)
+        self.assertFalse(canonical.copy_on_write)
+
+    def test_update_creates_new_version_once(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create()
+        eio = canonical.latest_version
+        url = get_operation_url("enkelvoudiginformatieobject_update", uuid=eio.uuid)
+
+        lock = self._lock(canonical)
+        self.assertEqual(canonical.enkelvoudiginformatieobject_set.count(), 1)
+
+        response = self.client.patch(url, {"titel": "changed", "lock": lock})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["versie"], 2)
+
+        response = self.client.patch(url, {"beschrijving": "changed", "lock": lock})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["versie"], 2)
+
+        versions = canonical.enkelvoudiginformatieobject_set.order_by("versie")
+        self.assertEqual(versions.count(), 2)
+        self.assertEqual(versions[0].titel, "some titel")
+        self.assertEqual(versions[1].titel, "changed")
+        self.assertEqual(versions[1].beschrijving, "changed")
+
+    def test_update_without_modifications(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create()
+        eio = canonical.latest_version
+        url = get_operation_url("enkelvoudiginformatieobject_update", uuid=eio.uuid)
+
+        lock = self._lock(canonical)
+        response = self.client.patch(url, {"titel": eio.titel, "lock": lock})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["versie"], 1)
+        self.assertEqual(canonical.enkelvoudiginformatieobject_set.count(), 1)
+
+    def test_update_content(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create()
+        eio = canonical.latest_version
+        url = get_operation_url("enkelvoudiginformatieobject_update", uuid=eio.uuid)
+
+        lock = self._lock(canonical)
+        response = self.client.patch(
+            url, {"inhoud": b64encode(b"some data"), "lock": lock}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["versie"], 2)
+        self.assertEqual(canonical.enkelvoudiginformatieobject_set.count(), 2)
+
+    def test_unlock_merged_content_creates_new_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            latest_version__inhoud__data=b"old content",
+            latest_version__inhoud__filename="old.bin",
+        )
+        eio = canonical.latest_version
+        lock = self._lock(canonical)
+        # the parts are uploaded without any other modification of the document
+        BestandsDeelFactory.create(
+            informatieobject=canonical, volgnummer=1, inhoud__data=b"new "
+        )
+        BestandsDeelFactory.create(
+            informatieobject=canonical, volgnummer=2, inhoud__data=b"content"
+        )
+
+        response = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_unlock", uuid=eio.uuid),
+            {"lock": lock},
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+        canonical.refresh_from_db()
+        self.assertFalse(canonical.copy_on_write)
+        versions = canonical.enkelvoudiginformatieobject_set.order_by("versie")
+        self.assertEqual([version.versie for version in versions], [1, 2])
+        with versions[0].inhoud.open("rb") as old:
+            self.assertEqual(old.read(), b"old content")
+        with versions[1].inhoud.open("rb") as new:
+            self.assertEqual(new.read(), b"new content")
@@ -0,0 +1,142 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse as django_reverse
+
+import requests
+import requests_mock
+from privates.test import temp_private_root
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+
+
+def get_sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@temp_private_root()
+@override_settings(SENDFILE_BACKEND="drc.utils.sendfile")
+class MetricsTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_request_duration(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        labels = {
+            "view": "enkelvoudiginformatieobject-detail",
+            "action": "retrieve",
+            "method": "GET",
+            "status": "200",
+        }
+        count = get_sample("drc_request_duration_seconds_count", **labels)
+
+        self.client.get(reverse(eio))
+
+        self.assertEqual(
+            get_sample("drc_request_duration_seconds_count", **labels), count + 1
+        )
+
+    def test_invalid_content_length(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        labels = {"view": "enkelvoudiginformatieobject-detail"}
+        received = get_sample("drc_upload_bytes_total", **labels)
+
+        for content_length in ["not a number", "-10"]:
+            with self.subTest(content_length=content_length):
+                response = self.client.get(reverse(eio), CONTENT_LENGTH=content_length)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(get_sample("drc_upload_bytes_total", **labels), received)
+
+    @override_settings(SENDFILE_PROXY="X-Accel-Redirect")
+    def test_sendfile_bytes(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        url = reverse("enkelvoudiginformatieobject-download", kwargs={"uuid": eio.uuid})
+        sent = get_sample("drc_sendfile_bytes_total", backend="x-accel-redirect")
+
+        self.client.get(url)
+
+        self.assertEqual(
+            get_sample("drc_sendfile_bytes_total", backend="x-accel-redirect"),
+            sent + 9,
+        )
+
+    def test_outbound_requests(self):
+        errors = get_sample("drc_outbound_request_errors_total", host="ztc.nl")
+        count = get_sample("drc_outbound_request_duration_seconds_count", host="ztc.nl")
+
+        with requests_mock.Mocker() as m:
+            m.get("https://ztc.nl/ok", json={})
+            m.get("https://ztc.nl/error", status_code=503)
+            requests.get("https://ztc.nl/ok")
+            requests.get("https://ztc.nl/error")
+
+        self.assertEqual(
+            get_sample("drc_outbound_request_duration_seconds_count", host="ztc.nl"),
+            count + 2,
+        )
+        self.assertEqual(
+            get_sample("drc_outbound_request_errors_total", host="ztc.nl"),
+            errors + 1,
+        )
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_endpoint(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(lock="lock")
+        BestandsDeelFactory.create(informatieobject=canonical, volgnummer=1)
+        BestandsDeelFactory.create(
+            informatieobject=canonical, inhoud="", omvang=100, volgnummer=2
+        )
+        BestandsDeelFactory.create(
+            informatieobject=canonical, inhoud="", omvang=50, volgnummer=3
+        )
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer secret")
+
+        response = self.client.get(django_reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = response.content.decode()
+        self.assertIn("# TYPE drc_request_duration_seconds histogram", content)
+        self.assertIn("drc_open_uploads 1.0", content)
+        self.assertIn("drc_open_upload_bestandsdelen 2.0", content)
+        self.assertIn("drc_open_upload_bytes 150.0", content)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_multiprocess(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer secret")
+
+        with patch.dict("os.environ", {"PROMETHEUS_MULTIPROC_DIR": "/nonexistent"}):
+            with patch("prometheus_client.multiprocess.MultiProcessCollector") as mock:
+                response = self.client.get(django_reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock.assert_called_once()
+        self.assertIn("drc_open_uploads 0.0", response.content.decode())
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_wrong_token(self):
+        for authorization in [None, "Bearer other", "secret"]:
+            with self.subTest(authorization=authorization):
+                self.client.credentials(HTTP_AUTHORIZATION=authorization or "")
+
+                response = self.client.get(django_reverse("metrics"))
+
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+                self.assertNotIn(b"drc_", response.content)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_metrics_disabled(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer ")
+
+        response = self.client.get(django_reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
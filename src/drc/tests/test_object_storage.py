@@ -0,0 +1,154 @@
+from datetime import date
+from hashlib import sha256
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.test import override_settings
+
+from privates.storages import PrivateMediaFileSystemStorage
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url
+
+from drc.datamodel.models import BestandsDeel, EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+
+
+class ComposingStorage(PrivateMediaFileSystemStorage):
+    """
+    Stand-in for an object store which merges files itself.
+    """
+
+    composed = []
+
+    def compose(self, names, name):
+        self.composed.append(names)
+        content = b"".join(self.open(part_name).read() for part_name in names)
+        return self.save(name, ContentFile(content))
+
+    def get_download_url(self, name, filename):
+        return f"https://objectstore.example.com/{name}?filename={filename}"
+
+
+@temp_private_root()
+class ObjectStorageTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.storage = ComposingStorage()
+        ComposingStorage.composed = []
+        for model in [EnkelvoudigInformatieObject, BestandsDeel]:
+            field = model._meta.get_field("inhoud")
+            patcher = patch.object(field, "storage", self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_unlock_composes_bestandsdelen(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None, bestandsomvang=10, canonical__lock="some-lock"
+        )
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=1, inhoud__data=b"01234"
+        )
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=2, inhoud__data=b"56789"
+        )
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": "some-lock"})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(len(ComposingStorage.composed), 1)
+
+        eio.refresh_from_db()
+        self.assertEqual(eio.inhoud.read(), b"0123456789")
+        # the content isn't read to calculate the integriteit
+        self.assertEqual(eio.integriteit["waarde"], "")
+        self.assertFalse(eio.canonical.bestandsdelen.exists())
+
+    def test_unlock_composed_verifies_integriteit(self):
+        integriteit = {
+            "algoritme": "sha_256",
+            "waarde": sha256(b"01234").hexdigest(),
+            "datum": date(2018, 6, 27),
+        }
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None, bestandsomvang=5, canonical__lock="some-lock"
+        )
+        eio.integriteit = integriteit
+        eio.save()
+        BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=1, inhoud__data=b"01234"
+        )
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": "some-lock"})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        eio.refresh_from_db()
+        self.assertEqual(eio.integriteit, integriteit)
+
+    def test_download_remote_storage(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"some data")
+        download_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        with patch(
+            "drc.api.views.enkelvoudig_informatieobject.is_local_storage",
+            return_value=False,
+        ):
+            response = self.client.get(download_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), b"some data")
+        self.assertIn("attachment", response["Content-Disposition"])
+
+    @override_settings(INHOUD_DOWNLOAD_REDIRECT=True)
+    def test_download_redirect(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        download_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=eio.uuid
+        )
+
+        response = self.client.get(download_url)
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertTrue(
+            response["Location"].startswith(
+                f"https://objectstore.example.com/{eio.inhoud.name}"
+            )
+        )
+
+    def test_binary_upload_remote_storage(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None, bestandsomvang=5, canonical__lock="some-lock"
+        )
+        part = BestandsDeelFactory.create(
+            informatieobject=eio.canonical, volgnummer=1, inhoud=None, omvang=5
+        )
+        part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+
+        with patch(
+            "drc.api.serializers.bestandsdeel.is_local_storage", return_value=False
+        ):
+            response = self.client.put(
+                part_url,
+                b"01234",
+                content_type="application/octet-stream",
+                HTTP_LOCK="some-lock",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        part.refresh_from_db()
+        self.assertEqual(part.inhoud.read(), b"01234")
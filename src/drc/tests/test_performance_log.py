@@ -0,0 +1,87 @@
+import json
+from unittest.mock import patch
+
+from django.test import override_settings
+
+import requests_mock
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
+
+from .test_bulk_create import get_data
+
+
+@temp_private_root()
+@override_settings(
+    PERFORMANCE_LOG_SAMPLE_RATE=1,
+    PERFORMANCE_LOG_SLOW_THRESHOLD=0,
+    SENDFILE_BACKEND="drc.utils.sendfile",
+)
+class PerformanceLogTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_records(self, logs) -> list:
+        return [json.loads(record.split(":", 2)[2]) for record in logs.output]
+
+    def test_log_request(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        with self.assertLogs("drc.performance", "INFO") as logs:
+            response = self.client.get(reverse(eio))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        record = self.get_records(logs)[0]
+        self.assertEqual(record["method"], "GET")
+        self.assertEqual(record["path"], reverse(eio))
+        self.assertEqual(record["view"], "enkelvoudiginformatieobject-detail")
+        self.assertEqual(record["action"], "retrieve")
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["db"]["queries"], 0)
+        self.assertEqual(record["http"], {})
+
+    def test_log_remote_calls_and_storage(self):
+        informatieobjecttype = "https://ztc.nl/api/v1/informatieobjecttypen/1"
+
+        with requests_mock.Mocker() as m, patch(
+            "vng_api_common.validators.obj_has_shape", return_value=True
+        ), patch("vng_api_common.validators.fetcher"):
+            m.get(informatieobjecttype, json={"url": informatieobjecttype})
+            with self.assertLogs("drc.performance", "INFO") as logs:
+                response = self.client.post(
+                    reverse("enkelvoudiginformatieobject-list"),
+                    get_data(informatieobjecttype=informatieobjecttype),
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        record = self.get_records(logs)[0]
+        self.assertEqual(record["action"], "create")
+        self.assertEqual(record["http"]["ztc.nl"]["calls"], 1)
+        self.assertEqual(record["storage"]["written"], 17)
+
+    def test_log_download_when_sent(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        url = reverse("enkelvoudiginformatieobject-download", kwargs={"uuid": eio.uuid})
+
+        with self.assertLogs("drc.performance", "INFO") as logs:
+            response = self.client.get(url)
+            self.assertEqual(logs.output, [])
+            # the test client closes the response once the content is consumed
+            response.getvalue()
+
+        record = self.get_records(logs)[0]
+        self.assertEqual(record["action"], "download")
+        self.assertEqual(record["storage"]["read"], 9)
+
+    @override_settings(
+        PERFORMANCE_LOG_SAMPLE_RATE=0, PERFORMANCE_LOG_SLOW_THRESHOLD=60000
+    )
+    def test_not_logged(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        with patch("drc.utils.middleware.performance_logger") as mock_logger:
+            self.client.get(reverse(eio))
+
+        mock_logger.info.assert_not_called()
@@ -0,0 +1,209 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import OperationalError, connections
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
+from drc.utils import db
+from drc.utils.checks import check_replica_cache
+from drc.utils.db import ReplicaRouter, current_replica
+
+from .test_bulk_create import get_data
+
+
+@override_settings(DB_REPLICAS=["replica_1"], DB_REPLICA_MAX_LAG=5)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        db._health.clear()
+        self.addCleanup(db._health.clear)
+
+    def test_routing(self):
+        router = ReplicaRouter()
+        instance = EnkelvoudigInformatieObject()
+        instance._state.db = "replica_1"
+
+        self.assertIsNone(router.db_for_read(EnkelvoudigInformatieObject))
+        token = current_replica.set("replica_1")
+        self.addCleanup(current_replica.reset, token)
+        self.assertEqual(router.db_for_read(EnkelvoudigInformatieObject), "replica_1")
+        self.assertEqual(
+            router.db_for_write(EnkelvoudigInformatieObject, instance=instance),
+            "default",
+        )
+        self.assertFalse(router.allow_migrate("replica_1", "datamodel"))
+        self.assertIsNone(router.allow_migrate("default", "datamodel"))
+
+    @patch("drc.utils.db.connections")
+    def test_replica_lag(self, mock_connections):
+        cursor = mock_connections.__getitem__.return_value.cursor.return_value
+        cursor.__enter__.return_value.fetchone.return_value = (2.5,)
+
+        self.assertEqual(db.get_replica(), "replica_1")
+
+        db._health.clear()
+        cursor.__enter__.return_value.fetchone.return_value = (10,)
+        with self.assertLogs("drc.utils.db", "WARNING"):
+            self.assertIsNone(db.get_replica())
+
+    @patch("drc.utils.db.connections")
+    def test_replica_unavailable(self, mock_connections):
+        connection = mock_connections.__getitem__.return_value
+        connection.cursor.side_effect = OperationalError
+
+        with self.assertLogs("drc.utils.db", "WARNING"):
+            self.assertIsNone(db.get_replica())
+            # the health is cached
+            self.assertIsNone(db.get_replica())
+
+        connection.cursor.assert_called_once()
+        connection.close.assert_called_once()
+
+
+@override_settings(
+    DB_REPLICAS=["replica_1"],
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+)
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+@patch("vng_api_common.validators.fetcher")
+class ReadReplicaMixinTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        # the test database has no replicas, read from the primary
+        patcher = patch("drc.api.mixins.get_replica", return_value=None)
+        self.mock_get_replica = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_read_actions_use_replica(self, *mocks):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        self.client.get(reverse(EnkelvoudigInformatieObject))
+        self.client.get(reverse(eio))
+        self.client.post(
+            reverse("enkelvoudiginformatieobject--zoek"), {"uuid__in": [eio.uuid]}
+        )
+
+        self.assertEqual(self.mock_get_replica.call_count, 3)
+        self.assertIsNone(current_replica.get())
+
+    def test_read_your_writes(self, *mocks):
+        response = self.client.post(reverse(EnkelvoudigInformatieObject), get_data())
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(response.json()["url"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_get_replica.assert_not_called()
+
+    def test_failed_write_not_sticky(self, *mocks):
+        response = self.client.post(
+            reverse(EnkelvoudigInformatieObject), get_data(taal="invalid")
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.get(reverse(EnkelvoudigInformatieObject))
+
+        self.mock_get_replica.assert_called_once()
+
+
+@override_settings(
+    DB_REPLICAS=["replica_1"],
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+)
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+@patch("vng_api_common.validators.fetcher")
+class ReplicaReadTests(JWTAuthMixin, APITransactionTestCase):
+    """
+    Read from the replica alias, which mirrors the test database.
+
+    The replica has its own connection, which only sees committed data.
+    """
+
+    databases = {"default", "replica_1"}
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        self._create_credentials(
+            self.client_id,
+            self.secret,
+            self.heeft_alle_autorisaties,
+            self.max_vertrouwelijkheidaanduiding,
+        )
+        cache.clear()
+        db._health.clear()
+        self.addCleanup(db._health.clear)
+
+    def test_reads_from_replica(self, *mocks):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        with CaptureQueriesContext(connections["replica_1"]) as replica_queries:
+            with CaptureQueriesContext(connections["default"]) as primary_queries:
+                response = self.client.get(reverse(eio))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tables = " ".join(query["sql"] for query in replica_queries)
+        self.assertIn(EnkelvoudigInformatieObject._meta.db_table, tables)
+        self.assertNotIn(
+            EnkelvoudigInformatieObject._meta.db_table,
+            " ".join(query["sql"] for query in primary_queries),
+        )
+
+    def test_writes_to_primary(self, *mocks):
+        with CaptureQueriesContext(connections["replica_1"]) as replica_queries:
+            response = self.client.post(
+                reverse(EnkelvoudigInformatieObject), get_data()
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+            # the client reads its write from the primary
+            response = self.client.get(response.json()["url"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(replica_queries), 0)
+
+
+@override_settings(DB_REPLICAS=["replica_1"])
+class ReplicaCacheCheckTests(SimpleTestCase):
+    @override_settings(
+        DB_REPLICA_CACHE="replicas",
+        CACHES={
+            "replicas": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "replica_cache",
+            }
+        },
+    )
+    def test_shared_cache(self):
+        self.assertEqual(check_replica_cache(None), [])
+
+    @override_settings(DB_REPLICAS=[])
+    def test_without_replicas(self):
+        self.assertEqual(check_replica_cache(None), [])
+
+    @override_settings(DB_REPLICA_CACHE="replicas")
+    def test_unknown_cache(self):
+        errors = check_replica_cache(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E005"])
+
+    def test_process_local_cache(self):
+        for backend in (
+            "django.core.cache.backends.locmem.LocMemCache",
+            "django.core.cache.backends.dummy.DummyCache",
+        ):
+            with self.subTest(backend=backend):
+                with override_settings(CACHES={"default": {"BACKEND": backend}}):
+                    errors = check_replica_cache(None)
+
+                self.assertEqual([error.id for error in errors], ["utils.E006"])
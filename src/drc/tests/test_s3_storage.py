@@ -0,0 +1,218 @@
+from datetime import date
+from hashlib import md5
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, override_settings
+
+import boto3
+from botocore.exceptions import ClientError
+from moto import mock_s3
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url, get_validation_errors
+
+from drc.api.scopes import SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK, SCOPE_DOCUMENTEN_LOCK
+from drc.datamodel.models import BestandsDeel, EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+from drc.utils.s3 import MIN_PART_SIZE, S3Storage
+
+S3_SETTINGS = {
+    "AWS_STORAGE_BUCKET_NAME": "documenten",
+    "AWS_S3_REGION_NAME": "eu-west-1",
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+}
+
+
+class S3Mixin:
+    def setUp(self):
+        super().setUp()
+
+        mock = mock_s3()
+        mock.start()
+        self.addCleanup(mock.stop)
+
+        self.client_s3 = boto3.client("s3", region_name="eu-west-1")
+        self.client_s3.create_bucket(
+            Bucket="documenten",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+        self.storage = S3Storage()
+
+
+@override_settings(**S3_SETTINGS, CHUNK_SIZE=MIN_PART_SIZE)
+class S3StorageComposeTests(S3Mixin, SimpleTestCase):
+    def test_compose(self):
+        first = self.storage.save("part-uploads/1", ContentFile(b"a" * MIN_PART_SIZE))
+        last = self.storage.save("part-uploads/2", ContentFile(b"bcd"))
+
+        name = self.storage.compose([first, last], "uploads/merged.bin")
+
+        with self.storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"a" * MIN_PART_SIZE + b"bcd")
+        # the parts are kept, they're deleted by the caller
+        self.assertTrue(self.storage.exists(first))
+
+    def test_compose_single_small_part(self):
+        part = self.storage.save("part-uploads/1", ContentFile(b"abc"))
+
+        name = self.storage.compose([part], "uploads/merged.bin")
+
+        with self.storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"abc")
+
+    @override_settings(CHUNK_SIZE=10)
+    def test_compose_small_parts(self):
+        first = self.storage.save("part-uploads/1", ContentFile(b"0123456789"))
+        last = self.storage.save("part-uploads/2", ContentFile(b"abc"))
+
+        with self.assertRaises(NotImplementedError):
+            self.storage.compose([first, last], "uploads/merged.bin")
+
+        self.assertFalse(self.storage.exists("uploads/merged.bin"))
+
+    def test_compose_aborted(self):
+        first = self.storage.save("part-uploads/1", ContentFile(b"abc"))
+
+        with self.assertRaises(ClientError):
+            self.storage.compose([first, "part-uploads/missing"], "uploads/merged.bin")
+
+        uploads = self.client_s3.list_multipart_uploads(Bucket="documenten")
+        self.assertEqual(uploads.get("Uploads", []), [])
+        self.assertFalse(self.storage.exists("uploads/merged.bin"))
+
+
+@override_settings(**S3_SETTINGS, CHUNK_SIZE=5)
+class S3StorageUnlockTests(S3Mixin, JWTAuthMixin, APITestCase):
+    informatieobjecttype = (
+        "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/1"
+    )
+    scopes = [SCOPE_DOCUMENTEN_LOCK]
+
+    def setUp(self):
+        super().setUp()
+
+        for model in [EnkelvoudigInformatieObject, BestandsDeel]:
+            field = model._meta.get_field("inhoud")
+            patcher = patch.object(field, "storage", self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _create_locked(self, parts, integriteit=None):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=None,
+            bestandsomvang=sum(len(data) for data in parts),
+            canonical__lock="some-lock",
+        )
+        if integriteit:
+            eio.integriteit = integriteit
+            eio.save()
+        for volgnummer, data in enumerate(parts, start=1):
+            BestandsDeelFactory.create(
+                informatieobject=eio.canonical,
+                volgnummer=volgnummer,
+                inhoud=None,
+                omvang=len(data),
+            ).inhoud.save(f"part-{volgnummer}", ContentFile(data))
+        return eio
+
+    def test_unlock_small_parts(self):
+        """
+        Parts under the minimal part size are merged by the application.
+        """
+        eio = self._create_locked([b"01234", b"56789"])
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": "some-lock"})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        eio.refresh_from_db()
+        with self.storage.open(eio.inhoud.name) as merged:
+            self.assertEqual(merged.read(), b"0123456789")
+        self.assertFalse(eio.canonical.bestandsdelen.exists())
+        objects = self.client_s3.list_objects_v2(Bucket="documenten")["Contents"]
+        self.assertEqual([obj["Key"] for obj in objects], [eio.inhoud.name])
+
+    @override_settings(CHUNK_SIZE=MIN_PART_SIZE)
+    def test_unlock_compose_verifies_integriteit(self):
+        parts = [b"a" * MIN_PART_SIZE, b"bcd"]
+        eio = self._create_locked(
+            parts,
+            integriteit={
+                "algoritme": "md5",
+                "waarde": md5(b"".join(parts)).hexdigest(),
+                "datum": date(2018, 6, 27),
+            },
+        )
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": "some-lock"})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        eio.refresh_from_db()
+        self.assertEqual(eio.canonical.lock, "")
+        with self.storage.open(eio.inhoud.name) as merged:
+            self.assertEqual(merged.read(), b"".join(parts))
+
+    @override_settings(CHUNK_SIZE=MIN_PART_SIZE)
+    def test_unlock_compose_integriteit_mismatch(self):
+        eio = self._create_locked(
+            [b"a" * MIN_PART_SIZE, b"bcd"],
+            integriteit={
+                "algoritme": "md5",
+                "waarde": md5(b"other content").hexdigest(),
+                "datum": date(2018, 6, 27),
+            },
+        )
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": "some-lock"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "integriteit")
+        self.assertEqual(error["code"], "integriteit-mismatch")
+        eio.refresh_from_db()
+        self.assertEqual(eio.canonical.lock, "some-lock")
+        self.assertEqual(eio.canonical.bestandsdelen.count(), 2)
+        # the composed object is deleted, the parts are kept
+        objects = self.client_s3.list_objects_v2(Bucket="documenten")["Contents"]
+        self.assertEqual(
+            sorted(obj["Key"] for obj in objects),
+            sorted(part.inhoud.name for part in eio.canonical.bestandsdelen.all()),
+        )
+
+    @override_settings(CHUNK_SIZE=MIN_PART_SIZE)
+    def test_force_unlock_compose_integriteit_mismatch(self):
+        self.autorisatie.scopes = self.autorisatie.scopes + [
+            SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK
+        ]
+        self.autorisatie.save()
+        parts = [b"a" * MIN_PART_SIZE, b"bcd"]
+        eio = self._create_locked(
+            parts,
+            integriteit={
+                "algoritme": "md5",
+                "waarde": md5(b"other content").hexdigest(),
+                "datum": date(2018, 6, 27),
+            },
+        )
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=eio.uuid
+        )
+
+        response = self.client.post(unlock_url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        eio.refresh_from_db()
+        self.assertEqual(eio.canonical.lock, "")
+        self.assertEqual(eio.integriteit["waarde"], md5(b"".join(parts)).hexdigest())
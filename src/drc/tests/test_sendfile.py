@@ -0,0 +1,127 @@
+import os
+
+from django.conf import settings
+from django.http import FileResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from privates.test import temp_private_root
+
+from drc.utils.checks import (
+    check_sendfile,
+    check_sendfile_backend,
+    check_sendfile_proxy,
+)
+from drc.utils.sendfile import sendfile
+
+
+@temp_private_root()
+class SendfileBackendTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.filename = os.path.join(settings.PRIVATE_MEDIA_ROOT, "uploads", "file")
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        with open(self.filename, "wb") as f:
+            f.write(b"some data")
+
+    @override_settings(SENDFILE_PROXY="X-Accel-Redirect")
+    def test_nginx(self):
+        request = RequestFactory().get("/")
+
+        response = sendfile(request, self.filename)
+
+        self.assertRegex(
+            response["X-Accel-Redirect"], r"^/private-media/+uploads/file$"
+        )
+        self.assertEqual(response.content, b"")
+
+    @override_settings(SENDFILE_PROXY="X-Sendfile")
+    def test_apache(self):
+        request = RequestFactory().get("/")
+
+        response = sendfile(request, self.filename)
+
+        self.assertEqual(response["X-Sendfile"], self.filename)
+
+    @override_settings(SENDFILE_PROXY="")
+    def test_without_proxy(self):
+        request = RequestFactory().get("/")
+
+        response = sendfile(request, self.filename)
+
+        self.assertIsInstance(response, FileResponse)
+        self.assertNotIn("X-Accel-Redirect", response)
+        self.assertEqual(response.getvalue(), b"some data")
+
+    @override_settings(SENDFILE_PROXY="")
+    def test_proxy_header_not_trusted(self):
+        request = RequestFactory().get("/", HTTP_X_SENDFILE_TYPE="X-Sendfile")
+
+        response = sendfile(request, self.filename)
+
+        self.assertIsInstance(response, FileResponse)
+        self.assertNotIn("X-Sendfile", response)
+        self.assertEqual(response.getvalue(), b"some data")
+
+    @override_settings(SENDFILE_TRUST_PROXY_HEADER=True)
+    def test_proxy_header_trusted(self):
+        request = RequestFactory().get("/", HTTP_X_SENDFILE_TYPE="X-Accel-Redirect")
+
+        response = sendfile(request, self.filename)
+
+        self.assertRegex(
+            response["X-Accel-Redirect"], r"^/private-media/+uploads/file$"
+        )
+
+    @override_settings(SENDFILE_TRUST_PROXY_HEADER=True, SENDFILE_PROXY="X-Sendfile")
+    def test_proxy_header_missing(self):
+        request = RequestFactory().get("/")
+
+        response = sendfile(request, self.filename)
+
+        self.assertEqual(response["X-Sendfile"], self.filename)
+
+
+class SendfileChecksTests(SimpleTestCase):
+    def test_valid(self):
+        self.assertEqual(check_sendfile(None), [])
+
+    @override_settings(SENDFILE_ROOT="/tmp/other")
+    def test_root_outside_private_media(self):
+        errors = check_sendfile(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E002"])
+
+    @override_settings(SENDFILE_URL="private-media")
+    def test_relative_url(self):
+        errors = check_sendfile(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E003"])
+
+    @override_settings(SENDFILE_URL="/admin/")
+    def test_url_served_by_application(self):
+        errors = check_sendfile(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E004"])
+
+    @override_settings(SENDFILE_BACKEND="sendfile.backends.simple")
+    def test_python_backend(self):
+        errors = check_sendfile_backend(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.W001"])
+
+    @override_settings(SENDFILE_PROXY="X-Accel-Redirect")
+    def test_proxy(self):
+        self.assertEqual(check_sendfile_backend(None), [])
+
+    @override_settings(DEBUG=False, SENDFILE_PROXY="")
+    def test_without_proxy(self):
+        errors = check_sendfile_backend(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.W002"])
+
+    @override_settings(SENDFILE_PROXY="X-Lighttpd-Send-File")
+    def test_unsupported_proxy(self):
+        errors = check_sendfile_proxy(None)
+
+        self.assertEqual([error.id for error in errors], ["utils.E007"])
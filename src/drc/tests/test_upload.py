@@ -1,5 +1,8 @@
+import os
 import uuid
 from base64 import b64encode
+from datetime import date
+from hashlib import md5, sha256
 
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -175,7 +178,7 @@ class SmallFileUpload(MockValidationsMixin, JWTAuthMixin, APITestCase):
         file_response = self.client.get(file_url)
 
         self.assertEqual(file_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(file_response.content, b"")
+        self.assertEqual(file_response.getvalue(), b"")
 
     def test_create_without_size(self):
         """
@@ -508,6 +511,7 @@ class LargeFileAPITests(MockValidationsMixin, JWTAuthMixin, APITestCase):
         self.assertEqual(self.canonical.bestandsdelen.count(), 2)
         self.assertEqual(data["locked"], True)
         self.assertEqual(data["lock"], self.canonical.lock)
+        self.assertIsNotNone(self.canonical.upload_activity)
 
         self.bestandsdelen = self.canonical.bestandsdelen.order_by("volgnummer").all()
 
@@ -552,6 +556,7 @@ class LargeFileAPITests(MockValidationsMixin, JWTAuthMixin, APITestCase):
         self.eio.refresh_from_db()
 
         self.assertEqual(self.canonical.bestandsdelen.count(), 0)
+        self.assertIsNone(self.canonical.upload_activity)
         self.assertNotEqual(self.eio.inhoud.path, "")
         self.assertEqual(self.eio.inhoud.size, self.file_content.size)
 
@@ -563,7 +568,7 @@ class LargeFileAPITests(MockValidationsMixin, JWTAuthMixin, APITestCase):
         response = self.client.get(file_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, b"filecontentstring")
+        self.assertEqual(response.getvalue(), b"filecontentstring")
 
     def test_create_eio_full_process(self):
         """
@@ -603,6 +608,88 @@ class LargeFileAPITests(MockValidationsMixin, JWTAuthMixin, APITestCase):
         self._unlock()
         self._download_file()
 
+    def test_unlock_merges_without_copies(self):
+        def get_files():
+            return {
+                os.path.join(root, file_name)
+                for root, _, file_names in os.walk(settings.PRIVATE_MEDIA_ROOT)
+                for file_name in file_names
+            }
+
+        self._create_metadata()
+        self._upload_part_files()
+        part_files = {part.inhoud.path for part in self.bestandsdelen}
+        files_before = get_files()
+
+        self._unlock()
+
+        self.assertEqual(
+            get_files(), files_before - part_files | {self.eio.inhoud.path}
+        )
+
+    def test_unlock_calculates_integriteit(self):
+        self._create_metadata()
+        self._upload_part_files()
+        self._unlock()
+
+        self.assertEqual(self.eio.integriteit["algoritme"], "sha_256")
+        self.assertEqual(
+            self.eio.integriteit["waarde"],
+            sha256(b"filecontentstring").hexdigest(),
+        )
+
+    def test_unlock_integriteit_mismatch(self):
+        self._create_metadata()
+        self.eio.integriteit = {
+            "algoritme": "md5",
+            "waarde": md5(b"other content").hexdigest(),
+            "datum": date(2018, 6, 27),
+        }
+        self.eio.save()
+        self._upload_part_files()
+
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": self.canonical.lock})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "integriteit")
+        self.assertEqual(error["code"], "integriteit-mismatch")
+
+        self.canonical.refresh_from_db()
+        self.assertNotEqual(self.canonical.lock, "")
+        self.assertEqual(self.canonical.bestandsdelen.count(), 2)
+
+    def test_force_unlock_integriteit_mismatch(self):
+        """
+        A forced unlock stores the calculated integriteit of the content
+        instead of rejecting it, so the document can always be unlocked.
+        """
+        self.autorisatie.scopes = self.autorisatie.scopes + [
+            SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK
+        ]
+        self.autorisatie.save()
+        self._create_metadata()
+        self.eio.integriteit = {
+            "algoritme": "md5",
+            "waarde": md5(b"other content").hexdigest(),
+            "datum": date(2018, 6, 27),
+        }
+        self.eio.save()
+        self._upload_part_files()
+
+        self._unlock()
+
+        self.assertEqual(self.canonical.lock, "")
+        self.assertEqual(self.eio.integriteit["algoritme"], "md5")
+        self.assertEqual(
+            self.eio.integriteit["waarde"], md5(b"filecontentstring").hexdigest()
+        )
+
     def test_upload_part_wrong_size(self):
         """
         Test the upload of the incorrect part file
@@ -636,6 +723,89 @@ class LargeFileAPITests(MockValidationsMixin, JWTAuthMixin, APITestCase):
         error = get_validation_errors(response, "nonFieldErrors")
         self.assertEqual(error["code"], "file-size")
 
+    def test_create_eio_binary_upload(self):
+        self._create_metadata()
+        part_files = split_file(self.file_content, settings.CHUNK_SIZE)
+
+        for part, part_file in zip(self.bestandsdelen, part_files):
+            part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+
+            response = self.client.put(
+                part_url,
+                part_file.read(),
+                content_type="application/octet-stream",
+                HTTP_LOCK=self.canonical.lock,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+            self.assertTrue(response.json()["voltooid"])
+
+        self._unlock()
+        self._download_file()
+
+    def test_binary_upload_part_wrong_size(self):
+        self._create_metadata()
+        part = self.bestandsdelen[0]
+        part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+
+        response = self.client.put(
+            part_url,
+            b"too short",
+            content_type="application/octet-stream",
+            HTTP_LOCK=self.canonical.lock,
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "file-size")
+
+        part.refresh_from_db()
+        self.assertFalse(part.voltooid)
+
+    def test_binary_upload_part_invalid_content_length(self):
+        self._create_metadata()
+        part = self.bestandsdelen[0]
+        part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+        part_file = split_file(self.file_content, settings.CHUNK_SIZE)[0]
+
+        response = self.client.put(
+            part_url,
+            part_file.read(),
+            content_type="application/octet-stream",
+            CONTENT_LENGTH="not a number",
+            HTTP_LOCK=self.canonical.lock,
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-content-length")
+
+        part.refresh_from_db()
+        self.assertFalse(part.voltooid)
+
+    def test_binary_upload_part_incorrect_lock(self):
+        self._create_metadata()
+        part = self.bestandsdelen[0]
+        part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+        part_file = split_file(self.file_content, settings.CHUNK_SIZE)[0]
+
+        response = self.client.put(
+            part_url,
+            part_file.read(),
+            content_type="application/octet-stream",
+            HTTP_LOCK="incorrect",
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "incorrect-lock-id")
+
     def test_upload_part_twice_correct(self):
         """
         Test the upload of the same part file several times
@@ -0,0 +1,57 @@
+import os
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from privates.storages import PrivateMediaFileSystemStorage
+from privates.test import temp_private_root
+
+from drc.utils.storages import ContentAddressedStorage
+from drc.utils.uploadhandlers import PrivateMediaUploadedFile, PrivateMediaUploadHandler
+
+
+@temp_private_root()
+class PrivateMediaUploadHandlerTests(SimpleTestCase):
+    # the content addressed storage locks the name of the file
+    databases = {"default"}
+
+    def _upload(self, data: bytes) -> PrivateMediaUploadedFile:
+        handler = PrivateMediaUploadHandler()
+        handler.new_file("inhoud", "file.txt", "text/plain", len(data))
+        handler.receive_data_chunk(data, 0)
+        uploaded_file = handler.file_complete(len(data))
+        self.addCleanup(uploaded_file.close)
+        return uploaded_file
+
+    def test_upload_spooled_to_private_media(self):
+        uploaded_file = self._upload(b"some data")
+
+        self.assertIsInstance(uploaded_file, PrivateMediaUploadedFile)
+        self.assertTrue(
+            uploaded_file.temporary_file_path().startswith(settings.PRIVATE_MEDIA_ROOT)
+        )
+        self.assertEqual(uploaded_file.read(), b"some data")
+
+    def test_storage_moves_upload(self):
+        uploaded_file = self._upload(b"some data")
+        temp_path = uploaded_file.temporary_file_path()
+        inode = os.stat(temp_path).st_ino
+        storage = PrivateMediaFileSystemStorage()
+
+        name = storage.save("uploads/file.txt", uploaded_file)
+
+        self.assertFalse(os.path.exists(temp_path))
+        self.assertEqual(os.stat(storage.path(name)).st_ino, inode)
+
+    def test_content_addressed_storage_moves_upload(self):
+        uploaded_file = self._upload(b"some data")
+        temp_path = uploaded_file.temporary_file_path()
+        inode = os.stat(temp_path).st_ino
+        storage = ContentAddressedStorage()
+
+        name = storage.save("uploads/file.txt", uploaded_file)
+
+        self.assertFalse(os.path.exists(temp_path))
+        self.assertEqual(os.stat(storage.path(name)).st_ino, inode)
+        with storage.open(name) as stored:
+            self.assertEqual(stored.read(), b"some data")
@@ -83,7 +83,7 @@ class US39TestCase(JWTAuthMixin, APITestCase):
         response = self.client.get(file_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content.decode("utf-8"), "some data")
+        self.assertEqual(response.getvalue().decode("utf-8"), "some data")
 
     def test_list_file(self):
         self.autorisatie.scopes = [SCOPE_DOCUMENTEN_ALLES_LEZEN]
@@ -7,6 +7,7 @@ from django.views.generic.base import TemplateView
 
 from vng_api_common.views import ViewConfigView
 
+from .utils.views import metrics
 from .views import HTTP413View, HTTP500View
 
 handler500 = "drc.utils.views.server_error"
@@ -20,6 +21,7 @@ urlpatterns = [
     # Simply show the index template.
     path("", TemplateView.as_view(template_name="index.html")),
     path("view-config/", ViewConfigView.as_view(), name="view-config"),
+    path("metrics", metrics, name="metrics"),
     path("ref/", include("vng_api_common.urls")),
     path("ref/", include("notifications_api_common.urls")),
 ]
@@ -0,0 +1,99 @@
+"""
+Admin utilities for the large tables of the API.
+"""
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Return the number of rows of the table according to the planner statistics.
+
+    The estimate is updated by ``VACUUM`` and ``ANALYZE``, -1 indicates the
+    table was never analyzed.
+    """
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        (estimate,) = cursor.fetchone()
+    return estimate
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Estimate the number of objects of large tables instead of counting them.
+
+    An exact ``COUNT(*)`` scans the whole table. If the changelist isn't
+    filtered and the table has at least ``estimate_threshold`` rows, the
+    estimate of the planner statistics is used instead.
+    """
+
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, QuerySet) and not self.object_list.query.where:
+            estimate = get_estimated_count(self.object_list)
+            if estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+
+class AutocompleteFilter(admin.FieldListFilter):
+    """
+    Filter on a related object, selected with an autocomplete widget.
+
+    Unlike the default filter of relations, the related objects aren't all
+    listed. The admin of the related model must define ``search_fields``, and
+    the admin using the filter must include the :class:`AutocompleteFilterMixin`.
+    """
+
+    template = "admin/autocomplete_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = f"{field_path}__{field.target_field.name}__exact"
+        self.lookup_val = params.get(self.lookup_kwarg)
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+        form_field = forms.ModelChoiceField(
+            queryset=field.remote_field.model._default_manager.all(),
+            widget=AutocompleteSelect(field, model_admin.admin_site),
+        )
+        self.rendered_widget = form_field.widget.render(
+            self.lookup_kwarg,
+            self.lookup_val,
+            attrs={"id": f"id_filter_{field_path}", "data-width": "100%"},
+        )
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg]
+
+    def has_output(self) -> bool:
+        return True
+
+    def choices(self, changelist):
+        yield {"query_string": changelist.get_query_string(remove=[self.lookup_kwarg])}
+
+
+class AutocompleteFilterMixin:
+    """
+    Include the scripts of the :class:`AutocompleteFilter` in the changelist.
+    """
+
+    @property
+    def media(self):
+        widget = AutocompleteSelect(None, self.admin_site)
+        return (
+            super().media
+            + widget.media
+            + forms.Media(
+                js=("admin/js/jquery.init.js", "js/autocomplete_filter.js"),
+            )
+        )
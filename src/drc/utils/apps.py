@@ -6,3 +6,6 @@ class UtilsConfig(AppConfig):
 
     def ready(self):
         from . import checks  # noqa
+        from .performance import install_hooks
+
+        install_hooks()
@@ -1,5 +1,22 @@
-from django.core.checks import Error, register
+import importlib.util
+import os
+
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
 from django.forms import ModelForm
+from django.urls import Resolver404, resolve
+
+# cache backends which aren't shared by the processes of the application
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# backends which read the files in the application
+PYTHON_SENDFILE_BACKENDS = (
+    "sendfile.backends.simple",
+    "sendfile.backends.development",
+)
 
 
 def get_subclasses(cls):
@@ -40,3 +57,172 @@ def check_modelform_exclude(app_configs, **kwargs):
         )
 
     return errors
+
+
+@register(Tags.security)
+def check_sendfile(app_configs, **kwargs):
+    """
+    Check that the files are sent from the internal private media location.
+
+    The proxy sends the files from ``SENDFILE_URL``, which maps to
+    ``SENDFILE_ROOT`` - so these must point to the private media. Django itself
+    must not serve this location, or the private media would be public.
+    """
+    errors = []
+
+    if os.path.realpath(settings.SENDFILE_ROOT) != os.path.realpath(
+        settings.PRIVATE_MEDIA_ROOT
+    ):
+        errors.append(
+            Error(
+                "SENDFILE_ROOT is not the PRIVATE_MEDIA_ROOT",
+                hint="Set SENDFILE_ROOT to PRIVATE_MEDIA_ROOT",
+                id="utils.E002",
+            )
+        )
+
+    url = settings.SENDFILE_URL or ""
+    if not url.startswith("/"):
+        errors.append(
+            Error(
+                "SENDFILE_URL must be an absolute path, got %r" % url,
+                hint="Use the path of the internal location of the proxy, "
+                "e.g. '/private-media/'",
+                id="utils.E003",
+            )
+        )
+    else:
+        try:
+            resolve(f"{url.rstrip('/')}/check")
+        except Resolver404:
+            pass
+        else:
+            errors.append(
+                Error(
+                    "SENDFILE_URL %r is served by the application, which makes "
+                    "the private media public" % url,
+                    hint="Use a path which is only known to the proxy, marked "
+                    "as 'internal' in nginx",
+                    id="utils.E004",
+                )
+            )
+
+    return errors
+
+
+@register(Tags.security)
+def check_sendfile_proxy(app_configs, **kwargs):
+    from .sendfile import BACKENDS
+
+    proxy = settings.SENDFILE_PROXY
+    if not proxy or proxy.lower() in BACKENDS:
+        return []
+
+    return [
+        Error(
+            "SENDFILE_PROXY %r is not supported" % proxy,
+            hint="Use 'X-Accel-Redirect' for nginx, 'X-Sendfile' for Apache or "
+            "leave it empty",
+            id="utils.E007",
+        )
+    ]
+
+
+@register(Tags.security, deploy=True)
+def check_sendfile_backend(app_configs, **kwargs):
+    if settings.SENDFILE_BACKEND in PYTHON_SENDFILE_BACKENDS:
+        return [
+            Warning(
+                "SENDFILE_BACKEND %r sends the files through the Python workers"
+                % settings.SENDFILE_BACKEND,
+                hint="Use 'drc.utils.sendfile' to offload the downloads to the "
+                "proxy",
+                id="utils.W001",
+            )
+        ]
+
+    if (
+        not settings.DEBUG
+        and not settings.SENDFILE_PROXY
+        and not settings.SENDFILE_TRUST_PROXY_HEADER
+    ):
+        return [
+            Warning(
+                "SENDFILE_PROXY is empty, so the files are sent through the "
+                "Python workers",
+                hint="Set SENDFILE_PROXY to 'X-Accel-Redirect' for nginx or "
+                "'X-Sendfile' for Apache",
+                id="utils.W002",
+            )
+        ]
+
+    return []
+
+
+@register()
+def check_inhoud_compression(app_configs, **kwargs):
+    """
+    Check that the content can be compressed with the ``INHOUD_COMPRESSION``.
+    """
+    from .compression import SUFFIXES
+
+    encoding = settings.INHOUD_COMPRESSION
+    if not encoding:
+        return []
+
+    if encoding not in SUFFIXES:
+        return [
+            Error(
+                "INHOUD_COMPRESSION %r is not supported" % encoding,
+                hint="Use 'gzip', 'zstd' or leave it empty",
+                id="utils.E008",
+            )
+        ]
+
+    if encoding == "zstd" and importlib.util.find_spec("zstandard") is None:
+        return [
+            Error(
+                "INHOUD_COMPRESSION 'zstd' requires zstandard, which isn't installed",
+                hint="Install zstandard, or use 'gzip'",
+                id="utils.E009",
+            )
+        ]
+
+    return []
+
+
+@register(Tags.caches, Tags.database)
+def check_replica_cache(app_configs, **kwargs):
+    """
+    Check that the clients reading from the primary are tracked in a shared cache.
+
+    The write and the next reads of a client are handled by different
+    processes, which must all know that the client reads from the primary -
+    otherwise the client doesn't read its own writes.
+    """
+    if not settings.DB_REPLICAS:
+        return []
+
+    alias = settings.DB_REPLICA_CACHE
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend is None:
+        return [
+            Error(
+                "DB_REPLICA_CACHE %r is not a configured cache" % alias,
+                hint="Add the cache to CACHES",
+                id="utils.E005",
+            )
+        ]
+
+    if backend in LOCAL_CACHE_BACKENDS:
+        return [
+            Error(
+                "DB_REPLICA_CACHE %r uses %s, which isn't shared by the processes"
+                % (alias, backend),
+                hint="Use a shared cache for the read replicas, such as Redis or "
+                "the DatabaseCache",
+                id="utils.E006",
+            )
+        ]
+
+    return []
@@ -0,0 +1,158 @@
+"""
+At-rest compression of the content of the documents.
+
+The encoding of compressed content is stored in ``inhoud_encoding`` of the
+document, the name of the file (which clients control via the
+``bestandsnaam``) is never used to decide how it's read. Compressed files get
+the suffix of the encoding (``.gz`` or ``.zst``). The ``bestandsomvang`` of a
+document is the size of the uncompressed content.
+"""
+import gzip
+import os
+import zlib
+from typing import Iterator
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+
+from drc.utils.uploadhandlers import PrivateMediaUploadedFile
+
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# formats which are usually not compressed themselves
+COMPRESSIBLE_MEDIA_TYPES = (
+    "text/",
+    "application/json",
+    "application/xml",
+    "application/pdf",
+    "image/tiff",
+    "image/bmp",
+)
+COMPRESSIBLE_EXTENSIONS = (
+    ".txt",
+    ".csv",
+    ".json",
+    ".xml",
+    ".html",
+    ".pdf",
+    ".tif",
+    ".tiff",
+    ".bmp",
+)
+
+# the number of bytes compressed to estimate the compression ratio
+SAMPLE_SIZE = 2**16
+
+
+def _get_zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            "Install zstandard to compress the content with zstd."
+        ) from exc
+    return zstandard
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """
+    Indicate if the ``Accept-Encoding`` header value accepts the ``encoding``.
+
+    The header is a list of codings with optional quality values, a coding
+    with ``q=0`` is not acceptable.
+    """
+    aliases = {encoding, "x-gzip"} if encoding == "gzip" else {encoding}
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+
+    for coding in aliases:
+        if coding in accepted:
+            return accepted[coding] > 0
+    return accepted.get("*", 0) > 0
+
+
+def is_compressible(formaat: str, bestandsnaam: str) -> bool:
+    _, ext = os.path.splitext(bestandsnaam or "")
+    return (formaat or "").lower().startswith(COMPRESSIBLE_MEDIA_TYPES) or (
+        ext.lower() in COMPRESSIBLE_EXTENSIONS
+    )
+
+
+def _compress_sample(data: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return _get_zstandard().ZstdCompressor().compress(data)
+    return zlib.compress(data)
+
+
+def should_compress(file: File, formaat: str, bestandsnaam: str) -> bool:
+    """
+    Decide if the content is stored compressed.
+
+    Only the formats which are usually compressible are considered, and only if
+    a sample of the content compresses well enough.
+    """
+    encoding = settings.INHOUD_COMPRESSION
+    if not encoding or not file.size or not is_compressible(formaat, bestandsnaam):
+        return False
+
+    file.seek(0)
+    sample = file.read(SAMPLE_SIZE)
+    file.seek(0)
+
+    ratio = len(sample) / len(_compress_sample(sample, encoding))
+    return ratio >= settings.INHOUD_COMPRESSION_MIN_RATIO
+
+
+def compress_file(file: File, name: str) -> PrivateMediaUploadedFile:
+    """
+    Compress the file into a temporary file, named after the encoding.
+    """
+    encoding = settings.INHOUD_COMPRESSION
+    compressed = PrivateMediaUploadedFile(
+        f"{name}{SUFFIXES[encoding]}", "application/octet-stream", 0, None
+    )
+
+    file.seek(0)
+    if encoding == "zstd":
+        compressor = _get_zstandard().ZstdCompressor()
+        with compressor.stream_writer(compressed, closefd=False) as output:
+            for chunk in file.chunks():
+                output.write(chunk)
+    else:
+        # without a timestamp, identical content is compressed identically
+        with gzip.GzipFile(fileobj=compressed, mode="wb", mtime=0) as output:
+            for chunk in file.chunks():
+                output.write(chunk)
+
+    compressed.size = compressed.tell()
+    compressed.seek(0)
+    return compressed
+
+
+def iter_decompressed(file, encoding: str) -> Iterator[bytes]:
+    """
+    Stream the uncompressed content of the file.
+    """
+    if encoding == "zstd":
+        decompressed = _get_zstandard().ZstdDecompressor().stream_reader(file)
+    else:
+        decompressed = gzip.GzipFile(fileobj=file, mode="rb")
+
+    try:
+        while chunk := decompressed.read(settings.READ_CHUNK):
+            yield chunk
+    finally:
+        decompressed.close()
+        file.close()
@@ -0,0 +1,116 @@
+"""
+Routing of the read-only API requests to read replicas of the database.
+
+The replicas are configured with ``DB_REPLICA_HOSTS``. The
+:class:`drc.api.mixins.ReadReplicaMixin` selects a replica for the read-only
+actions of a viewset, and the :class:`ReplicaRouter` sends all reads in the
+action to it. Writes always go to the primary (``default``) database.
+
+A replica is only used if it's reachable and its replication lag is at most
+``DB_REPLICA_MAX_LAG`` seconds, otherwise the reads fall back to the primary.
+After a write, the client reads from the primary for a while. This is tracked
+in the ``DB_REPLICA_CACHE``, which must be shared by all processes.
+"""
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# the replica the reads of the current request are sent to, if any
+current_replica: ContextVar[Optional[str]] = ContextVar("current_replica", default=None)
+
+# the number of seconds the health of a replica is cached for
+CHECK_INTERVAL = 5
+
+# the lag is 0 if all received changes are replayed, since the timestamp of the
+# last replayed transaction doesn't change without writes on the primary
+LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+_health: Dict[str, Tuple[float, bool]] = {}
+
+
+def is_healthy(alias: str) -> bool:
+    """
+    Indicate if the replica is reachable and not lagging behind too much.
+    """
+    checked_at, healthy = _health.get(alias, (0, False))
+    now = time.monotonic()
+    if checked_at and now - checked_at < CHECK_INTERVAL:
+        return healthy
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_QUERY)
+            (lag,) = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Database replica %s is unavailable", alias, exc_info=True)
+        connections[alias].close()
+        healthy = False
+    else:
+        # the lag is NULL if the database isn't replicating
+        healthy = lag is None or lag <= settings.DB_REPLICA_MAX_LAG
+        if not healthy:
+            logger.warning("Database replica %s lags %.1f seconds", alias, lag)
+
+    _health[alias] = (now, healthy)
+    return healthy
+
+
+def get_replica() -> Optional[str]:
+    """
+    Return a healthy replica, or ``None`` to read from the primary.
+    """
+    replicas = [alias for alias in settings.DB_REPLICAS if is_healthy(alias)]
+    return random.choice(replicas) if replicas else None
+
+
+def get_sticky_key(client_id: str) -> str:
+    return f"drc:read-primary:{client_id}"
+
+
+def stick_to_primary(client_id: Optional[str]) -> None:
+    """
+    Read from the primary for a while after a write, so the client reads its writes.
+    """
+    if client_id and settings.DB_REPLICAS:
+        caches[settings.DB_REPLICA_CACHE].set(
+            get_sticky_key(client_id), True, settings.DB_REPLICA_STICKY_SECONDS
+        )
+
+
+def is_sticky(client_id: Optional[str]) -> bool:
+    return bool(client_id) and caches[settings.DB_REPLICA_CACHE].get(
+        get_sticky_key(client_id), False
+    )
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return current_replica.get()
+
+    def db_for_write(self, model, **hints):
+        # objects read from a replica are still saved in the primary
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DB_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DB_REPLICAS:
+            return False
+        return None
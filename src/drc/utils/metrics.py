@@ -0,0 +1,121 @@
+"""
+Prometheus metrics of the API, exposed on ``/metrics``.
+
+The request latency, the bytes of uploads and downloads and the calls to the
+remote APIs are recorded in the process handling them. With multiple uwsgi
+workers, ``PROMETHEUS_MULTIPROC_DIR`` must point to an empty directory shared
+by the workers, so the metrics of all workers are combined. The open uploads
+are counted in the database when the metrics are collected.
+"""
+import os
+from urllib.parse import urlparse
+
+from django.apps import apps
+from django.db.models import Count, Sum
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+request_duration = Histogram(
+    "drc_request_duration_seconds",
+    "Duration of the requests, per view and action.",
+    ["view", "action", "method", "status"],
+)
+upload_bytes = Counter(
+    "drc_upload_bytes",
+    "Bytes received in the request bodies, per view.",
+    ["view"],
+)
+sendfile_bytes = Counter(
+    "drc_sendfile_bytes",
+    "Bytes of content sent, per sendfile backend.",
+    ["backend"],
+)
+outbound_duration = Histogram(
+    "drc_outbound_request_duration_seconds",
+    "Duration of the requests to remote APIs, per host.",
+    ["host"],
+)
+outbound_errors = Counter(
+    "drc_outbound_request_errors",
+    "Failed requests (connection errors and server errors) to remote APIs, per host.",
+    ["host"],
+)
+
+
+def observe_request(request, response, view: str, action: str, duration: float):
+    request_duration.labels(
+        view=view, action=action, method=request.method, status=response.status_code
+    ).observe(duration)
+
+    # the header is supplied by the client
+    try:
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > 0:
+        upload_bytes.labels(view=view).inc(content_length)
+
+
+def observe_outbound_request(url: str, duration: float, response=None) -> None:
+    host = urlparse(url).netloc
+    outbound_duration.labels(host=host).observe(duration)
+    if response is None or response.status_code >= 500:
+        outbound_errors.labels(host=host).inc()
+
+
+class UploadsCollector:
+    """
+    Count the uploads in bestandsdelen in progress.
+    """
+
+    def collect(self):
+        BestandsDeel = apps.get_model("datamodel", "BestandsDeel")
+        uploads = (
+            BestandsDeel.objects.filter(inhoud="")
+            .exclude(informatieobject__lock="")
+            .aggregate(
+                uploads=Count("informatieobject", distinct=True),
+                parts=Count("pk"),
+                size=Sum("omvang"),
+            )
+        )
+
+        yield GaugeMetricFamily(
+            "drc_open_uploads",
+            "Documents of which the upload in bestandsdelen is not complete.",
+            value=uploads["uploads"],
+        )
+        yield GaugeMetricFamily(
+            "drc_open_upload_bestandsdelen",
+            "Bestandsdelen which are not uploaded yet.",
+            value=uploads["parts"],
+        )
+        yield GaugeMetricFamily(
+            "drc_open_upload_bytes",
+            "Size of the bestandsdelen which are not uploaded yet.",
+            value=uploads["size"] or 0,
+        )
+
+
+database_registry = CollectorRegistry(auto_describe=False)
+database_registry.register(UploadsCollector())
+
+
+def get_metrics() -> bytes:
+    """
+    Return the metrics in the Prometheus text format.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry) + generate_latest(database_registry)
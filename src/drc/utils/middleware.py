@@ -1,8 +1,16 @@
 import logging
+import random
+from contextlib import ExitStack
 
+from django.conf import settings
+from django.db import connections
 from django.http import HttpRequest
 
+from .metrics import observe_request
+from .performance import RequestMetrics, current_metrics, record_query
+
 logger = logging.getLogger(__name__)
+performance_logger = logging.getLogger("drc.performance")
 
 
 class LogHeadersMiddleware:
@@ -15,3 +23,62 @@ class LogHeadersMiddleware:
 
     def log(self, request: HttpRequest):
         logger.debug("Request headers for %s: %r", request.path, request.headers)
+
+
+class PerformanceMiddleware:
+    """
+    Write the performance metrics of the requests to the ``performance`` log,
+    and record their duration in the Prometheus metrics.
+
+    A fraction ``PERFORMANCE_LOG_SAMPLE_RATE`` of the requests is logged, and
+    every request slower than ``PERFORMANCE_LOG_SLOW_THRESHOLD`` milliseconds.
+    Streaming responses are logged when they are closed, so the metrics include
+    sending the content.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        current_metrics.set(metrics)
+
+        # record the queries until the (streaming) response is sent
+        wrappers = ExitStack()
+        for connection in connections.all():
+            wrappers.enter_context(connection.execute_wrapper(record_query))
+
+        def finish():
+            wrappers.close()
+            observe_request(
+                request, response, metrics.view, metrics.action, metrics.duration
+            )
+            self.log(request, response, metrics)
+
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            wrappers.close()
+            current_metrics.set(None)
+            raise
+
+        if response.streaming:
+            response._resource_closers.append(finish)
+        else:
+            finish()
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if metrics := current_metrics.get():
+            metrics.view = request.resolver_match.view_name
+            # the action of viewsets
+            actions = getattr(view_func, "actions", None) or {}
+            metrics.action = actions.get(request.method.lower(), "")
+
+    def log(self, request, response, metrics: RequestMetrics) -> None:
+        current_metrics.set(None)
+
+        threshold = settings.PERFORMANCE_LOG_SLOW_THRESHOLD
+        is_slow = threshold and metrics.duration * 1000 >= threshold
+        if is_slow or random.random() < settings.PERFORMANCE_LOG_SAMPLE_RATE:
+            performance_logger.info(metrics.as_record(request, response))
@@ -0,0 +1,159 @@
+"""
+Performance metrics of the requests, written to the ``performance`` log.
+
+The :class:`drc.utils.middleware.PerformanceMiddleware` collects the metrics of
+each request in a :class:`RequestMetrics`: the database queries, the calls to
+remote APIs per host and the bytes read from and written to the storages. The
+hooks installed by :func:`install_hooks` only record anything during a request.
+"""
+import json
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from django.core.files.storage import FileSystemStorage, Storage
+
+import requests
+
+from .metrics import observe_outbound_request
+
+current_metrics: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "current_metrics", default=None
+)
+
+
+@dataclass
+class RequestMetrics:
+    start: float = field(default_factory=time.perf_counter)
+    view: str = ""
+    action: str = ""
+    queries: int = 0
+    query_time: float = 0
+    http: Dict[str, dict] = field(default_factory=dict)
+    storage_read: int = 0
+    storage_written: int = 0
+
+    @property
+    def duration(self) -> float:
+        return time.perf_counter() - self.start
+
+    def add_http_call(self, url: str, duration: float) -> None:
+        host = urlparse(url).netloc
+        stats = self.http.setdefault(host, {"calls": 0, "time_ms": 0})
+        stats["calls"] += 1
+        stats["time_ms"] += duration * 1000
+
+    def as_record(self, request, response) -> str:
+        return json.dumps(
+            {
+                "method": request.method,
+                "path": request.path,
+                "view": self.view,
+                "action": self.action,
+                "status": response.status_code,
+                "duration_ms": round(self.duration * 1000, 1),
+                "db": {
+                    "queries": self.queries,
+                    "time_ms": round(self.query_time * 1000, 1),
+                },
+                "http": {
+                    host: {
+                        "calls": stats["calls"],
+                        "time_ms": round(stats["time_ms"], 1),
+                    }
+                    for host, stats in self.http.items()
+                },
+                "storage": {
+                    "read": self.storage_read,
+                    "written": self.storage_written,
+                },
+            },
+            sort_keys=True,
+        )
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper recording the number and duration of the queries.
+    """
+    metrics = current_metrics.get()
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.queries += 1
+            metrics.query_time += time.perf_counter() - start
+
+
+def add_storage_read(size: int) -> None:
+    if metrics := current_metrics.get():
+        metrics.storage_read += size
+
+
+class CountingReader:
+    """
+    Proxy a file object, recording the bytes read in the current request.
+    """
+
+    def __init__(self, file):
+        self._file = file
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        for line in self._file:
+            add_storage_read(len(line))
+            yield line
+
+    def read(self, *args, **kwargs):
+        data = self._file.read(*args, **kwargs)
+        add_storage_read(len(data))
+        return data
+
+
+def install_hooks() -> None:
+    """
+    Record the remote API calls and the storage access in the current request.
+    """
+    if getattr(requests.Session.send, "_records_metrics", False):
+        return
+
+    session_send = requests.Session.send
+    storage_open = Storage.open
+    storage_save = Storage.save
+
+    def send(self, request, **kwargs):
+        metrics = current_metrics.get()
+        start = time.perf_counter()
+        response = None
+        try:
+            response = session_send(self, request, **kwargs)
+            return response
+        finally:
+            duration = time.perf_counter() - start
+            observe_outbound_request(request.url, duration, response)
+            if metrics is not None:
+                metrics.add_http_call(request.url, duration)
+
+    def open(self, name, mode="rb"):
+        file = storage_open(self, name, mode)
+        # remote files are downloaded on access, so only local files are wrapped
+        local = isinstance(self, FileSystemStorage)
+        if local and "r" in mode and current_metrics.get() is not None:
+            file.file = CountingReader(file.file)
+        return file
+
+    def save(self, name, content, max_length=None):
+        name = storage_save(self, name, content, max_length=max_length)
+        if metrics := current_metrics.get():
+            metrics.storage_written += content.size or 0
+        return name
+
+    send._records_metrics = True
+    requests.Session.send = send
+    Storage.open = open
+    Storage.save = save
@@ -0,0 +1,87 @@
+"""
+Storage of the document content in an S3-compatible object store.
+
+Built on the storage of ``django-storages[boto3]``, configured with its
+``AWS_*`` settings; point ``AWS_S3_ENDPOINT_URL`` to e.g. a MinIO server to use
+another object store than AWS S3.
+"""
+from typing import List
+
+from django.conf import settings
+
+from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+# the minimal size of all but the last part of a multipart upload
+MIN_PART_SIZE = 5 * 2**20
+
+
+class S3Storage(S3Boto3Storage):
+    """
+    Store the files in an S3-compatible bucket.
+
+    The bestandsdelen of a large upload are merged by the object store itself,
+    and downloads can be redirected to a presigned URL of the object, so the
+    content doesn't pass through the web nodes.
+    """
+
+    def compose(self, names: List[str], name: str) -> str:
+        """
+        Concatenate the files ``names`` into a new file, server-side.
+
+        The files are copied as the parts of a multipart upload. Return the
+        name of the new file.
+        """
+        # every part except the last one must be large enough
+        if len(names) > 1 and settings.CHUNK_SIZE < MIN_PART_SIZE:
+            raise NotImplementedError(
+                "The parts are too small to be composed by the object store."
+            )
+
+        name = self.get_available_name(name)
+        key = self._normalize_name(clean_name(name))
+        client = self.connection.meta.client
+
+        upload = client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, **self.get_object_parameters(name)
+        )
+        try:
+            parts = []
+            for number, source in enumerate(names, start=1):
+                source_key = self._normalize_name(clean_name(source))
+                response = client.upload_part_copy(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload["UploadId"],
+                    PartNumber=number,
+                    CopySource={"Bucket": self.bucket_name, "Key": source_key},
+                )
+                parts.append(
+                    {"ETag": response["CopyPartResult"]["ETag"], "PartNumber": number}
+                )
+
+            client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload["UploadId"],
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload["UploadId"]
+            )
+            raise
+
+        return clean_name(name)
+
+    def get_download_url(self, name: str, filename: str) -> str:
+        """
+        Return a presigned URL to download the file as an attachment.
+        """
+        return self.url(
+            name,
+            parameters={
+                "ResponseContentDisposition": f'attachment; filename="{filename}"',
+                "ResponseContentType": "application/octet-stream",
+            },
+        )
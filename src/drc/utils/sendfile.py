@@ -0,0 +1,61 @@
+"""
+Sendfile backend offloading downloads to the proxy in front of the application.
+
+``SENDFILE_PROXY`` configures the header the proxy handles: ``X-Accel-Redirect``
+for nginx (the default, see ``nginx/``) or ``X-Sendfile`` for Apache with
+mod_xsendfile. The proxy then sends the file from the internal ``SENDFILE_URL``
+location (or the path, for X-Sendfile). Without a proxy, the file is sent with a
+:class:`django.http.FileResponse`, which uses the ``wsgi.file_wrapper`` of the
+server (uwsgi sends it with the sendfile system call).
+
+If ``SENDFILE_TRUST_PROXY_HEADER`` is set, the proxy may announce the header
+instead with the ``X-Sendfile-Type`` request header, e.g. for nginx::
+
+    proxy_set_header X-Sendfile-Type X-Accel-Redirect;
+
+or for Apache::
+
+    RequestHeader set X-Sendfile-Type X-Sendfile
+
+Only enable this if the proxy always sets (or removes) the header, since a
+client could otherwise request an X-Sendfile response, which reveals the path
+of the file if no proxy handles it.
+"""
+import os
+
+from django.conf import settings
+from django.http import FileResponse
+
+from sendfile.backends import nginx, xsendfile
+
+from .metrics import sendfile_bytes
+from .performance import add_storage_read
+
+BACKENDS = {
+    "x-accel-redirect": nginx.sendfile,
+    "x-sendfile": xsendfile.sendfile,
+}
+
+
+def get_sendfile_type(request) -> str:
+    if settings.SENDFILE_TRUST_PROXY_HEADER and (
+        header := request.headers.get("X-Sendfile-Type")
+    ):
+        return header.lower()
+    return settings.SENDFILE_PROXY.lower()
+
+
+def sendfile(request, filename, **kwargs):
+    sendfile_type = get_sendfile_type(request)
+    if backend := BACKENDS.get(sendfile_type):
+        sendfile_bytes.labels(backend=sendfile_type).inc(os.path.getsize(filename))
+        return backend(request, filename, **kwargs)
+
+    file = open(filename, "rb")
+    size = os.fstat(file.fileno()).st_size
+    add_storage_read(size)
+    sendfile_bytes.labels(backend="wsgi").inc(size)
+    response = FileResponse(file)
+    # only used if the server has no wsgi.file_wrapper
+    response.block_size = settings.READ_CHUNK
+    return response
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import tempfile
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.move import file_move_safe
+from django.db import connections, router, transaction
+from django.utils.module_loading import import_string
+
+from privates.storages import PrivateMediaFileSystemStorage
+
+
+def inhoud_storage():
+    """
+    Return the storage for the content of the informatieobjecten.
+
+    Configured with the ``INHOUD_STORAGE`` setting.
+    """
+    return import_string(settings.INHOUD_STORAGE)()
+
+
+def bestandsdelen_storage():
+    """
+    Return the storage for the bestandsdelen of large uploads.
+
+    Configured with the ``BESTANDSDELEN_STORAGE`` setting.
+    """
+    return import_string(settings.BESTANDSDELEN_STORAGE)()
+
+
+def is_local_storage(storage) -> bool:
+    """
+    Indicate if the files of the storage are accessible on the local filesystem.
+    """
+    try:
+        storage.path("")
+    except NotImplementedError:
+        return False
+    return True
+
+
+class ContentAddressedStorage(PrivateMediaFileSystemStorage):
+    """
+    Store files in the private media folder under the SHA-256 hash of their content.
+
+    Identical content is stored only once: saving it again costs one pass over
+    the content to calculate the hash, and no disk space. The name passed to
+    :meth:`save` is ignored.
+
+    Since a file can be referenced by multiple versions and documents, it's
+    only deleted if it isn't referenced by any informatieobject anymore.
+
+    Saving and deleting the same file are serialized by a Postgres advisory
+    lock on its name, held until the end of the transaction. A save in the
+    transaction which creates the referencing informatieobject therefore
+    prevents a concurrent delete from removing the file before the reference
+    is committed. The API saves the content in such transactions.
+    """
+
+    prefix = "sha256"
+
+    def get_hashed_name(self, digest: str) -> str:
+        return f"{self.prefix}/{digest[:2]}/{digest[2:4]}/{digest}"
+
+    def get_available_name(self, name, max_length=None):
+        # the name is derived from the content, and is never made unique
+        return name
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+
+        name = self.get_hashed_name(digest.hexdigest())
+        with transaction.atomic(using=self.db):
+            self.lock(name)
+            if self.exists(name):
+                return name
+            return self._write(name, content)
+
+    def _write(self, name, content):
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+
+        # publish a complete file with a rename, so concurrent saves of the same
+        # content never expose a partially written file
+        if hasattr(content, "temporary_file_path"):
+            tmp_path = content.temporary_file_path()
+        else:
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(fd, "wb") as tmp_file:
+                for chunk in content.chunks():
+                    tmp_file.write(chunk)
+
+        file_move_safe(tmp_path, full_path, allow_overwrite=True)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+
+        return name
+
+    @property
+    def db(self) -> str:
+        EnkelvoudigInformatieObject = apps.get_model(
+            "datamodel", "EnkelvoudigInformatieObject"
+        )
+        return router.db_for_write(EnkelvoudigInformatieObject)
+
+    def lock(self, name: str) -> None:
+        """
+        Lock the name until the end of the transaction.
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [name])
+
+    def get_references(self, name: str) -> int:
+        EnkelvoudigInformatieObject = apps.get_model(
+            "datamodel", "EnkelvoudigInformatieObject"
+        )
+        return (
+            EnkelvoudigInformatieObject.objects.using(self.db)
+            .filter(inhoud=name)
+            .count()
+        )
+
+    def delete(self, name):
+        with transaction.atomic(using=self.db):
+            self.lock(name)
+            if self.get_references(name):
+                return
+            super().delete(name)
@@ -0,0 +1,59 @@
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+# relative to the PRIVATE_MEDIA_ROOT
+UPLOAD_TEMP_DIR = ".upload-tmp"
+
+
+def get_upload_temp_dir() -> str:
+    """
+    Return the directory for temporary upload files, creating it if needed.
+
+    Unless ``FILE_UPLOAD_TEMP_DIR`` is configured, this is a directory inside
+    the ``PRIVATE_MEDIA_ROOT``, so the storage can move a finished upload to
+    its final location with a rename instead of a copy.
+    """
+    temp_dir = settings.FILE_UPLOAD_TEMP_DIR or os.path.join(
+        settings.PRIVATE_MEDIA_ROOT, UPLOAD_TEMP_DIR
+    )
+    os.makedirs(temp_dir, exist_ok=True)
+    return temp_dir
+
+
+class PrivateMediaUploadedFile(TemporaryUploadedFile):
+    """
+    A :class:`TemporaryUploadedFile` on the filesystem of the private media.
+    """
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        _, ext = os.path.splitext(name)
+        file = tempfile.NamedTemporaryFile(
+            suffix=".upload" + ext, dir=get_upload_temp_dir()
+        )
+        UploadedFile.__init__(
+            self, file, name, content_type, size, charset, content_type_extra
+        )
+
+
+class PrivateMediaUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream uploads to a temporary file on the filesystem of the private media.
+
+    Django's :class:`TemporaryFileUploadHandler` uses the system temporary
+    directory, which is often a (small) tmpfs, and the storage has to copy the
+    file from there. Uploads spooled next to their final location are published
+    with an atomic rename.
+    """
+
+    def new_file(self, *args, **kwargs):
+        FileUploadHandler.new_file(self, *args, **kwargs)
+        self.file = PrivateMediaUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
+        )
@@ -1,8 +1,14 @@
 from django import http
+from django.conf import settings
 from django.template import TemplateDoesNotExist, loader
+from django.utils.crypto import constant_time_compare
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
 
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from .metrics import get_metrics
+
 
 @requires_csrf_token
 def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
@@ -23,3 +29,22 @@ def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
         )
     context = {"request": request}
     return http.HttpResponseServerError(template.render(context))
+
+
+def metrics(request):
+    """
+    Expose the metrics in the Prometheus text format.
+
+    The metrics are only served to scrapes with the ``METRICS_TOKEN`` as bearer
+    token, the endpoint doesn't exist without the setting.
+    """
+    if not settings.METRICS_TOKEN:
+        raise http.Http404
+
+    authorization = request.headers.get("Authorization", "")
+    if not constant_time_compare(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+        response = http.HttpResponse(status=401)
+        response["WWW-Authenticate"] = "Bearer"
+        return response
+
+    return http.HttpResponse(get_metrics(), content_type=CONTENT_TYPE_LATEST)
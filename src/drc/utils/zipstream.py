@@ -0,0 +1,71 @@
+"""
+Stream ZIP archives without buffering the archive or its files.
+
+:class:`zipfile.ZipFile` supports writing to a non-seekable output, in which
+case the sizes and checksums of each entry follow its data (in a data
+descriptor). The output collects what's written, and is emptied after every
+chunk, so memory use is bounded by the chunk size.
+"""
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+EPOCH = datetime(1980, 1, 1)
+
+
+class _Output:
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+@dataclass
+class ZipEntry:
+    name: str
+    modified: datetime
+    content: Iterable[bytes]
+    size: Optional[int] = None
+    compress: bool = True
+
+
+def iter_zip(entries: Iterable[ZipEntry]) -> Iterator[bytes]:
+    """
+    Generate the ZIP archive of the entries.
+
+    Entries with ``compress`` set are deflated, the others are stored as-is.
+    The content of an entry is only consumed once the archive reaches it.
+    """
+    output = _Output()
+    with zipfile.ZipFile(output, mode="w") as archive:
+        for entry in entries:
+            # the ZIP format can't represent moments before 1980
+            modified = max(entry.modified, EPOCH)
+            info = zipfile.ZipInfo(entry.name, date_time=modified.timetuple()[:6])
+            info.compress_type = (
+                zipfile.ZIP_DEFLATED if entry.compress else zipfile.ZIP_STORED
+            )
+            # without the size up front, the entry needs room for a 64 bit size
+            force_zip64 = entry.size is None or entry.size >= zipfile.ZIP64_LIMIT
+
+            with archive.open(info, mode="w", force_zip64=force_zip64) as file:
+                for chunk in entry.content:
+                    file.write(chunk)
+                    if data := output.pop():
+                        yield data
+
+            if data := output.pop():
+                yield data
+
+    yield output.pop()